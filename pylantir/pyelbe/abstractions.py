@@ -29,14 +29,6 @@ class ReferencePoint:
         Post initialization of reference point
 
         """
-        self.namedtuple = namedtuple(
-            self.name,
-            [
-                "x_coord",
-                "y_coord",
-                "z_coord",
-            ],
-        )
         self.namedtuple = (
             self.x_coord,
             self.y_coord,
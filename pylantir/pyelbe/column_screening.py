@@ -0,0 +1,267 @@
+r"""column buckling and crippling screening of profiles
+
+Allowable compression stress of columns with the Johnson parabola up to the transition
+slenderness and Euler beyond it, the crippling stress of the profile being the apex of the
+parabola, i.e. the allowable of the column of zero length:
+
+- :math:`L' / \rho = L / (\sqrt{c} \rho)`, :math:`\rho = \sqrt{I_{min} / A}`
+- Euler: :math:`F_{e} = \pi^{2} E / (L' / \rho)^{2}`
+- Johnson: :math:`F_{j} = F_{cc} - \frac{F_{cc}^{2}}{4 \pi^{2} E} (L' / \rho)^{2}` for
+  :math:`L' / \rho < \pi \sqrt{2 E / F_{cc}}`
+
+All inputs broadcast; column_grid arranges profiles, lengths, end-fixities and materials on
+the axes of a design grid.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import numpy as np
+
+# pylint: disable=C0103
+
+# governing modes, codes are the positions; the Johnson parabola reaches the crippling
+# stress only at zero length, so crippling is not a mode of its own
+MODES = ("johnson", "euler")
+# end-fixity coefficient c of common end conditions, L' = L / sqrt(c)
+END_FIXITY = {"pinned": 1.0, "fixed-pinned": 2.05, "fixed": 4.0, "free-fixed": 0.25}
+# Needham crippling coefficients by number of free edges of the section
+NEEDHAM_COEFFICIENT = {0: 0.366, 1: 0.342, 2: 0.316}
+
+
+def minimum_inertia(Ixg, Iyg, Ixyg=0.0) -> np.ndarray:
+    """
+    Minimum principal moment of inertia
+
+    :param Ixg: moment of inertia around the x-axis through the center of gravity
+    :type Ixg: array-like
+    :param Iyg: moment of inertia around the y-axis through the center of gravity
+    :type Iyg: array-like
+    :param Ixyg: product of inertia in the center of gravity
+    :type Ixyg: array-like
+    :return: minimum principal moment of inertia
+    :rtype: np.ndarray
+    """
+    Ixg = np.asarray(Ixg, dtype=float)
+    Iyg = np.asarray(Iyg, dtype=float)
+    return (Ixg + Iyg) / 2 - np.hypot((Ixg - Iyg) / 2, Ixyg)
+
+
+def needham_crippling(b_prime, thickness, E, fcy, free_edges: int = 2) -> np.ndarray:
+    r"""
+    Crippling stress of formed and extruded sections after Needham, cut off at the
+    compressive yield stress
+
+    :math:`F_{cc} = C_{e} \sqrt{F_{cy} E} / (b' / t)^{0.75}`
+
+    :param b_prime: mean leg width, (a + b) / 2 for an angle
+    :type b_prime: array-like
+    :param thickness: wall thickness
+    :type thickness: array-like
+    :param E: Young's modulus
+    :type E: array-like
+    :param fcy: compressive yield stress
+    :type fcy: array-like
+    :param free_edges: number of free edges, 2 for an angle
+    :type free_edges: int
+    :return: crippling stress
+    :rtype: np.ndarray
+    """
+    coefficient = NEEDHAM_COEFFICIENT[free_edges]
+    crippling = (
+        coefficient
+        * np.sqrt(np.multiply(fcy, E))
+        / np.power(np.divide(b_prime, thickness, dtype=float), 0.75)
+    )
+    return np.minimum(crippling, fcy)
+
+
+@dataclass
+class ColumnAllowables:
+    """
+    Column allowables over a design grid
+
+    :param slenderness: effective slenderness L' / rho
+    :type slenderness: np.ndarray
+    :param crippling_stress: crippling stress, the apex of the Johnson parabola
+    :type crippling_stress: np.ndarray
+    :param euler_stress: Euler buckling stress
+    :type euler_stress: np.ndarray
+    :param allowable_stress: governing allowable stress
+    :type allowable_stress: np.ndarray
+    :param allowable_load: governing allowable load, stress times area
+    :type allowable_load: np.ndarray
+    :param mode: governing mode, index into MODES
+    :type mode: np.ndarray
+    """
+
+    slenderness: np.ndarray
+    crippling_stress: np.ndarray
+    euler_stress: np.ndarray
+    allowable_stress: np.ndarray
+    allowable_load: np.ndarray
+    mode: np.ndarray
+
+    @property
+    def mode_names(self) -> np.ndarray:
+        """governing mode names"""
+        return np.asarray(MODES)[self.mode]
+
+
+def column_allowables(area, I_min, crippling_stress, E, length, fixity=1.0):
+    """
+    Euler-Johnson column allowables, all arguments broadcast against each other
+
+    :param area: area of the profiles
+    :type area: array-like
+    :param I_min: minimum principal moment of inertia of the profiles
+    :type I_min: array-like
+    :param crippling_stress: crippling stress of the profiles
+    :type crippling_stress: array-like
+    :param E: Young's modulus
+    :type E: array-like
+    :param length: column length
+    :type length: array-like
+    :param fixity: end-fixity coefficient c, see END_FIXITY
+    :type fixity: array-like
+    :return: allowables and governing modes
+    :rtype: ColumnAllowables
+    """
+    area = np.asarray(area, dtype=float)
+    E = np.asarray(E, dtype=float)
+    crippling_stress = np.asarray(crippling_stress, dtype=float)
+    radius_of_gyration = np.sqrt(np.divide(I_min, area))
+    slenderness = np.divide(length, np.sqrt(fixity) * radius_of_gyration)
+    with np.errstate(divide="ignore"):
+        euler = np.pi**2 * E / slenderness**2
+    johnson = crippling_stress - (crippling_stress * slenderness) ** 2 / (
+        4 * np.pi**2 * E
+    )
+    transition = np.pi * np.sqrt(2 * E / crippling_stress)
+    is_johnson = slenderness < transition
+    allowable = np.where(is_johnson, johnson, euler)
+    mode = np.where(is_johnson, MODES.index("johnson"), MODES.index("euler"))
+    return ColumnAllowables(
+        slenderness=slenderness,
+        crippling_stress=np.broadcast_to(crippling_stress, allowable.shape),
+        euler_stress=euler,
+        allowable_stress=allowable,
+        allowable_load=allowable * area,
+        mode=mode,
+    )
+
+
+def end_fixity(fixities: Iterable) -> np.ndarray:
+    """
+    End-fixity coefficients from names (see END_FIXITY) or numbers
+
+    :param fixities: end conditions
+    :type fixities: iterable
+    :return: coefficients c
+    :rtype: np.ndarray
+    """
+    return np.array(
+        [END_FIXITY[item] if isinstance(item, str) else item for item in fixities],
+        dtype=float,
+    )
+
+
+def column_grid(profiles: dict, lengths, fixities, materials: dict):
+    """
+    Column allowables of every combination of profiles x lengths x end-fixities x materials
+
+    :param profiles: "area", "I_min" and the profile part of the crippling stress: either
+        "crippling_stress" (independent of the material) or "b_prime" and "thickness" for
+        needham_crippling (with optional "free_edges"), arrays of n_profiles each
+    :type profiles: dict
+    :param lengths: column lengths, (n_lengths,)
+    :type lengths: array-like
+    :param fixities: end-fixity names or coefficients, (n_fixities,)
+    :type fixities: iterable
+    :param materials: "E" and "fcy" arrays of n_materials each
+    :type materials: dict
+    :return: allowables of shape (n_profiles, n_lengths, n_fixities, n_materials)
+    :rtype: ColumnAllowables
+    """
+
+    def axis(values, position):
+        shape = [1, 1, 1, 1]
+        values = np.asarray(values, dtype=float).ravel()
+        shape[position] = values.size
+        return values.reshape(shape)
+
+    E = axis(materials["E"], 3)
+    fcy = axis(materials["fcy"], 3)
+    if "crippling_stress" in profiles:
+        crippling = axis(profiles["crippling_stress"], 0)
+    else:
+        crippling = needham_crippling(
+            axis(profiles["b_prime"], 0),
+            axis(profiles["thickness"], 0),
+            E,
+            fcy,
+            profiles.get("free_edges", 2),
+        )
+    return column_allowables(
+        axis(profiles["area"], 0),
+        axis(profiles["I_min"], 0),
+        crippling,
+        E,
+        axis(lengths, 1),
+        axis(end_fixity(fixities), 2),
+    )
+
+
+def material_arrays(materials: Iterable, fcy) -> dict:
+    """
+    Material arrays for column_grid from matreel materials; matreel carries no allowables,
+    so the compressive yield stresses are given alongside
+
+    :param materials: IsoMaterial (E) or OrthoMaterial (E1) objects
+    :type materials: iterable
+    :param fcy: compressive yield stress of every material
+    :type fcy: array-like
+    :return: "E" and "fcy" arrays
+    :rtype: dict
+    """
+    E = [getattr(item, "E", None) or item.E1 for item in materials]
+    fcy = np.asarray(fcy, dtype=float).ravel()
+    if len(E) != fcy.size:
+        raise ValueError(
+            f"expected {len(E)} compressive yield stresses, got {fcy.size}"
+        )
+    return {"E": np.asarray(E, dtype=float), "fcy": fcy}
+
+
+def profile_arrays(profiles: Iterable) -> dict:
+    """
+    Profile arrays for column_grid from profile objects; LProfiles get the Needham crippling
+    parameters of an angle, plain Profiles need "crippling_stress" added
+
+    :param profiles: Profile, ProfileBuilder or LProfile objects
+    :type profiles: iterable
+    :return: "area", "I_min" (and "b_prime", "thickness") arrays
+    :rtype: dict
+    """
+    profiles = list(profiles)
+    sections = [getattr(item, "profile", item) for item in profiles]
+    for item in sections:
+        if not hasattr(item, "Ixyg"):
+            raise TypeError(
+                f"{type(item).__name__} has no product of inertia Ixyg, "
+                "the minimum inertia cannot be determined"
+            )
+    arrays = {
+        "area": np.array([item.area for item in sections], dtype=float),
+        "I_min": minimum_inertia(
+            [item.Ixg for item in sections],
+            [item.Iyg for item in sections],
+            [item.Ixyg for item in sections],
+        ),
+    }
+    if all(hasattr(item, "t_fx") for item in profiles):
+        arrays["b_prime"] = np.array([(item.b + item.h) / 2 for item in profiles])
+        arrays["thickness"] = np.array(
+            [(item.t_fx + item.t_fy) / 2 for item in profiles], dtype=float
+        )
+    return arrays
@@ -271,3 +271,312 @@ class FastenerGroup:
             dataframe["Material"] = [fastener.material for fastener in self.fasteners]
 
         return dataframe
+
+
+@dataclass
+class SNCurve:
+    r"""
+    S-N curve of a fastener (or one per fastener, all parameters broadcast over fasteners)
+
+    :math:`N = N_{ref} \cdot (S_{ref} / S_{a,eq})^{m}`, with the Goodman mean correction
+    :math:`S_{a,eq} = S_{a} / (1 - S_{m} / S_{u})` for tensile means when ultimate is given.
+    Amplitudes below the endurance amplitude do not damage.
+
+    :param slope: slope m of the curve
+    :type slope: float, np.ndarray
+    :param reference_amplitude: amplitude S_ref at the reference number of cycles
+    :type reference_amplitude: float, np.ndarray
+    :param reference_cycles: reference number of cycles N_ref
+    :type reference_cycles: float, np.ndarray
+    :param endurance_amplitude: endurance limit amplitude
+    :type endurance_amplitude: float, np.ndarray
+    :param ultimate: ultimate load S_u for the mean correction, None for no correction
+    :type ultimate: float, np.ndarray
+    """
+
+    slope: float
+    reference_amplitude: float
+    reference_cycles: float = 1e7
+    endurance_amplitude: float = 0.0
+    ultimate: float = None
+
+    def _parameter(self, value, index):
+        """parameter of the fasteners at index (all if None)"""
+        value = np.asarray(value, dtype=float)
+        if index is None or value.ndim == 0:
+            return value
+        return value[index]
+
+    def cycles_to_failure(self, amplitude, mean=0.0, index=None) -> np.ndarray:
+        """
+        Number of cycles to failure
+
+        :param amplitude: cycle amplitudes
+        :type amplitude: np.ndarray
+        :param mean: cycle means
+        :type mean: np.ndarray
+        :param index: fasteners of the cycles, when the curve parameters are per fastener
+        :type index: np.ndarray
+        :return: cycles to failure, inf below the endurance limit
+        :rtype: np.ndarray
+        """
+        amplitude = np.abs(np.asarray(amplitude, dtype=float))
+        if self.ultimate is not None:
+            ratio = np.clip(
+                np.asarray(mean, dtype=float) / self._parameter(self.ultimate, index),
+                0.0,
+                None,
+            )
+            with np.errstate(divide="ignore"):
+                amplitude = np.where(ratio < 1, amplitude / (1 - ratio), np.inf)
+        with np.errstate(divide="ignore"):
+            cycles = self._parameter(self.reference_cycles, index) * (
+                self._parameter(self.reference_amplitude, index) / amplitude
+            ) ** self._parameter(self.slope, index)
+        return np.where(
+            amplitude > self._parameter(self.endurance_amplitude, index), cycles, np.inf
+        )
+
+    def damage(self, amplitude, mean=0.0, count=1.0, index=None) -> np.ndarray:
+        """
+        Miner damage of cycles, count / N
+
+        :param amplitude: cycle amplitudes
+        :type amplitude: np.ndarray
+        :param mean: cycle means
+        :type mean: np.ndarray
+        :param count: number of cycles, 0.5 for half cycles
+        :type count: float, np.ndarray
+        :param index: fasteners of the cycles, when the curve parameters are per fastener
+        :type index: np.ndarray
+        :return: damage of every cycle
+        :rtype: np.ndarray
+        """
+        return count / self.cycles_to_failure(amplitude, mean, index)
+
+
+# offsets of the four top points of a stack from its top
+_FOUR_POINTS = np.arange(-4, 0)
+
+
+# pylint: disable=too-many-instance-attributes
+class RainflowDamage:
+    """
+    Streaming rainflow count (four point method) and Miner damage of many fasteners at once.
+
+    Force histories are fed chunk by chunk, (T, n_fasteners) per chunk. Every fastener keeps
+    its own residue stack of turning points, at most max_depth deep; closed cycles are taken
+    out of the stack and their damage is accumulated immediately. If a stack is full, its
+    oldest range is counted as a half cycle. The remaining residue is counted as half cycles
+    by total_damage().
+
+    :param n_fasteners: number of fasteners (columns of the histories)
+    :type n_fasteners: int
+    :param sn_curve: S-N curve, scalar or per fastener parameters
+    :type sn_curve: SNCurve
+    :param max_depth: maximum depth of the residue stacks
+    :type max_depth: int
+    """
+
+    def __init__(self, n_fasteners: int, sn_curve: SNCurve, max_depth: int = 256):
+        self.n_fasteners = n_fasteners
+        self.sn_curve = sn_curve
+        self.max_depth = max(max_depth, 4)
+        # stacks of all fasteners in one flat array, fastener i at i * max_depth
+        self.stack = np.zeros(n_fasteners * self.max_depth)
+        self.depth = np.zeros(n_fasteners, dtype=np.int64)
+        self.previous = np.zeros(n_fasteners)
+        self.trend = np.zeros(n_fasteners, dtype=np.int8)
+        self.damage = np.zeros(n_fasteners)
+        self.cycles = np.zeros(n_fasteners)
+        self.n_samples = 0
+        # closed cycles of the current chunk: (fastener, first point, second point, count)
+        self._closed = []
+
+    @property
+    def stacks(self) -> np.ndarray:
+        """residue stacks, (n_fasteners, max_depth), valid up to depth"""
+        return self.stack.reshape(self.n_fasteners, self.max_depth)
+
+    def _count_closed(self):
+        """accumulate the damage of the buffered cycles"""
+        if not self._closed:
+            return
+        index, first, second, count = (
+            np.concatenate(items) for items in zip(*self._closed)
+        )
+        self._closed = []
+        damage = self.sn_curve.damage(
+            np.abs(first - second) / 2, (first + second) / 2, count, index
+        )
+        self.damage += np.bincount(index, damage, minlength=self.n_fasteners)
+        self.cycles += np.bincount(index, count, minlength=self.n_fasteners)
+
+    def _push(self, index, values):
+        """push turning points and take the closed cycles out of the stacks"""
+        full = index[self.depth[index] == self.max_depth]
+        if full.size:
+            bottom = full * self.max_depth
+            self._closed.append(
+                (
+                    full,
+                    self.stack[bottom],
+                    self.stack[bottom + 1],
+                    np.full(full.size, 0.5),
+                )
+            )
+            stacks = self.stacks
+            stacks[full, :-1] = stacks[full, 1:]
+            self.depth[full] -= 1
+        self.stack[index * self.max_depth + self.depth[index]] = values
+        self.depth[index] += 1
+
+        active = index[self.depth[index] >= 4]
+        while active.size:
+            top = active * self.max_depth + self.depth[active]
+            points = self.stack.take(top[:, None] + _FOUR_POINTS)
+            cycle_range = np.abs(points[:, 1] - points[:, 2])
+            closed = (cycle_range <= np.abs(points[:, 0] - points[:, 1])) & (
+                cycle_range <= np.abs(points[:, 2] - points[:, 3])
+            )
+            if not closed.any():
+                break
+            active, top, points = active[closed], top[closed], points[closed]
+            self._closed.append(
+                (active, points[:, 1], points[:, 2], np.ones(active.size))
+            )
+            self.stack[top - 3] = points[:, 3]
+            self.depth[active] -= 2
+            active = active[self.depth[active] >= 4]
+
+    def _turning_points(self, histories) -> tuple:
+        """
+        Turning points of a chunk, ordered by fastener and time; the trend and the previous
+        sample are carried over to the next chunk
+
+        Flat steps do not change the trend. Only the steps where the direction changes,
+        including to and from flat, are collected; the trend over flat segments is resolved
+        on these events rather than on every sample.
+        """
+        above = np.empty(histories.shape, dtype=bool)
+        below = np.empty(histories.shape, dtype=bool)
+        np.greater(histories[1:], histories[:-1], out=above[1:])
+        np.less(histories[1:], histories[:-1], out=below[1:])
+        np.greater(histories[0], self.previous, out=above[0])
+        np.less(histories[0], self.previous, out=below[0])
+        direction = above.view(np.int8) - below.view(np.int8)
+        change = np.empty(histories.shape, dtype=bool)
+        np.not_equal(direction[0], self.trend, out=change[0])
+        np.not_equal(direction[1:], direction[:-1], out=change[1:])
+        fastener, step = np.nonzero(change.T)
+        if not fastener.size:
+            self.previous[:] = histories[-1]
+            return fastener, np.empty(0)
+        moved = direction[step, fastener]
+
+        # trend before every event: the last move of an earlier event of the fastener
+        events = np.arange(fastener.size)
+        first = np.searchsorted(fastener, fastener)
+        last_move = np.where(moved != 0, events, -1)
+        np.maximum.accumulate(last_move, out=last_move)
+        before = np.concatenate([[-1], last_move[:-1]])
+        trend = np.where(
+            before >= first, moved[np.maximum(before, 0)], self.trend[fastener]
+        )
+        turning = (moved != 0) & (trend != 0) & (moved != trend)
+
+        ends = np.flatnonzero(np.diff(np.append(fastener, self.n_fasteners)))
+        self.trend[fastener[ends]] = np.where(
+            moved[ends] != 0, moved[ends], trend[ends]
+        )
+        fastener, step = fastener[turning], step[turning]
+        values = np.where(
+            step > 0,
+            histories[np.maximum(step - 1, 0), fastener],
+            self.previous[fastener],
+        )
+        self.previous[:] = histories[-1]
+        return fastener, values
+
+    def update(self, histories) -> "RainflowDamage":
+        """
+        Count the next chunk of the force histories
+
+        :param histories: forces, (T, n_fasteners)
+        :type histories: array-like
+        :return: self
+        :rtype: RainflowDamage
+        """
+        histories = np.asarray(histories, dtype=float)
+        if histories.shape[0] == 0:
+            return self
+        if self.n_samples == 0:
+            self._push(np.arange(self.n_fasteners), histories[0])
+            self.previous[:] = histories[0]
+        self.n_samples += histories.shape[0]
+
+        fastener, values = self._turning_points(histories)
+
+        # push the n-th turning point of all fasteners at once, fastener order is kept
+        counts = np.bincount(fastener, minlength=self.n_fasteners)
+        rank = np.arange(fastener.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        order = np.argsort(rank, kind="stable")
+        bounds = np.cumsum(np.bincount(rank, minlength=counts.max(initial=0)))
+        for start, stop in zip(np.concatenate([[0], bounds[:-1]]), bounds):
+            self._push(fastener[order[start:stop]], values[order[start:stop]])
+        self._count_closed()
+        return self
+
+    def residue_damage(self) -> np.ndarray:
+        """
+        Damage of the residue (including the last sample) counted as half cycles, the
+        stacks are not changed
+
+        :return: residue damage per fastener
+        :rtype: np.ndarray
+        """
+        residue = np.zeros(self.n_fasteners)
+        stacks = self.stacks
+        last = stacks[np.arange(self.n_fasteners), np.maximum(self.depth - 1, 0)]
+        depth = self.depth + (self.previous != last)
+        points = np.concatenate([stacks, np.zeros((self.n_fasteners, 1))], axis=1)
+        points[np.arange(self.n_fasteners), self.depth] = self.previous
+        for position in range(int(depth.max(initial=0)) - 1):
+            index = np.nonzero(depth > position + 1)[0]
+            first, second = points[index, position], points[index, position + 1]
+            residue[index] += self.sn_curve.damage(
+                np.abs(first - second) / 2, (first + second) / 2, 0.5, index
+            )
+        return residue
+
+    def total_damage(self) -> np.ndarray:
+        """
+        Miner damage sum per fastener, closed cycles plus residue
+
+        :return: damage per fastener
+        :rtype: np.ndarray
+        """
+        return self.damage + self.residue_damage()
+
+
+def fatigue_damage(
+    histories, sn_curve: SNCurve, chunk_size: int = 65536, max_depth: int = 256
+) -> np.ndarray:
+    """
+    Rainflow count and Miner damage sum of force histories, read chunk by chunk
+
+    :param histories: forces of every fastener, (T, n_fasteners), e.g. a memory map
+    :type histories: array-like
+    :param sn_curve: S-N curve, scalar or per fastener parameters
+    :type sn_curve: SNCurve
+    :param chunk_size: number of samples per chunk
+    :type chunk_size: int
+    :param max_depth: maximum depth of the residue stacks
+    :type max_depth: int
+    :return: damage per fastener
+    :rtype: np.ndarray
+    """
+    counter = RainflowDamage(histories.shape[1], sn_curve, max_depth)
+    for start in range(0, histories.shape[0], chunk_size):
+        counter.update(histories[start : start + chunk_size])
+    return counter.total_damage()
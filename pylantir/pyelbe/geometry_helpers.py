@@ -13,6 +13,9 @@ from pylantir.scrolls import get_logger
 # logger
 logger = get_logger(__name__)
 
+# centroid of a rectangle, created once instead of on every call
+Centroid = namedtuple("C", ["Cx", "Cy"])
+
 # area of rectangle
 def area_rectangle(width: float, height: float) -> float:
     """Calculate the area of a rectangle
@@ -43,18 +46,12 @@ def centroid_rectangle(width: float, height: float, angle: float = 0) -> array:
     # if rectangle was on x axis
     C = [width / 2, height / 2]
     # rotate centroid to correct position
-    logger.debug("Angle: %s °", angle)
     angle = radians(angle)
-    logger.debug("angle: %s rad", angle)
-    logger.debug("C: %s", C)
     C = np.dot(np.array([[cos(angle), -sin(angle)], [sin(angle), cos(angle)]]), C)
-    logger.debug("C: %s", C)
     # make namedtuples
     Cx = C[0]
     Cy = C[1]
-    C = namedtuple("C", ["Cx", "Cy"])
-    C = C(Cx, Cy)
-    logger.debug("C: %s", C)
+    C = Centroid(Cx, Cy)
     return C
 
 
@@ -88,8 +85,6 @@ def inertia_rectangle(width: float, height: float, angle: float = 0) -> tuple:
         #    height * cos(radians(angle)) ** 2 + sin(radians(angle)) ** 2
         # )
 
-    logger.debug("Ix: %s", Ix)
-    logger.debug("Iy: %s", Iy)
     # rotate inertia to correct position
     # Ix = Ix + A * Cy**2
     # Iy = Iy + A * Cx**2
@@ -108,6 +103,22 @@ def inertia_rectangle(width: float, height: float, angle: float = 0) -> tuple:
     return Ix, Iy
 
 
+def product_inertia_rectangle(width: float, height: float, angle: float = 0) -> float:
+    """Calculate the product of inertia of a rectangle in its centroid, the rectangle turned
+    by angle like in inertia_rectangle
+
+    :param width: Width of the rectangle
+    :type width: float
+    :param height: Height of the rectangle
+    :type height: float
+    :param angle: Angle of the rectangle, degrees
+    :type angle: float
+    :return: Product of inertia Ixy of the rectangle
+    :rtype: float
+    """
+    return width * height * (width**2 - height**2) / 24 * sin(2 * radians(angle))
+
+
 def translate_inertia(Inertia: float, area: float, cg: float, ref: float = 0) -> float:
     """Translate inertia to a new reference point
 
@@ -138,13 +149,9 @@ def rotate_inertia(Ixg: float, Iyg: float, Ixy: float, angle: float) -> tuple:
     :rtype: tuple
     """
     angle = radians(angle)
-    logger.debug("angle: %s rad", angle)
     Iu = (Ixg + Iyg) / 2 + ((Ixg - Iyg) / 2) * cos(2 * angle) + Ixy * sin(2 * angle)
-    logger.debug("Iu: %s", Iu)
     Iv = (Ixg + Iyg) / 2 - ((Ixg - Iyg) / 2) * cos(2 * angle) - Ixy * sin(2 * angle)
-    logger.debug("Iv: %s", Iv)
     Iuv = (Ixg - Iyg) / 2 * sin(2 * angle) + Ixy * cos(2 * angle)
-    logger.debug("Iuv: %s", Iuv)
 
     return Iu, Iv, Iuv
 
@@ -216,21 +223,12 @@ def centroid_circle_sector(
         * sin(radians((end_angle - start_angle) / 2))
         / (3 * radians((end_angle - start_angle) / 2))
     )
-    logger.debug("Cx: %s", Cx)
     Cy = 0
-    logger.debug("Cy: %s", Cy)
 
     # rotate centroid to correct position
-    logger.debug("start_angle: %s", start_angle)
-    logger.debug("end_angle: %s", end_angle)
     angle = radians(start_angle + (end_angle - start_angle) / 2)
-    logger.debug("angle: %s rad", angle)
-    logger.debug("Cos: %s", cos(angle))
-    logger.debug("Sin: %s", sin(angle))
     Cx_rotated = Cx * cos(angle) - Cy * sin(angle)
-    logger.debug("Cx: %s", Cx_rotated)
     Cy_rotated = Cx * sin(angle) + Cy * cos(angle)
-    logger.debug("Cy: %s", Cy_rotated)
 
     return Cx_rotated, Cy_rotated
 
@@ -253,28 +251,19 @@ def centroid_arc_sector(
     :rtype: tuple
     """
     # if sector was on x axis
-    logger.debug("radius: %s", radius)
-    logger.debug("thickness: %s", thickness)
-    logger.debug("start_angle: %s", start_angle)
-    logger.debug("end_angle: %s", end_angle)
 
     alpha = radians((end_angle - start_angle) / 2)
-    logger.debug("alpha: %s", alpha)
     radius_1 = radius
     radius_2 = radius + thickness
 
     Cx = ((2 * sin(alpha)) / (3 * alpha)) * (
         (radius_2**3 - radius_1**3) / (radius_2**2 - radius_1**2)
     )
-    logger.debug("Cx: %s", Cx)
     Cy = 0
     # rotate centroid to correct position
     angle = radians(start_angle + (end_angle - start_angle) / 2)
-    logger.debug("angle: %s rad", angle)
     Cx_rotated = Cx * cos(angle) - Cy * sin(angle)
-    logger.debug("Cx: %s", Cx_rotated)
     Cy_rotated = Cx * sin(angle) + Cy * cos(angle)
-    logger.debug("Cy: %s", Cy_rotated)
 
     return Cx_rotated, Cy_rotated
 
@@ -304,11 +293,8 @@ def inertia_circle_sector(
         # in circle center
         # centroid of circle segment
         Cx, Cy = centroid_circle_sector(radius, start_angle, end_angle)
-        logger.debug("Cx: %s", Cx)
-        logger.debug("Cy: %s", Cy)
 
         area = area_circle_sector(radius, start_angle, end_angle)
-        logger.debug("area: %s", area)
         # inertia of circle segment with respect to centroid
 
         Ix = Ix + area * Cy**2
@@ -357,11 +343,9 @@ def inertia_arc_sector(
     Ix_sector_1, Iy_sector_1, Ixy_sector_1 = inertia_circle_sector(
         radius, start_angle, end_angle, False
     )
-    logger.debug("Ix_sector_1: %s", Ix_sector_1)
     Ix_sector_2, Iy_sector_2, Ixy_sector_2 = inertia_circle_sector(
         radius + thickness, start_angle, end_angle, False
     )
-    logger.debug("Ix_sector_2: %s", Ix_sector_2)
 
     Ix = Ix_sector_2 - Ix_sector_1
 
@@ -373,11 +357,8 @@ def inertia_arc_sector(
         # in circle center
         # centroid of arc segment
         Cx, Cy = centroid_arc_sector(radius, thickness, start_angle, end_angle)
-        logger.debug("Cx: %s", Cx)
-        logger.debug("Cy: %s", Cy)
 
         area = area_arc_sector(radius, thickness, start_angle, end_angle)
-        logger.debug("area: %s", area)
         # inertia of arc segment with respect to centroid
 
         Ix = Ix + area * Cy**2
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vectorized geometry kernels
+
+Array-in/array-out versions of the helpers in geometry_helpers. All arguments broadcast
+against each other, angles are in degrees and the formulas (and conventions) are the same as
+those of the scalar helpers, so profiles built from many sub-elements can be evaluated in one
+call per element type. Nothing is logged.
+"""
+
+import numpy as np
+
+
+def _sector_angles(start_angle, end_angle) -> tuple:
+    """half opening angle and bisector angle of a sector, radians"""
+    start_angle = np.asarray(start_angle, dtype=float)
+    end_angle = np.asarray(end_angle, dtype=float)
+    alpha = np.radians((end_angle - start_angle) / 2)
+    return alpha, np.radians(start_angle) + alpha
+
+
+def _rotate(Cx, Cy, angle) -> tuple:
+    """rotate points about the origin, angle in radians"""
+    cos_angle = np.cos(angle)
+    sin_angle = np.sin(angle)
+    return Cx * cos_angle - Cy * sin_angle, Cx * sin_angle + Cy * cos_angle
+
+
+def area_rectangle(width, height) -> np.ndarray:
+    """Calculate the area of rectangles
+
+    :param width: Width of the rectangles
+    :type width: array-like
+    :param height: Height of the rectangles
+    :type height: array-like
+    :return: Area of the rectangles
+    :rtype: np.ndarray
+    """
+    return np.multiply(width, height, dtype=float)
+
+
+def centroid_rectangle(width, height, angle=0) -> tuple:
+    """Calculate the centroid of rectangles relative to 0, 0
+
+    :param width: Width of the rectangles
+    :type width: array-like
+    :param height: Height of the rectangles
+    :type height: array-like
+    :param angle: Angle of the rectangles, degrees
+    :type angle: array-like
+    :return: Cx, Cy
+    :rtype: tuple
+    """
+    Cx = np.asarray(width, dtype=float) / 2
+    Cy = np.asarray(height, dtype=float) / 2
+    return _rotate(Cx, Cy, np.radians(angle))
+
+
+def inertia_rectangle(width, height, angle=0) -> tuple:
+    """Calculate the inertia of rectangles in their centroid
+
+    :param width: Width of the rectangles
+    :type width: array-like
+    :param height: Height of the rectangles
+    :type height: array-like
+    :param angle: Angle of the rectangles, degrees
+    :type angle: array-like
+    :return: Ix, Iy
+    :rtype: tuple
+    """
+    width = np.asarray(width, dtype=float)
+    height = np.asarray(height, dtype=float)
+    Ix = height**3 * width / 12
+    Iy = width**3 * height / 12
+    Iu, Iv, _ = rotate_inertia(Ix, Iy, 0.0, angle)
+    return Iu, Iv
+
+
+def product_inertia_rectangle(width, height, angle=0) -> np.ndarray:
+    """Calculate the product of inertia of rectangles in their centroid
+
+    :param width: Width of the rectangles
+    :type width: array-like
+    :param height: Height of the rectangles
+    :type height: array-like
+    :param angle: Angle of the rectangles, degrees
+    :type angle: array-like
+    :return: Ixy
+    :rtype: np.ndarray
+    """
+    width = np.asarray(width, dtype=float)
+    height = np.asarray(height, dtype=float)
+    return width * height * (width**2 - height**2) / 24 * np.sin(2 * np.radians(angle))
+
+
+def translate_inertia(Inertia, area, cg, ref=0) -> np.ndarray:
+    """Translate inertia to a new reference point
+
+    :param Inertia: Inertia of the objects
+    :type Inertia: array-like
+    :param area: Area of the objects
+    :type area: array-like
+    :param cg: Center of gravity of the objects
+    :type cg: array-like
+    :param ref: Reference point
+    :type ref: array-like
+    :return: Inertia of the objects at the new reference point
+    :rtype: np.ndarray
+    """
+    return np.asarray(Inertia, dtype=float) + np.multiply(
+        area, np.square(np.subtract(cg, ref, dtype=float))
+    )
+
+
+def rotate_inertia(Ixg, Iyg, Ixy, angle) -> tuple:
+    """Rotate inertia
+
+    :param Ixg: Inertia around x axis
+    :type Ixg: array-like
+    :param Iyg: Inertia around y axis
+    :type Iyg: array-like
+    :param Ixy: Product of inertia
+    :type Ixy: array-like
+    :param angle: Angle of rotation, degrees
+    :type angle: array-like
+    :return: Iu, Iv, Iuv
+    :rtype: tuple
+    """
+    Ixg = np.asarray(Ixg, dtype=float)
+    Iyg = np.asarray(Iyg, dtype=float)
+    angle = np.radians(angle)
+    cos_2 = np.cos(2 * angle)
+    sin_2 = np.sin(2 * angle)
+    mean = (Ixg + Iyg) / 2
+    half_difference = (Ixg - Iyg) / 2
+    Iu = mean + half_difference * cos_2 + Ixy * sin_2
+    Iv = mean - half_difference * cos_2 - Ixy * sin_2
+    Iuv = half_difference * sin_2 + Ixy * cos_2
+    return Iu, Iv, Iuv
+
+
+def area_circle_sector(radius, start_angle=0, end_angle=360) -> np.ndarray:
+    """Calculate the area of circle segments, default is a full circle
+
+    :param radius: Radius of the circle segments
+    :type radius: array-like
+    :param start_angle: Start angle of the circle segments, degrees
+    :type start_angle: array-like
+    :param end_angle: End angle of the circle segments, degrees
+    :type end_angle: array-like
+    :return: Area of the circle segments
+    :rtype: np.ndarray
+    """
+    return (
+        0.5
+        * np.square(radius, dtype=float)
+        * np.radians(np.subtract(end_angle, start_angle, dtype=float))
+    )
+
+
+def area_arc_sector(radius, thickness, start_angle=0, end_angle=360) -> np.ndarray:
+    """Calculate the area of arc segments, default is a hollow circle
+
+    :param radius: Radius of the arc segments
+    :type radius: array-like
+    :param thickness: Thickness of the arc segments
+    :type thickness: array-like
+    :param start_angle: Start angle of the arc segments, degrees
+    :type start_angle: array-like
+    :param end_angle: End angle of the arc segments, degrees
+    :type end_angle: array-like
+    :return: Area of the arc segments
+    :rtype: np.ndarray
+    """
+    radius = np.asarray(radius, dtype=float)
+    outer_circle = area_circle_sector(radius + thickness, start_angle, end_angle)
+    inner_circle = area_circle_sector(radius, start_angle, end_angle)
+    return np.abs(outer_circle - inner_circle)
+
+
+def centroid_circle_sector(radius, start_angle, end_angle) -> tuple:
+    """Calculate the centroid of circle segments
+
+    :param radius: Radius of the circle segments
+    :type radius: array-like
+    :param start_angle: Start angle of the circle segments, degrees
+    :type start_angle: array-like
+    :param end_angle: End angle of the circle segments, degrees
+    :type end_angle: array-like
+    :return: Cx, Cy
+    :rtype: tuple
+    """
+    alpha, angle = _sector_angles(start_angle, end_angle)
+    Cx = 2 * np.asarray(radius, dtype=float) * np.sin(alpha) / (3 * alpha)
+    return _rotate(Cx, 0.0, angle)
+
+
+def centroid_arc_sector(radius, thickness, start_angle, end_angle) -> tuple:
+    """Calculate the centroid of arc segments
+
+    :param radius: Radius of the arc segments
+    :type radius: array-like
+    :param thickness: Thickness of the arc segments
+    :type thickness: array-like
+    :param start_angle: Start angle of the arc segments, degrees
+    :type start_angle: array-like
+    :param end_angle: End angle of the arc segments, degrees
+    :type end_angle: array-like
+    :return: Cx, Cy
+    :rtype: tuple
+    """
+    alpha, angle = _sector_angles(start_angle, end_angle)
+    radius_1 = np.asarray(radius, dtype=float)
+    radius_2 = radius_1 + thickness
+    Cx = ((2 * np.sin(alpha)) / (3 * alpha)) * (
+        (radius_2**3 - radius_1**3) / (radius_2**2 - radius_1**2)
+    )
+    return _rotate(Cx, 0.0, angle)
+
+
+def inertia_circle_sector(radius, start_angle, end_angle, cg: bool = True) -> tuple:
+    """Calculate the inertia of circle segments
+
+    :param radius: Radius of the circle segments
+    :type radius: array-like
+    :param start_angle: Start angle of the circle segments, degrees
+    :type start_angle: array-like
+    :param end_angle: End angle of the circle segments, degrees
+    :type end_angle: array-like
+    :param cg: If True, return the inertia with respect to the centroid, else in circle center
+    :type cg: bool
+    :return: Ix, Iy, Ixy
+    :rtype: tuple
+    """
+    radius = np.asarray(radius, dtype=float)
+    opening = np.radians(np.subtract(end_angle, start_angle, dtype=float))
+    Ix = (1 / 8) * radius**4 * opening
+    Iy = Ix.copy()
+    Ixy = np.zeros_like(Ix)
+    if not cg:
+        Cx, Cy = centroid_circle_sector(radius, start_angle, end_angle)
+        area = 0.5 * radius**2 * opening
+        Ix = Ix + area * Cy**2
+        Iy = Iy + area * Cx**2
+        Ixy = Ixy + area * Cy * Cx
+    return Ix, Iy, Ixy
+
+
+def inertia_arc_sector(
+    radius, thickness, start_angle, end_angle, cg: bool = False
+) -> tuple:
+    """Calculate the inertia of arc segments
+
+    :param radius: Radius of the arc segments
+    :type radius: array-like
+    :param thickness: Thickness of the arc segments
+    :type thickness: array-like
+    :param start_angle: Start angle of the arc segments, degrees
+    :type start_angle: array-like
+    :param end_angle: End angle of the arc segments, degrees
+    :type end_angle: array-like
+    :param cg: If True, return the inertia with respect to the centroid, else in circle center
+    :type cg: bool
+    :return: Ix, Iy, Ixy
+    :rtype: tuple
+    """
+    radius = np.asarray(radius, dtype=float)
+    Ix_1, Iy_1, Ixy_1 = inertia_circle_sector(radius, start_angle, end_angle, False)
+    Ix_2, Iy_2, Ixy_2 = inertia_circle_sector(
+        radius + thickness, start_angle, end_angle, False
+    )
+    Ix = Ix_2 - Ix_1
+    Iy = Iy_2 - Iy_1
+    Ixy = Ixy_2 - Ixy_1
+    if cg:
+        Cx, Cy = centroid_arc_sector(radius, thickness, start_angle, end_angle)
+        area = area_arc_sector(radius, thickness, start_angle, end_angle)
+        Ix = Ix + area * Cy**2
+        Iy = Iy + area * Cx**2
+        Ixy = Ixy + area * Cy * Cx
+    return Ix, Iy, Ixy
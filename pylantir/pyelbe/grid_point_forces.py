@@ -0,0 +1,263 @@
+"""free body interface loads from Nastran-style grid point force balance text output
+
+The f06 "G R I D   P O I N T   F O R C E   B A L A N C E" tables are read line by line. Only
+the element contributions of the free body elements at the interface grids are kept, in
+fixed size buffers that are summed per subcase and interface with vectorized load transfer to
+the reference point of the joint. The memory in use depends on the buffer size and the number
+of subcases, not on the size of the file.
+
+Expected table layout (column 1 is the carriage control character)::
+
+    0                                                        SUBCASE 1
+                      G R I D   P O I N T   F O R C E   B A L A N C E
+       POINT-ID    ELEMENT-ID     SOURCE    T1    T2    T3    R1    R2    R3
+    0       101                  APP-LOAD   ...
+    0       101          11       QUAD4     ...
+                         12       QUAD4     ...
+            101                  *TOTALS*   ...
+
+The point id is carried over from the previous line when it is left blank.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from pylantir.pyelbe.loads import LoadCaseSet
+from pylantir.pyelbe.load_transfer import transfer_loads
+
+GPFORCE_HEADER = "G R I D   P O I N T   F O R C E   B A L A N C E"
+# sources without an element id, they are not element contributions
+NON_ELEMENT_SOURCES = ("APP-LOAD", "F-OF-SPC", "F-OF-MPC", "*TOTALS*")
+# default number of buffered contributions before they are summed
+BUFFER_ROWS = 65536
+
+
+@dataclass
+class Interface:
+    """
+    Free body cut of a joint
+
+    :param name: name of the interface / joint
+    :type name: str
+    :param grids: grid ids on the cut
+    :type grids: list
+    :param elements: element ids of the free body, their forces on the cut grids are summed
+    :type elements: list
+    :param reference_point: reference point of the joint (x, y, z)
+    :type reference_point: tuple
+    :param sign: -1 to take the load of the free body on the rest of the structure
+    :type sign: float
+    """
+
+    name: str
+    grids: List[int]
+    elements: List[int]
+    reference_point: tuple = (0.0, 0.0, 0.0)
+    sign: float = 1.0
+    grid_array: np.ndarray = field(init=False, repr=False)
+    element_array: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Post initialization of the interface
+        """
+        self.grid_array = np.unique(np.asarray(self.grids, dtype=np.int64))
+        self.element_array = np.unique(np.asarray(self.elements, dtype=np.int64))
+        self.reference_point = np.asarray(self.reference_point, dtype=float)
+
+
+def _is_int(token: str) -> bool:
+    """True if the token is an integer id"""
+    return token.lstrip("-").isdigit()
+
+
+def parse_gpforce_lines(
+    lines: Iterable[str],
+) -> Iterator[Tuple[int, int, int, str, List[float]]]:
+    """
+    Parse the grid point force balance tables of f06 text lines.
+
+    :param lines: text lines, e.g. an open file
+    :type lines: iterable
+    :return: (subcase, point id, element id or 0, source, [t1, t2, t3, r1, r2, r3]) for every
+        table line
+    :rtype: iterator
+    """
+    subcase = 1
+    in_table = False
+    point = 0
+    for line in lines:
+        if line[:1] == "1":
+            # new page, a continued table repeats its header
+            in_table = False
+        if "SUBCASE" in line:
+            tokens = line.split()
+            position = tokens.index("SUBCASE") if "SUBCASE" in tokens else -1
+            if 0 <= position < len(tokens) - 1 and _is_int(tokens[position + 1]):
+                subcase = int(tokens[position + 1])
+        if GPFORCE_HEADER in line:
+            in_table = True
+            continue
+        if not in_table:
+            continue
+
+        tokens = line[1:].split()
+        if len(tokens) < 7:
+            continue
+        try:
+            values = [float(token) for token in tokens[-6:]]
+        except ValueError:
+            continue
+        head = tokens[:-6]
+        source = head[-1]
+        ids = [int(token) for token in head[:-1] if _is_int(token)]
+        element = 0
+        if len(ids) == 2:
+            point, element = ids
+        elif len(ids) == 1 and source in NON_ELEMENT_SOURCES:
+            point = ids[0]
+        elif len(ids) == 1:
+            element = ids[0]
+        yield subcase, point, element, source, values
+
+
+# pylint: disable=too-many-instance-attributes
+class InterfaceLoadAccumulator:
+    """
+    Sums buffered grid point force contributions per subcase and interface.
+
+    :param interfaces: interfaces to extract
+    :type interfaces: list
+    :param grid_coordinates: grid id -> (x, y, z) of every interface grid
+    :type grid_coordinates: dict
+    :param buffer_rows: number of contributions buffered before summing
+    :type buffer_rows: int
+    """
+
+    def __init__(
+        self,
+        interfaces: List[Interface],
+        grid_coordinates: Dict[int, tuple],
+        buffer_rows: int = BUFFER_ROWS,
+    ):
+        self.interfaces = interfaces
+        self.grid_ids = np.array(sorted(grid_coordinates), dtype=np.int64)
+        self.grid_xyz = np.array(
+            [grid_coordinates[grid] for grid in self.grid_ids], dtype=float
+        ).reshape(-1, 3)
+        missing = {
+            grid
+            for interface in interfaces
+            for grid in interface.grid_array.tolist()
+            if grid not in grid_coordinates
+        }
+        if missing:
+            raise KeyError(f"no coordinates for interface grids {sorted(missing)}")
+        self.grids = {grid for item in interfaces for grid in item.grid_array.tolist()}
+        self.elements = {
+            element for item in interfaces for element in item.element_array.tolist()
+        }
+
+        self.subcases = np.zeros(buffer_rows, dtype=np.int64)
+        self.points = np.zeros(buffer_rows, dtype=np.int64)
+        self.element_ids = np.zeros(buffer_rows, dtype=np.int64)
+        self.values = np.zeros((buffer_rows, 6))
+        self.n_rows = 0
+        # subcase -> (n_interfaces, 6) running sums
+        self.sums: Dict[int, np.ndarray] = {}
+
+    def add(self, subcase: int, point: int, element: int, values: List[float]):
+        """buffer one contribution if it belongs to an interface"""
+        if point not in self.grids or element not in self.elements:
+            return
+        self.subcases[self.n_rows] = subcase
+        self.points[self.n_rows] = point
+        self.element_ids[self.n_rows] = element
+        self.values[self.n_rows] = values
+        self.n_rows += 1
+        if self.n_rows == len(self.subcases):
+            self.flush()
+
+    def flush(self):
+        """sum the buffered contributions at the reference points and empty the buffer"""
+        if self.n_rows == 0:
+            return
+        rows = slice(0, self.n_rows)
+        subcases, inverse = np.unique(self.subcases[rows], return_inverse=True)
+        xyz = self.grid_xyz[np.searchsorted(self.grid_ids, self.points[rows])]
+        for subcase in subcases.tolist():
+            if subcase not in self.sums:
+                self.sums[subcase] = np.zeros((len(self.interfaces), 6))
+
+        for position, interface in enumerate(self.interfaces):
+            mask = np.isin(self.points[rows], interface.grid_array) & np.isin(
+                self.element_ids[rows], interface.element_array
+            )
+            if not mask.any():
+                continue
+            moved = interface.sign * transfer_loads(
+                self.values[rows][mask], xyz[mask], interface.reference_point
+            )
+            for component in range(6):
+                totals = np.bincount(
+                    inverse[mask], moved[:, component], minlength=len(subcases)
+                )
+                for index, subcase in enumerate(subcases.tolist()):
+                    self.sums[subcase][position, component] += totals[index]
+        self.n_rows = 0
+
+    def results(self) -> Dict[str, LoadCaseSet]:
+        """
+        Interface loads of every subcase
+
+        :return: interface name -> load cases at its reference point, case ids are subcases
+        :rtype: dict
+        """
+        self.flush()
+        subcases = sorted(self.sums)
+        stacked = (
+            np.stack([self.sums[subcase] for subcase in subcases], axis=1)
+            if subcases
+            else np.zeros((len(self.interfaces), 0, 6))
+        )
+        return {
+            interface.name: LoadCaseSet.from_arrays(
+                stacked[position].reshape(-1, 6),
+                interface.reference_point,
+                np.asarray(subcases, dtype=np.int64),
+            )
+            for position, interface in enumerate(self.interfaces)
+        }
+
+
+def extract_interface_loads(
+    path,
+    interfaces: List[Interface],
+    grid_coordinates: Dict[int, tuple],
+    buffer_rows: int = BUFFER_ROWS,
+) -> Dict[str, LoadCaseSet]:
+    r"""
+    Free body loads of joints from a grid point force balance f06 file.
+
+    For every subcase and interface the forces of the free body elements on the interface
+    grids are summed and transferred to the reference point of the interface:
+    :math:`F = \sum F_{g}`, :math:`M = \sum M_{g} + (r_{g} - r_{R}) \times F_{g}`
+
+    :param path: f06 text file
+    :type path: str, Path
+    :param interfaces: interfaces to extract
+    :type interfaces: list
+    :param grid_coordinates: grid id -> (x, y, z), at least for the interface grids
+    :type grid_coordinates: dict
+    :param buffer_rows: number of contributions buffered before summing
+    :type buffer_rows: int
+    :return: interface name -> load cases at its reference point, case ids are subcases
+    :rtype: dict
+    """
+    accumulator = InterfaceLoadAccumulator(interfaces, grid_coordinates, buffer_rows)
+    with open(path, encoding="utf-8", errors="replace") as file:
+        for subcase, point, element, _, values in parse_gpforce_lines(file):
+            accumulator.add(subcase, point, element, values)
+    return accumulator.results()
@@ -13,7 +13,10 @@ from pylantir.pyweser.matreel.material import Material
 from pylantir.pyelbe.loads import Forces, Moments
 from pylantir.pyelbe.abstractions import ReferencePoint
 from pylantir.pyelbe.fasteners import Fastener, FastenerGroup
+from .hsb_21030_10_batch import interaction_reserve_factor
 from .hsb_formulas import (
+    equilibrium_violations,
+    fastener_equilibrium_residuals,
     moment_x_reference,
     moment_y_reference,
     moment_z_reference,
@@ -47,10 +50,13 @@ class Hsb2103001:  # pylint: disable=too-many-public-methods
         moments: namedtuple,
         application_point: namedtuple,
         reference_point: namedtuple,
+        check_equilibrium: bool = False,
     ):
         """
         Initialization of HSB 21030-01 fastener calculation
 
+        :param check_equilibrium: verify that the fastener forces reproduce the applied loads
+        :type check_equilibrium: bool
         """
         self.name = name
         self.fastener_group = fastener_group
@@ -115,6 +121,16 @@ class Hsb2103001:  # pylint: disable=too-many-public-methods
             self.compression_update = True
             print("Fasteners in compression, iterate calculation!")
 
+        # optional self-check of the fastener forces against the applied loads
+        self.equilibrium_residuals = None
+        self.equilibrium_ok = None
+        if check_equilibrium:
+            residuals, applied = self.calculate_equilibrium_residuals()
+            self.equilibrium_residuals = residuals
+            self.equilibrium_ok = not equilibrium_violations(residuals, applied)
+            if not self.equilibrium_ok:
+                print(f"WARNING: {self.name} violates equilibrium: {residuals}")
+
         self.result_dict = self.make_dict()
 
         self.cogs = self.make_cogs()
@@ -436,6 +452,48 @@ class Hsb2103001:  # pylint: disable=too-many-public-methods
         """
         return np.trunc(100 * self.fastener_group.tension / self.tension_forces) / 100
 
+    def calculate_fastener_interaction_reserve_factor(
+        self, exponent_shear: float = 2.0, exponent_tension: float = 2.0
+    ) -> float:
+        r"""
+        Combined shear-tension reserve factor
+
+        :math: `\left(\frac{RF}{RF_{s}}\right)^{a} + \left(\frac{RF}{RF_{t}}\right)^{b} = 1`
+        """
+        rf_combined = interaction_reserve_factor(
+            self.shear_forces / self.fastener_group.shear,
+            self.tension_forces / self.fastener_group.tension,
+            exponent_shear,
+            exponent_tension,
+        )
+        return np.trunc(100 * rf_combined) / 100
+
+    def calculate_equilibrium_residuals(self) -> tuple:
+        r"""
+        Equilibrium residuals of the fastener forces against the loads applied about U
+
+        :math:`\sum F_{i} - F` and :math:`\sum r_{i} \times F_{i} - M_{U}` with the
+        fastener forces :math:`(F_{i}, F_{S,y,i}, F_{S,z,i})` at the fastener coordinates
+        :math:`r_{i}` and :math:`M_{U} = M_{P} + r_{P} \times F`
+
+        :return: residuals and applied loads ordered as (force_x, force_y, force_z,
+            moment_x_u, moment_y_u, moment_z_u)
+        :rtype: tuple
+        """
+        coordinates = [
+            (fastener.x_coord, fastener.y_coord, fastener.z_coord)
+            for fastener in self.fastener_group.fasteners
+        ]
+        fastener_forces = np.column_stack(
+            [self.tension_forces, self.force_fsy, self.force_fsz]
+        )
+        return fastener_equilibrium_residuals(
+            self.forces.namedtuple + self.moments.namedtuple,
+            self.application_point.namedtuple,
+            coordinates,
+            fastener_forces,
+        )
+
     def make_dict(self):
         """make dataframe including fasteners, attributes, forces and reserve factors"""
         df_dict = {
@@ -0,0 +1,691 @@
+"""vectorized HSB 21030-01 solution for many load cases of one fastener group"""
+
+from collections import namedtuple
+from dataclasses import dataclass, field
+import math
+
+import numpy as np
+
+from pylantir.pyelbe.fasteners import FastenerGroup
+from pylantir.pyelbe.load_transfer import transfer_loads
+from pylantir.pyelbe.loads import (  # pylint: disable=unused-import
+    LOAD_COMPONENTS,
+    LoadCaseSet,
+    LoadCombination,
+)
+from .hsb_formulas import equilibrium_violations, fastener_equilibrium_residuals
+
+
+def loads_at_origin(loads, application_points=None) -> np.ndarray:
+    r"""
+    Resolve (N, 6) load cases given about their application points at the origin U.
+
+    :math:`M_{U} = M_{P} + r_{P} \times F`
+
+    :param loads: load cases (force_x, force_y, force_z, moment_x, moment_y, moment_z), or a
+        LoadCaseSet carrying its own application points
+    :type loads: array-like, (N, 6) or (6,), LoadCaseSet
+    :param application_points: application points, (N, 3) or (3,), None if the moments are
+        already given about the origin
+    :type application_points: array-like
+    :return: load cases about the origin
+    :rtype: np.ndarray, (N, 6)
+    """
+    if isinstance(loads, LoadCaseSet):
+        return loads.at_origin()
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    if application_points is None:
+        return loads
+    return transfer_loads(loads, application_points)
+
+
+def reserve_factor(allowable, force):
+    r"""
+    Reserve factor truncated to two decimals, as in Hsb2103001
+
+    :math:`RF = F_{all,i}/F_{i}`
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.trunc(100 * allowable / force) / 100
+
+
+def interaction_reserve_factor(
+    shear_ratio,
+    tension_ratio,
+    exponent_shear: float = 2.0,
+    exponent_tension: float = 2.0,
+    tolerance: float = 1e-12,
+    max_iterations: int = 50,
+) -> np.ndarray:
+    r"""
+    Combined shear-tension reserve factor of the interaction
+
+    :math:`\left(\frac{RF}{RF_{s}}\right)^{a} + \left(\frac{RF}{RF_{t}}\right)^{b} = 1`
+
+    with the load ratios :math:`1/RF_{s} = F_{s,i}/F_{s,all,i}` and
+    :math:`1/RF_{t} = F_{t,i}/F_{t,all,i}` (compressive tensile forces count as 0).
+    Closed forms are used for a = b and for the linear-quadratic combinations, otherwise a
+    vectorized Newton iteration, started at min(RFs, RFt). For a, b >= 1 the interaction
+    function is convex and increasing there, so the iteration converges monotonically.
+
+    :param shear_ratio: shear load ratio 1/RFs, any shape
+    :type shear_ratio: array-like
+    :param tension_ratio: tension load ratio 1/RFt, same shape
+    :type tension_ratio: array-like
+    :param exponent_shear: interaction exponent a of the shear term
+    :type exponent_shear: float
+    :param exponent_tension: interaction exponent b of the tension term
+    :type exponent_tension: float
+    :param tolerance: relative convergence tolerance of the Newton iteration
+    :type tolerance: float
+    :param max_iterations: maximum number of Newton iterations
+    :type max_iterations: int
+    :return: combined reserve factors (not truncated), inf where both ratios are 0
+    :rtype: np.ndarray
+    """
+    ratio_s = np.abs(np.asarray(shear_ratio, dtype=float))
+    ratio_t = np.clip(np.asarray(tension_ratio, dtype=float), 0, None)
+    ratio_s, ratio_t = np.broadcast_arrays(ratio_s, ratio_t)
+    exp_s = float(exponent_shear)
+    exp_t = float(exponent_tension)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if exp_s == exp_t:
+            return (ratio_s**exp_s + ratio_t**exp_t) ** (-1 / exp_s)
+        if {exp_s, exp_t} == {1.0, 2.0}:
+            # c2 RF^2 + c1 RF - 1 = 0, written in the cancellation free form
+            linear, quadratic = (
+                (ratio_s, ratio_t) if exp_s == 1.0 else (ratio_t, ratio_s)
+            )
+            return 2 / (linear + np.sqrt(linear**2 + 4 * quadratic**2))
+
+        rf_combined = 1 / np.maximum(ratio_s, ratio_t).ravel()
+
+    shape = ratio_s.shape
+    ratio_s = ratio_s.ravel()
+    ratio_t = ratio_t.ravel()
+    active = np.isfinite(rf_combined)
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        x_act = rf_combined[active]
+        r_s = ratio_s[active]
+        r_t = ratio_t[active]
+        value = (x_act * r_s) ** exp_s + (x_act * r_t) ** exp_t - 1
+        slope = (
+            exp_s * (x_act * r_s) ** exp_s + exp_t * (x_act * r_t) ** exp_t
+        ) / x_act
+        step = value / slope
+        rf_combined[active] = x_act - step
+        converged = np.abs(step) <= tolerance * np.abs(x_act)
+        active[np.flatnonzero(active)[converged]] = False
+
+    return rf_combined.reshape(shape)
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class GroupInfluence:
+    """
+    Load independent part of HSB 21030-01 for one fastener group.
+
+    For a fixed compression state the fastener forces are linear in the six load components
+    about the origin U. The rows of shear_y, shear_z and tension hold, per fastener, the
+    coefficients of :math:`F_{S,y,i}`, :math:`F_{S,z,i}` and :math:`F_{i}` for
+    (force_x, force_y, force_z, moment_x, moment_y, moment_z).
+
+    :param fastener_group: fastener group
+    :type fastener_group: FastenerGroup
+    :param reference_point: reference point U, defaults to the origin
+    :type reference_point: namedtuple
+    """
+
+    fastener_group: FastenerGroup
+    reference_point: namedtuple = None
+    y_coords: np.ndarray = field(init=False, repr=False)
+    z_coords: np.ndarray = field(init=False, repr=False)
+    shear_allowable: np.ndarray = field(init=False, repr=False)
+    tension_allowable: np.ndarray = field(init=False, repr=False)
+    alpha: float = field(init=False)
+    fastener_ya: np.ndarray = field(init=False, repr=False)
+    fastener_za: np.ndarray = field(init=False, repr=False)
+    centroid_yta: float = field(init=False)
+    centroid_zta: float = field(init=False)
+    moment_x_s: np.ndarray = field(init=False, repr=False)
+    moment_ya: np.ndarray = field(init=False, repr=False)
+    moment_za: np.ndarray = field(init=False, repr=False)
+    shear_y: np.ndarray = field(init=False, repr=False)
+    shear_z: np.ndarray = field(init=False, repr=False)
+    tension: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Post initialization of the influence coefficients
+
+        """
+        group = self.fastener_group
+        self.y_coords = np.array(
+            [fastener.y_coord for fastener in group.fasteners], float
+        )
+        self.z_coords = np.array(
+            [fastener.z_coord for fastener in group.fasteners], float
+        )
+        self.shear_allowable = np.asarray(group.shear, dtype=float)
+        self.tension_allowable = np.asarray(group.tension, dtype=float)
+        y_ref = 0.0 if self.reference_point is None else self.reference_point.y_coord
+        z_ref = 0.0 if self.reference_point is None else self.reference_point.z_coord
+
+        centroid_ys = group.centroid_ys
+        centroid_zs = group.centroid_zs
+        centroid_yt = group.centroid_yt
+        centroid_zt = group.centroid_zt
+
+        # moments about the centroids as rows acting on the load vector about U
+        self.moment_x_s = np.array(
+            [0, centroid_zs - z_ref, y_ref - centroid_ys, 1, 0, 0], dtype=float
+        )
+        moment_y_s = np.array([-centroid_zt, 0, 0, 0, 1, 0], dtype=float)
+        moment_z_s = np.array([centroid_yt, 0, 0, 0, 0, 1], dtype=float)
+
+        self.alpha = self.calculate_alpha(centroid_yt, centroid_zt)
+        cos_a = math.cos(self.alpha)
+        sin_a = math.sin(self.alpha)
+        self.centroid_yta = centroid_yt * cos_a + centroid_zt * sin_a
+        self.centroid_zta = -centroid_yt * sin_a + centroid_zt * cos_a
+        self.fastener_ya = self.y_coords * cos_a + self.z_coords * sin_a
+        self.fastener_za = -self.y_coords * sin_a + self.z_coords * cos_a
+        self.moment_ya = moment_y_s * cos_a + moment_z_s * sin_a
+        self.moment_za = -moment_y_s * sin_a + moment_z_s * cos_a
+
+        # 3.3.4 shear forces
+        shear = self.shear_allowable
+        polar = np.sum(
+            shear
+            * ((self.y_coords - centroid_ys) ** 2 + (self.z_coords - centroid_zs) ** 2)
+        )
+        unit_y = np.array([0, 1, 0, 0, 0, 0], dtype=float)
+        unit_z = np.array([0, 0, 1, 0, 0, 0], dtype=float)
+        self.shear_y = np.outer(shear / shear.sum(), unit_y) - np.outer(
+            shear * (self.z_coords - centroid_zs) / polar, self.moment_x_s
+        )
+        self.shear_z = np.outer(shear / shear.sum(), unit_z) + np.outer(
+            shear * (self.y_coords - centroid_ys) / polar, self.moment_x_s
+        )
+
+        # 3.3.3 tensile forces, F_i = F_1,i + F_2,i - F_3,i
+        tension = self.tension_allowable
+        lever_z = tension * (self.fastener_za - self.centroid_zta)
+        lever_y = tension * (self.fastener_ya - self.centroid_yta)
+        unit_x = np.array([1, 0, 0, 0, 0, 0], dtype=float)
+        self.tension = (
+            np.outer(tension / tension.sum(), unit_x)
+            + np.outer(
+                lever_z / np.sum(lever_z * (self.fastener_za - self.centroid_zta)),
+                self.moment_ya,
+            )
+            - np.outer(
+                lever_y / np.sum(lever_y * (self.fastener_ya - self.centroid_yta)),
+                self.moment_za,
+            )
+        )
+
+    def calculate_alpha(self, centroid_yt: float, centroid_zt: float) -> float:
+        r"""
+        Angle of the principal axis system of the fastener group, as in Hsb2103001
+
+        :math:`tan(2 \cdot \alpha) = 2 \cdot \frac{\sum[F_{T,all,i} \cdot (y_{i} -
+         y_{T}) \cdot (z_{i} - z_{T})]}
+        {\sum[F_{T,all,i} \cdot (y_{i} - y_{T})^{2}] - \sum[F_{T,all,i} \cdot (z_{i} - z_{T})^{2}]}`
+        """
+        delta_y = self.y_coords - centroid_yt
+        delta_z = self.z_coords - centroid_zt
+        product = float(np.sum(self.tension_allowable * delta_y * delta_z))
+        denominator = float(
+            np.sum(self.tension_allowable * delta_y**2)
+            - np.sum(self.tension_allowable * delta_z**2)
+        )
+        if denominator == 0:
+            # limit of atan for tan(2 alpha) -> +/- infinity
+            return math.copysign(math.pi / 4, product) if product else 0.0
+        return math.atan(2 * product / denominator) / 2
+
+    @property
+    def n_fasteners(self) -> int:
+        """number of fasteners in the group"""
+        return len(self.shear_allowable)
+
+
+def equilibrium_residuals(
+    influence: GroupInfluence, loads, result, application_points=None
+) -> tuple:
+    r"""
+    Equilibrium residuals of HSB 21030-01 fastener forces, vectorized over load cases.
+
+    :math:`\sum F_{i} = F` and :math:`\sum r_{i} \times F_{i} = M_{U}` with the fastener
+    forces :math:`(F_{i}, F_{S,y,i}, F_{S,z,i})` at the fastener coordinates
+    :math:`r_{i}`, see fastener_equilibrium_residuals.
+
+    :param influence: influence coefficients of the fastener group
+    :type influence: GroupInfluence
+    :param loads: load cases about their application points
+    :type loads: array-like, (N, 6), LoadCaseSet
+    :param result: fastener forces of the load cases
+    :type result: BatchResult
+    :param application_points: application points, (N, 3) or (3,), None if the moments are
+        given about the origin
+    :type application_points: array-like
+    :return: residuals and applied loads about the origin, both (N, 6)
+    :rtype: tuple
+    """
+    if isinstance(loads, LoadCaseSet):
+        loads, application_points = loads.loads, loads.application_points
+    coordinates = np.column_stack(
+        [
+            [fastener.x_coord for fastener in influence.fastener_group.fasteners],
+            influence.y_coords,
+            influence.z_coords,
+        ]
+    )
+    fastener_forces = np.stack(
+        [result.tension_forces, result.force_fsy, result.force_fsz], axis=-1
+    )
+    return fastener_equilibrium_residuals(
+        np.atleast_2d(loads), application_points, coordinates, fastener_forces
+    )
+
+
+@dataclass
+class BatchResult:
+    """
+    Fastener forces and reserve factors for N load cases, arrays of shape (N, n_fasteners).
+    Names follow the attributes of Hsb2103001.
+    """
+
+    force_fsy: np.ndarray
+    force_fsz: np.ndarray
+    shear_forces: np.ndarray
+    tension_forces: np.ndarray
+    reserve_factor_shear: np.ndarray
+    reserve_factor_tension: np.ndarray
+    reserve_factor_combined: np.ndarray = None
+    equilibrium_residuals: np.ndarray = None
+    equilibrium_violations: np.ndarray = None
+
+    def __len__(self) -> int:
+        return self.shear_forces.shape[0]
+
+
+def as_influence(fastener_group, reference_point=None) -> GroupInfluence:
+    """return the GroupInfluence of a fastener group, or the influence itself"""
+    if isinstance(fastener_group, GroupInfluence):
+        return fastener_group
+    return GroupInfluence(fastener_group, reference_point)
+
+
+def solve_load_cases(
+    fastener_group,
+    loads,
+    application_points=None,
+    reference_point=None,
+    interaction: tuple = None,
+    check_equilibrium: bool = False,
+) -> BatchResult:
+    """
+    Solve HSB 21030-01 for many load cases of one fastener group in one vectorized pass.
+
+    Equivalent to one Hsb2103001 per load case (first calculation, without the compression
+    iteration of iterate_calc).
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param loads: load cases (force_x, force_y, force_z, moment_x, moment_y, moment_z)
+    :type loads: array-like, (N, 6), LoadCaseSet
+    :param application_points: application points of the loads, (N, 3) or (3,), None if the
+        moments are given about the origin
+    :type application_points: array-like
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :param interaction: exponents (a, b) of the shear-tension interaction, if given the
+        combined reserve factors are calculated as well
+    :type interaction: tuple
+    :param check_equilibrium: calculate the equilibrium residuals of every case and flag
+        the cases in violation
+    :type check_equilibrium: bool
+    :return: fastener forces and reserve factors
+    :rtype: BatchResult
+    """
+    influence = as_influence(fastener_group, reference_point)
+    loads_u = loads_at_origin(loads, application_points)
+
+    force_fsy = loads_u @ influence.shear_y.T
+    force_fsz = loads_u @ influence.shear_z.T
+    shear_forces = np.hypot(force_fsy, force_fsz)
+    tension_forces = loads_u @ influence.tension.T
+
+    reserve_factor_combined = None
+    if interaction is not None:
+        reserve_factor_combined = (
+            np.trunc(
+                100
+                * interaction_reserve_factor(
+                    shear_forces / influence.shear_allowable,
+                    tension_forces / influence.tension_allowable,
+                    *interaction,
+                )
+            )
+            / 100
+        )
+
+    result = BatchResult(
+        force_fsy=force_fsy,
+        force_fsz=force_fsz,
+        shear_forces=shear_forces,
+        tension_forces=tension_forces,
+        reserve_factor_shear=reserve_factor(influence.shear_allowable, shear_forces),
+        reserve_factor_tension=reserve_factor(
+            influence.tension_allowable, tension_forces
+        ),
+        reserve_factor_combined=reserve_factor_combined,
+    )
+    if check_equilibrium:
+        residuals, applied = equilibrium_residuals(
+            influence, loads, result, application_points
+        )
+        result.equilibrium_residuals = residuals
+        result.equilibrium_violations = equilibrium_violations(residuals, applied)
+    return result
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class Envelope:
+    """
+    Per fastener envelope over load cases, updated chunk by chunk.
+
+    Tension reserve factors of fasteners in compression (negative RF) are not enveloped.
+    Combined (interaction) reserve factors are enveloped when the results carry them.
+
+    :param n_fasteners: number of fasteners
+    :type n_fasteners: int
+    """
+
+    n_fasteners: int
+    n_cases: int = field(init=False, default=0)
+    max_shear: np.ndarray = field(init=False)
+    max_shear_case: np.ndarray = field(init=False)
+    max_tension: np.ndarray = field(init=False)
+    max_tension_case: np.ndarray = field(init=False)
+    min_rf_shear: np.ndarray = field(init=False)
+    min_rf_shear_case: np.ndarray = field(init=False)
+    min_rf_tension: np.ndarray = field(init=False)
+    min_rf_tension_case: np.ndarray = field(init=False)
+    min_rf_combined: np.ndarray = field(init=False)
+    min_rf_combined_case: np.ndarray = field(init=False)
+
+    def __post_init__(self):
+        """
+        Post initialization of the envelope
+
+        """
+        size = self.n_fasteners
+        self.max_shear = np.full(size, -np.inf)
+        self.max_tension = np.full(size, -np.inf)
+        self.min_rf_shear = np.full(size, np.inf)
+        self.min_rf_tension = np.full(size, np.inf)
+        self.min_rf_combined = np.full(size, np.inf)
+        self.max_shear_case = np.full(size, -1)
+        self.max_tension_case = np.full(size, -1)
+        self.min_rf_shear_case = np.full(size, -1)
+        self.min_rf_tension_case = np.full(size, -1)
+        self.min_rf_combined_case = np.full(size, -1)
+
+    @classmethod
+    def from_result(cls, result: BatchResult, case_ids=None) -> "Envelope":
+        """
+        Envelope of one BatchResult
+
+        :param result: batch result
+        :type result: BatchResult
+        :param case_ids: case id of every row of the result, defaults to the row number
+        :type case_ids: array-like
+        :return: envelope
+        :rtype: Envelope
+        """
+        envelope = cls(result.shear_forces.shape[1])
+        envelope.update(result, case_ids)
+        return envelope
+
+    def _reduce(self, values, case_ids, name, use_max):
+        """update one enveloped quantity and its governing case"""
+        if values.shape[0] == 0:
+            return
+        rows = np.argmax(values, axis=0) if use_max else np.argmin(values, axis=0)
+        candidate = values[rows, np.arange(values.shape[1])]
+        current = getattr(self, name)
+        better = candidate > current if use_max else candidate < current
+        current[better] = candidate[better]
+        getattr(self, f"{name}_case")[better] = case_ids[rows[better]]
+
+    def update(self, result: BatchResult, case_ids=None) -> "Envelope":
+        """
+        Add the load cases of a BatchResult to the envelope
+
+        :param result: batch result
+        :type result: BatchResult
+        :param case_ids: case id of every row of the result, defaults to the running count
+        :type case_ids: array-like
+        :return: the updated envelope
+        :rtype: Envelope
+        """
+        n_rows = len(result)
+        if case_ids is None:
+            case_ids = np.arange(self.n_cases, self.n_cases + n_rows)
+        case_ids = np.asarray(case_ids)
+
+        rf_tension = np.where(
+            result.reserve_factor_tension > 0, result.reserve_factor_tension, np.inf
+        )
+        self._reduce(result.shear_forces, case_ids, "max_shear", True)
+        self._reduce(result.tension_forces, case_ids, "max_tension", True)
+        self._reduce(result.reserve_factor_shear, case_ids, "min_rf_shear", False)
+        self._reduce(rf_tension, case_ids, "min_rf_tension", False)
+        if result.reserve_factor_combined is not None:
+            self._reduce(
+                result.reserve_factor_combined, case_ids, "min_rf_combined", False
+            )
+        self.n_cases += n_rows
+        return self
+
+    def merge(self, other: "Envelope") -> "Envelope":
+        """
+        Merge another envelope (for the same fasteners) into this one
+
+        :param other: envelope to merge
+        :type other: Envelope
+        :return: the merged envelope
+        :rtype: Envelope
+        """
+        for name, use_max in (
+            ("max_shear", True),
+            ("max_tension", True),
+            ("min_rf_shear", False),
+            ("min_rf_tension", False),
+            ("min_rf_combined", False),
+        ):
+            mine = getattr(self, name)
+            theirs = getattr(other, name)
+            better = theirs > mine if use_max else theirs < mine
+            mine[better] = theirs[better]
+            getattr(self, f"{name}_case")[better] = getattr(other, f"{name}_case")[
+                better
+            ]
+        self.n_cases += other.n_cases
+        return self
+
+    def as_dict(self) -> dict:
+        """envelope as dictionary, e.g. for a pandas DataFrame"""
+        return {
+            "Max Shear Force": self.max_shear,
+            "Max Shear Case": self.max_shear_case,
+            "Max Tension Force": self.max_tension,
+            "Max Tension Case": self.max_tension_case,
+            "Min Shear Reserve Factor": self.min_rf_shear,
+            "Min Shear RF Case": self.min_rf_shear_case,
+            "Min Tension Reserve Factor": self.min_rf_tension,
+            "Min Tension RF Case": self.min_rf_tension_case,
+            "Min Combined Reserve Factor": self.min_rf_combined,
+            "Min Combined RF Case": self.min_rf_combined_case,
+        }
+
+
+def solve_combinations(
+    fastener_group,
+    combination: LoadCombination,
+    reference_point=None,
+    interaction: tuple = None,
+    chunk_size: int = None,
+) -> Envelope:
+    """
+    Envelope HSB 21030-01 over all cases of a lazy load combination.
+
+    The combined cases are generated chunk by chunk, solved and reduced into the envelope, the
+    full combined set is never materialized.
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param combination: combined load cases
+    :type combination: LoadCombination
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :param interaction: exponents (a, b) of the shear-tension interaction
+    :type interaction: tuple
+    :param chunk_size: number of combined cases per chunk, defaults to combination.chunk_size
+    :type chunk_size: int
+    :return: envelope, case ids are those of the combination
+    :rtype: Envelope
+    """
+    influence = as_influence(fastener_group, reference_point)
+    application_point = None
+    if np.any(combination.reference_point):
+        application_point = combination.reference_point
+    envelope = Envelope(influence.n_fasteners)
+    for case_ids, loads in combination.chunks(chunk_size):
+        envelope.update(
+            solve_load_cases(
+                influence, loads, application_point, interaction=interaction
+            ),
+            case_ids,
+        )
+    return envelope
+
+
+class Hsb2103001Workspace:
+    """
+    Reusable solver workspace for repeated single load case solves of one fastener group.
+
+    The influence coefficients are stacked once and all output and scratch arrays are
+    preallocated, so solve() does not allocate arrays. The returned result holds views on the
+    output buffers, which are overwritten by the next call unless an own result (see
+    allocate_result) is passed as out.
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    """
+
+    def __init__(self, fastener_group, reference_point=None):
+        """
+        Initialization of the workspace
+
+        """
+        self.influence = as_influence(fastener_group, reference_point)
+        n_fasteners = self.influence.n_fasteners
+        self.n_fasteners = n_fasteners
+        # rows: F_Sy,i, F_Sz,i and F_i of all fasteners
+        self.matrix = np.ascontiguousarray(
+            np.vstack(
+                [
+                    self.influence.shear_y,
+                    self.influence.shear_z,
+                    self.influence.tension,
+                ]
+            )
+        )
+        self.shear_allowable = self.influence.shear_allowable.copy()
+        self.tension_allowable = self.influence.tension_allowable.copy()
+        self.loads_u = np.empty(6)
+        self.forces = np.empty(3 * n_fasteners)
+        # the default output views the force buffer directly, no copies needed
+        self.result = self.allocate_result()
+        self.result.force_fsy = self.forces[:n_fasteners]
+        self.result.force_fsz = self.forces[n_fasteners : 2 * n_fasteners]
+        self.result.tension_forces = self.forces[2 * n_fasteners :]
+
+    def allocate_result(self) -> BatchResult:
+        """
+        Allocate an output buffer for solve(out=...)
+
+        :return: result with 1D arrays of length n_fasteners
+        :rtype: BatchResult
+        """
+        size = self.n_fasteners
+        return BatchResult(
+            force_fsy=np.empty(size),
+            force_fsz=np.empty(size),
+            shear_forces=np.empty(size),
+            tension_forces=np.empty(size),
+            reserve_factor_shear=np.empty(size),
+            reserve_factor_tension=np.empty(size),
+        )
+
+    def solve(
+        self, loads, application_point=None, out: BatchResult = None
+    ) -> BatchResult:
+        """
+        Solve one load case without allocating arrays.
+
+        :param loads: load case (force_x, force_y, force_z, moment_x, moment_y, moment_z)
+        :type loads: sequence of 6 floats
+        :param application_point: application point (x, y, z), None if the moments are given
+            about the origin
+        :type application_point: sequence of 3 floats
+        :param out: output buffer, defaults to the buffer of the workspace
+        :type out: BatchResult
+        :return: fastener forces and reserve factors of the load case
+        :rtype: BatchResult
+        """
+        out = self.result if out is None else out
+        loads_u = self.loads_u
+        loads_u[:] = loads
+        if application_point is not None:
+            x_p, y_p, z_p = application_point
+            force_x, force_y, force_z = loads_u[0], loads_u[1], loads_u[2]
+            loads_u[3] += y_p * force_z - z_p * force_y
+            loads_u[4] += z_p * force_x - x_p * force_z
+            loads_u[5] += x_p * force_y - y_p * force_x
+
+        np.dot(self.matrix, loads_u, out=self.forces)
+        if out is not self.result:
+            size = self.n_fasteners
+            out.force_fsy[:] = self.forces[:size]
+            out.force_fsz[:] = self.forces[size : 2 * size]
+            out.tension_forces[:] = self.forces[2 * size :]
+        np.hypot(out.force_fsy, out.force_fsz, out=out.shear_forces)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self._reserve_factor(
+                self.shear_allowable, out.shear_forces, out.reserve_factor_shear
+            )
+            self._reserve_factor(
+                self.tension_allowable, out.tension_forces, out.reserve_factor_tension
+            )
+        return out
+
+    @staticmethod
+    def _reserve_factor(allowable, force, out):
+        """in place version of reserve_factor"""
+        np.divide(allowable, force, out=out)
+        np.multiply(out, 100, out=out)
+        np.trunc(out, out=out)
+        np.divide(out, 100, out=out)
@@ -0,0 +1,283 @@
+"""pre-solve deduplication of fastener groups and load cases for HSB 21030-01"""
+
+import hashlib
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from pylantir.pyelbe.loads import Forces, Moments
+from pylantir.pyelbe.abstractions import ReferencePoint
+from pylantir.pyelbe.fasteners import Fastener, FastenerGroup
+from .hsb_21030_10 import Hsb2103001
+
+# number of decimals used when hashing coordinates, allowables and loads
+DECIMALS = 6
+
+
+def content_hash(*arrays, decimals: int = DECIMALS) -> str:
+    """
+    Hash the content of one or more arrays after rounding to a fixed number of decimals.
+
+    :param arrays: arrays (or array-likes) to hash, in order
+    :param decimals: number of decimals kept before hashing
+    :type decimals: int
+    :return: hex digest of the rounded content
+    :rtype: str
+    """
+    hasher = hashlib.sha1()
+    for arr in arrays:
+        # adding 0.0 turns -0.0 into 0.0 so both hash the same
+        rounded = np.round(np.asarray(arr, dtype=float), decimals) + 0.0
+        hasher.update(str(rounded.shape).encode())
+        hasher.update(np.ascontiguousarray(rounded).tobytes())
+    return hasher.hexdigest()
+
+
+def fastener_coordinates(fastener_group: FastenerGroup) -> np.ndarray:
+    """
+    Coordinates of the fasteners in a fastener group as a (n, 3) array
+
+    :param fastener_group: fastener group
+    :type fastener_group: FastenerGroup
+    :return: x, y and z coordinates of every fastener
+    :rtype: np.ndarray
+    """
+    return np.array(
+        [
+            (fastener.x_coord, fastener.y_coord, fastener.z_coord)
+            for fastener in fastener_group.fasteners
+        ],
+        dtype=float,
+    )
+
+
+def canonical_group(
+    fastener_group: FastenerGroup, decimals: int = DECIMALS
+) -> Tuple[str, np.ndarray]:
+    """
+    Translation invariant content hash of a fastener group.
+
+    The coordinates are taken relative to the lower corner of the bounding box of the group
+    (the canonical origin), so identical groups at different positions share the same key.
+    The fastener order and the shear and tension allowables are part of the key.
+
+    :param fastener_group: fastener group
+    :type fastener_group: FastenerGroup
+    :param decimals: number of decimals kept before hashing
+    :type decimals: int
+    :return: key of the group and the canonical origin in global coordinates
+    :rtype: tuple
+    """
+    coords = fastener_coordinates(fastener_group)
+    origin = coords.min(axis=0)
+    key = content_hash(
+        coords - origin,
+        fastener_group.shear,
+        fastener_group.tension,
+        decimals=decimals,
+    )
+    return key, origin
+
+
+def canonical_load(  # pylint: disable=too-many-arguments
+    forces,
+    moments,
+    application_point,
+    origin: np.ndarray,
+    decimals: int = DECIMALS,
+) -> Tuple[str, np.ndarray]:
+    r"""
+    Content hash of a load case, resolved at the canonical origin of a fastener group.
+
+    :math:`M_{O} = M_{P} + (r_{P} - r_{O}) \times F`
+
+    Load cases that differ only by the application point but give the same resultant at the
+    origin share the same key.
+
+    :param forces: forces (force_x, force_y, force_z)
+    :type forces: Forces
+    :param moments: moments about the application point (moment_x, moment_y, moment_z)
+    :type moments: Moments
+    :param application_point: point of application of the load
+    :type application_point: ReferencePoint
+    :param origin: canonical origin of the fastener group
+    :type origin: np.ndarray
+    :param decimals: number of decimals kept before hashing
+    :type decimals: int
+    :return: key of the load case and the six load components at the origin
+    :rtype: tuple
+    """
+    force = np.array([forces.force_x, forces.force_y, forces.force_z], dtype=float)
+    moment = np.array(
+        [moments.moment_x, moments.moment_y, moments.moment_z], dtype=float
+    )
+    lever = (
+        np.array(
+            [
+                application_point.x_coord,
+                application_point.y_coord,
+                application_point.z_coord,
+            ],
+            dtype=float,
+        )
+        - origin
+    )
+    loads = np.concatenate([force, moment + np.cross(lever, force)])
+    return content_hash(loads, decimals=decimals), loads
+
+
+def translate_group(
+    fastener_group: FastenerGroup, origin: np.ndarray, name: str = None
+) -> FastenerGroup:
+    """
+    Copy of a fastener group with the coordinates taken relative to a new origin
+
+    :param fastener_group: fastener group
+    :type fastener_group: FastenerGroup
+    :param origin: new origin in global coordinates
+    :type origin: np.ndarray
+    :param name: name of the new fastener group, defaults to the name of the group
+    :type name: str
+    :return: translated fastener group
+    :rtype: FastenerGroup
+    """
+    fasteners = [
+        Fastener(
+            name=fastener.name,
+            specification=fastener.specification,
+            shear_allowable=fastener.shear_allowable,
+            tension_allowable=fastener.tension_allowable,
+            x_coord=fastener.x_coord - origin[0],
+            y_coord=fastener.y_coord - origin[1],
+            z_coord=fastener.z_coord - origin[2],
+            material=fastener.material,
+        )
+        for fastener in fastener_group.fasteners
+    ]
+    return FastenerGroup(name or fastener_group.name, fasteners)
+
+
+@dataclass
+class DedupResult:
+    """
+    Results of a deduplicated HSB 21030-01 run.
+
+    :param calculations: one Hsb2103001 calculation per unique group / load combination,
+        solved in the canonical (translated) coordinate system
+    :type calculations: list
+    :param index: for every instance, the position of its calculation in calculations
+    :type index: np.ndarray
+    :param fastener_groups: the fastener group of every instance
+    :type fastener_groups: list
+    :param keys: (group key, load key) of every unique calculation
+    :type keys: list
+    """
+
+    calculations: List[Hsb2103001]
+    index: np.ndarray
+    fastener_groups: List[FastenerGroup] = field(repr=False)
+    keys: List[Tuple[str, str]] = field(repr=False)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, instance: int) -> Hsb2103001:
+        return self.calculations[self.index[instance]]
+
+    @property
+    def n_unique(self) -> int:
+        """number of solved unique combinations"""
+        return len(self.calculations)
+
+    def result_dict(self, instance: int) -> dict:
+        """
+        Result dictionary of one instance (as Hsb2103001.result_dict), with the coordinates of
+        the fasteners of that instance
+
+        :param instance: position of the instance
+        :type instance: int
+        :return: fastener results
+        :rtype: dict
+        """
+        result = dict(self[instance].result_dict)
+        fastener_group = self.fastener_groups[instance]
+        result["X"] = fastener_group.x_array
+        result["Y"] = fastener_group.y_array
+        return result
+
+    def fan_out(self) -> List[dict]:
+        """
+        Fan the unique results back out to all instances
+
+        :return: one result dictionary per instance
+        :rtype: list
+        """
+        return [self.result_dict(instance) for instance in range(len(self))]
+
+
+def solve_deduplicated(
+    instances: Iterable[tuple], decimals: int = DECIMALS
+) -> DedupResult:
+    """
+    Solve HSB 21030-01 once per unique fastener group / load case combination.
+
+    Every instance is a tuple (fastener_group, forces, moments, application_point), the moments
+    being given about the application point and the reference point U being the origin, as in
+    Hsb2103001. Groups are canonicalized by their translation invariant coordinates and
+    allowables, load cases by the load vector resolved at the canonical origin of the group.
+    Each unique combination is solved once, in the canonical coordinate system.
+
+    :param instances: (fastener_group, forces, moments, application_point) tuples
+    :type instances: iterable
+    :param decimals: number of decimals kept before hashing
+    :type decimals: int
+    :return: unique calculations and the mapping of instances onto them
+    :rtype: DedupResult
+    """
+    group_cache = {}
+    canonical_groups = {}
+    positions = {}
+    calculations = []
+    keys = []
+    index = []
+    fastener_groups = []
+    origin_point = ReferencePoint(name="U", x_coord=0, y_coord=0, z_coord=0)
+
+    for fastener_group, forces, moments, application_point in instances:
+        # groups are usually shared between many load cases, hash them once
+        if id(fastener_group) not in group_cache:
+            group_cache[id(fastener_group)] = canonical_group(fastener_group, decimals)
+        group_key, origin = group_cache[id(fastener_group)]
+        load_key, loads = canonical_load(
+            forces, moments, application_point, origin, decimals
+        )
+        key = (group_key, load_key)
+
+        if key not in positions:
+            if group_key not in canonical_groups:
+                canonical_groups[group_key] = translate_group(
+                    fastener_group, origin, f"{fastener_group.name}_canonical"
+                )
+            positions[key] = len(calculations)
+            keys.append(key)
+            calculations.append(
+                Hsb2103001(
+                    name=f"unique_{len(calculations)}",
+                    fastener_group=canonical_groups[group_key],
+                    forces=Forces("forces", *loads[:3]),
+                    moments=Moments("moments", *loads[3:]),
+                    application_point=origin_point,
+                    reference_point=origin_point,
+                )
+            )
+
+        index.append(positions[key])
+        fastener_groups.append(fastener_group)
+
+    return DedupResult(
+        calculations=calculations,
+        index=np.array(index, dtype=int),
+        fastener_groups=fastener_groups,
+        keys=keys,
+    )
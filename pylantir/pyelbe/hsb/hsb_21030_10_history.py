@@ -0,0 +1,165 @@
+"""per fastener force histories of long load time series with HSB 21030-01
+
+The load independent part of the method (GroupInfluence) is computed once for the fastener
+group; every chunk of the (T, 6) load history is then one matrix product. Histories are read
+through memory maps and the float32 force histories are written to NPY files on disk, so
+neither has to fit in memory.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from pylantir.pyelbe.load_transfer import transfer_loads
+from .hsb_21030_10_batch import as_influence
+
+# default number of samples per chunk
+CHUNK_SIZE = 262144
+
+
+def transfer_matrix(from_point) -> np.ndarray:
+    r"""
+    Matrix moving loads from a point to the origin, :math:`L_{U} = T L_{P}`
+
+    :math:`T = [[I, 0], [\tilde{r}_{P}, I]]` with :math:`\tilde{r}_{P} F = r_{P} \times F`
+
+    :param from_point: point the moments are given about (x, y, z)
+    :type from_point: array-like
+    :return: transfer matrix, (6, 6)
+    :rtype: np.ndarray
+    """
+    return transfer_loads(np.eye(6), from_point).T
+
+
+def history_influence(fastener_group, application_point=None, reference_point=None):
+    """
+    Influence matrix of the fastener forces on the loads of a history, (6, 3 n): the columns
+    are F_{S,y}, F_{S,z} and F of all n fasteners for loads about the application point
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param application_point: point the moments of the history are given about, defaults
+        to the origin
+    :type application_point: array-like
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :return: influence matrix
+    :rtype: np.ndarray
+    """
+    influence = as_influence(fastener_group, reference_point)
+    matrix = np.vstack([influence.shear_y, influence.shear_z, influence.tension])
+    if application_point is not None:
+        matrix = matrix @ transfer_matrix(application_point)
+    return np.ascontiguousarray(matrix.T)
+
+
+@dataclass
+class FastenerHistories:
+    """
+    Force histories of all fasteners of a group, arrays (T, n_fasteners), memory maps when
+    written to disk
+
+    :param shear: shear force magnitude
+    :type shear: np.ndarray
+    :param tension: tensile force
+    :type tension: np.ndarray
+    :param shear_y: shear force in y, only if requested
+    :type shear_y: np.ndarray
+    :param shear_z: shear force in z, only if requested
+    :type shear_z: np.ndarray
+    """
+
+    shear: np.ndarray
+    tension: np.ndarray
+    shear_y: np.ndarray = None
+    shear_z: np.ndarray = None
+
+    def __len__(self) -> int:
+        return self.shear.shape[0]
+
+
+def _output_array(output, name: str, shape: tuple, dtype) -> np.ndarray:
+    """in memory array, or a NPY memory map in the output directory"""
+    if output is None:
+        return np.empty(shape, dtype=dtype)
+    return np.lib.format.open_memmap(
+        Path(output) / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+    )
+
+
+def fastener_histories(  # pylint: disable=too-many-arguments,too-many-locals
+    fastener_group,
+    history,
+    application_point=None,
+    reference_point=None,
+    output=None,
+    chunk_size: int = CHUNK_SIZE,
+    dtype=np.float32,
+    shear_components: bool = False,
+) -> FastenerHistories:
+    """
+    Map a (T, 6) load history to the shear and tension force histories of every fastener.
+
+    Equivalent to one Hsb2103001 per sample (without the compression iteration), computed as
+    one matrix product per chunk of samples.
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param history: load history (force_x, force_y, force_z, moment_x, moment_y, moment_z),
+        (T, 6), or the path of a NPY file holding it (read through a memory map)
+    :type history: array-like, str, Path
+    :param application_point: point the moments of the history are given about, defaults
+        to the origin
+    :type application_point: array-like
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :param output: directory for shear.npy and tension.npy (and shear_y.npy, shear_z.npy),
+        created if missing; None to keep the histories in memory
+    :type output: str, Path
+    :param chunk_size: number of samples per chunk
+    :type chunk_size: int
+    :param dtype: data type of the force histories
+    :type dtype: np.dtype
+    :param shear_components: also keep the y and z shear force histories
+    :type shear_components: bool
+    :return: force histories
+    :rtype: FastenerHistories
+    """
+    if isinstance(history, (str, Path)):
+        history = np.load(history, mmap_mode="r")
+    else:
+        history = np.asarray(history, dtype=float)
+    if history.ndim != 2 or history.shape[1] != 6:
+        raise ValueError(f"expected a (T, 6) load history, got {history.shape}")
+    matrix = history_influence(fastener_group, application_point, reference_point)
+    n_fasteners = matrix.shape[1] // 3
+    n_samples = history.shape[0]
+
+    if output is not None:
+        Path(output).mkdir(parents=True, exist_ok=True)
+    shape = (n_samples, n_fasteners)
+    result = FastenerHistories(
+        shear=_output_array(output, "shear", shape, dtype),
+        tension=_output_array(output, "tension", shape, dtype),
+    )
+    if shear_components:
+        result.shear_y = _output_array(output, "shear_y", shape, dtype)
+        result.shear_z = _output_array(output, "shear_z", shape, dtype)
+
+    for start in range(0, n_samples, chunk_size):
+        rows = slice(start, min(start + chunk_size, n_samples))
+        forces = np.asarray(history[rows], dtype=float) @ matrix
+        force_fsy = forces[:, :n_fasteners]
+        force_fsz = forces[:, n_fasteners : 2 * n_fasteners]
+        result.shear[rows] = np.hypot(force_fsy, force_fsz)
+        result.tension[rows] = forces[:, 2 * n_fasteners :]
+        if shear_components:
+            result.shear_y[rows] = force_fsy
+            result.shear_z[rows] = force_fsz
+
+    if output is not None:
+        for array in (result.shear, result.tension, result.shear_y, result.shear_z):
+            if array is not None:
+                array.flush()
+    return result
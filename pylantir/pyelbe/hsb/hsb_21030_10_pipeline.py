@@ -0,0 +1,296 @@
+"""streaming HSB 21030-01 pipeline: load files -> transformation -> solve -> reduce / write
+
+Every stage is a generator working on one chunk of load cases at a time, so the memory in use
+is bounded by the chunk size and the number of chunks read ahead, not by the length of the
+load file.
+"""
+
+from pathlib import Path
+import queue
+import threading
+from typing import Callable, Iterable, Iterator, Tuple
+
+import numpy as np
+import pandas as pd
+
+from pylantir.pyelbe.loads import (
+    LOAD_CASE_DTYPE,
+    LOAD_COMPONENTS,
+    POINT_COMPONENTS,
+    LoadCaseSet,
+)
+from .hsb_21030_10_batch import BatchResult, Envelope, as_influence, solve_load_cases
+
+# default number of load cases per chunk
+CHUNK_SIZE = 65536
+# columns of the written fastener results, named as in riv_field
+RESULT_COLUMNS = ("case_id", "fastener", "Fsy", "Fsz", "Fs", "Ft", "RFs", "RFt")
+
+
+def read_csv_chunks(
+    path, chunk_size: int = CHUNK_SIZE, case_id_column: str = "case_id", **kwargs
+) -> Iterator[LoadCaseSet]:
+    """
+    Read load cases from a CSV file chunk by chunk.
+
+    The file needs the columns force_x, force_y, force_z, moment_x, moment_y and moment_z; the
+    application point columns x_coord, y_coord and z_coord and the case id column are
+    optional (origin and running row number if missing).
+
+    :param path: CSV file
+    :type path: str, Path
+    :param chunk_size: number of load cases per chunk
+    :type chunk_size: int
+    :param case_id_column: name of the case id column
+    :type case_id_column: str
+    :param kwargs: passed to pandas.read_csv
+    :return: load case chunks
+    :rtype: iterator
+    """
+    start = 0
+    with pd.read_csv(path, chunksize=chunk_size, **kwargs) as reader:
+        for frame in reader:
+            n_rows = len(frame)
+            points = None
+            if all(column in frame for column in POINT_COMPONENTS):
+                points = frame[list(POINT_COMPONENTS)].to_numpy(dtype=float)
+            case_ids = np.arange(start, start + n_rows)
+            if case_id_column in frame:
+                case_ids = frame[case_id_column].to_numpy()
+            yield LoadCaseSet.from_arrays(
+                frame[list(LOAD_COMPONENTS)].to_numpy(dtype=float), points, case_ids
+            )
+            start += n_rows
+
+
+def read_npy_chunks(path, chunk_size: int = CHUNK_SIZE) -> Iterator[LoadCaseSet]:
+    """
+    Read load cases from a NPY file chunk by chunk, through a memory map.
+
+    The array is either structured with LOAD_CASE_DTYPE or plain (N, 6) loads about the origin
+    or (N, 9) loads followed by the application point.
+
+    :param path: NPY file
+    :type path: str, Path
+    :param chunk_size: number of load cases per chunk
+    :type chunk_size: int
+    :return: load case chunks
+    :rtype: iterator
+    """
+    array = np.load(path, mmap_mode="r")
+    if array.dtype == LOAD_CASE_DTYPE:
+        for start in range(0, array.shape[0], chunk_size):
+            yield LoadCaseSet(np.array(array[start : start + chunk_size]))
+        return
+    if array.ndim != 2 or array.shape[1] not in (6, 9):
+        raise ValueError(f"expected (N, 6) or (N, 9) load cases, got {array.shape}")
+    for start in range(0, array.shape[0], chunk_size):
+        block = np.asarray(array[start : start + chunk_size], dtype=float)
+        yield LoadCaseSet.from_arrays(
+            block[:, :6],
+            block[:, 6:] if block.shape[1] == 9 else None,
+            np.arange(start, start + block.shape[0]),
+        )
+
+
+def read_chunks(path, chunk_size: int = CHUNK_SIZE, **kwargs) -> Iterator[LoadCaseSet]:
+    """
+    Read load cases chunk by chunk, from a CSV or NPY file depending on the suffix
+
+    :param path: CSV or NPY file
+    :type path: str, Path
+    :param chunk_size: number of load cases per chunk
+    :type chunk_size: int
+    :param kwargs: passed to read_csv_chunks
+    :return: load case chunks
+    :rtype: iterator
+    """
+    if Path(path).suffix.lower() == ".npy":
+        return read_npy_chunks(path, chunk_size)
+    return read_csv_chunks(path, chunk_size, **kwargs)
+
+
+def prefetch(chunks: Iterable, max_pending: int = 2) -> Iterator:
+    """
+    Produce chunks in a background thread, at most max_pending ahead of the consumer.
+
+    The bounded queue is the backpressure: reading blocks while the solver is behind, so the
+    memory is limited to max_pending chunks whatever the speed of either side.
+
+    :param chunks: chunk producer, e.g. read_chunks(...)
+    :type chunks: iterable
+    :param max_pending: maximum number of chunks read ahead, 0 to read in the calling thread
+    :type max_pending: int
+    :return: the chunks, in order
+    :rtype: iterator
+    """
+    if max_pending <= 0:
+        yield from chunks
+        return
+
+    pending = queue.Queue(maxsize=max_pending)
+    done = object()
+    stop = threading.Event()
+
+    def put(item) -> bool:
+        # wait for room in the queue, give up once the consumer has stopped
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+            put(done)
+        except Exception as error:  # pylint: disable=broad-except
+            put(error)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = pending.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+def solve_chunks(
+    fastener_group,
+    chunks: Iterable[LoadCaseSet],
+    reference_point=None,
+    interaction: tuple = None,
+    transform: Callable[[LoadCaseSet], LoadCaseSet] = None,
+) -> Iterator[Tuple[LoadCaseSet, BatchResult]]:
+    """
+    Solve HSB 21030-01 chunk by chunk.
+
+    Each chunk is transformed (optional, e.g. into the joint coordinate system), resolved at
+    the reference point of the joint and solved for all its cases at once.
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param chunks: load case chunks
+    :type chunks: iterable
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :param interaction: exponents (a, b) of the shear-tension interaction
+    :type interaction: tuple
+    :param transform: function applied to every chunk before solving
+    :type transform: callable
+    :return: load cases and results of every chunk
+    :rtype: iterator
+    """
+    influence = as_influence(fastener_group, reference_point)
+    for chunk in chunks:
+        if transform is not None:
+            chunk = transform(chunk)
+        yield chunk, solve_load_cases(influence, chunk, interaction=interaction)
+
+
+def result_frame(load_cases: LoadCaseSet, result: BatchResult) -> pd.DataFrame:
+    """
+    Fastener results of one chunk in long format, one row per case and fastener
+
+    :param load_cases: load cases of the chunk
+    :type load_cases: LoadCaseSet
+    :param result: results of the chunk
+    :type result: BatchResult
+    :return: results with RESULT_COLUMNS
+    :rtype: pd.DataFrame
+    """
+    n_cases, n_fasteners = result.shear_forces.shape
+    columns = [
+        np.repeat(load_cases.case_ids, n_fasteners),
+        np.tile(np.arange(n_fasteners), n_cases),
+        result.force_fsy.ravel(),
+        result.force_fsz.ravel(),
+        result.shear_forces.ravel(),
+        result.tension_forces.ravel(),
+        result.reserve_factor_shear.ravel(),
+        result.reserve_factor_tension.ravel(),
+    ]
+    return pd.DataFrame(dict(zip(RESULT_COLUMNS, columns)))
+
+
+def write_results(
+    solved: Iterable[Tuple[LoadCaseSet, BatchResult]], path
+) -> Iterator[Tuple[LoadCaseSet, BatchResult]]:
+    """
+    Append the results of every chunk to a CSV file and pass the chunks on
+
+    :param solved: load cases and results of every chunk
+    :type solved: iterable
+    :param path: CSV file, overwritten
+    :type path: str, Path
+    :return: the input chunks
+    :rtype: iterator
+    """
+    header = True
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        for load_cases, result in solved:
+            result_frame(load_cases, result).to_csv(file, header=header, index=False)
+            header = False
+            yield load_cases, result
+
+
+def run_pipeline(  # pylint: disable=too-many-arguments
+    fastener_group,
+    path,
+    chunk_size: int = CHUNK_SIZE,
+    max_pending: int = 2,
+    reference_point=None,
+    interaction: tuple = None,
+    transform: Callable[[LoadCaseSet], LoadCaseSet] = None,
+    output=None,
+) -> Envelope:
+    """
+    Stream a load file through HSB 21030-01 and envelope the results.
+
+    read (CSV / NPY, chunk_size cases, max_pending chunks ahead) -> transform -> solve ->
+    write (optional) -> envelope
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param path: CSV or NPY load file
+    :type path: str, Path
+    :param chunk_size: number of load cases per chunk
+    :type chunk_size: int
+    :param max_pending: maximum number of chunks read ahead of the solver
+    :type max_pending: int
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :param interaction: exponents (a, b) of the shear-tension interaction
+    :type interaction: tuple
+    :param transform: function applied to every chunk before solving
+    :type transform: callable
+    :param output: CSV file for the fastener results of every case, None to only envelope
+    :type output: str, Path
+    :return: envelope over all load cases, case ids as in the load file
+    :rtype: Envelope
+    """
+    influence = as_influence(fastener_group, reference_point)
+    solved = solve_chunks(
+        influence,
+        prefetch(read_chunks(path, chunk_size), max_pending),
+        interaction=interaction,
+        transform=transform,
+    )
+    if output is not None:
+        solved = write_results(solved, output)
+
+    envelope = Envelope(influence.n_fasteners)
+    for load_cases, result in solved:
+        envelope.update(result, load_cases.case_ids)
+    return envelope
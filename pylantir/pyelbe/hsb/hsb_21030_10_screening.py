@@ -0,0 +1,244 @@
+"""load case screening for HSB 21030-01 fastener analysis"""
+
+from dataclasses import dataclass, field
+import math
+
+import numpy as np
+
+from .hsb_21030_10_batch import (
+    Envelope,
+    as_influence,
+    loads_at_origin,
+    solve_load_cases,
+)
+
+SCREENING_METHODS = ("influence", "directions", "hull")
+
+
+def direction_candidates(loads: np.ndarray, directions: np.ndarray) -> np.ndarray:
+    """
+    Load cases that are extreme in at least one of the given directions.
+
+    Every case maximizing the projection on a direction is a vertex of the convex hull of the
+    load case cloud, so this is a cheap inner approximation of the hull vertices.
+
+    :param loads: load cases, (N, 6)
+    :type loads: np.ndarray
+    :param directions: directions in load space, (K, 6)
+    :type directions: np.ndarray
+    :return: sorted unique indices of the extreme cases
+    :rtype: np.ndarray
+    """
+    return np.unique(np.argmax(loads @ directions.T, axis=0))
+
+
+def random_directions(n_directions: int, seed=None) -> np.ndarray:
+    """
+    Uniformly distributed unit directions in the 6 dimensional load space, including the
+    positive and negative axes
+
+    :param n_directions: number of random directions
+    :type n_directions: int
+    :param seed: seed of the random generator
+    :type seed: int
+    :return: directions, (n_directions + 12, 6)
+    :rtype: np.ndarray
+    """
+    axes = np.vstack([np.eye(6), -np.eye(6)])
+    sample = np.random.default_rng(seed).normal(size=(n_directions, 6))
+    sample /= np.linalg.norm(sample, axis=1, keepdims=True)
+    return np.vstack([axes, sample])
+
+
+def hull_candidates(loads: np.ndarray) -> np.ndarray:
+    """
+    Vertices of the convex hull of the load case cloud (scipy / Qhull).
+
+    Degenerate clouds (e.g. a load component that is zero in all cases) are handled by
+    joggling the input.
+
+    :param loads: load cases, (N, 6)
+    :type loads: np.ndarray
+    :return: sorted indices of the hull vertices
+    :rtype: np.ndarray
+    """
+    from scipy.spatial import ConvexHull  # pylint: disable=import-outside-toplevel
+
+    # drop constant components, the hull lives in the remaining subspace
+    active = np.ptp(loads, axis=0) > 0
+    if not active.any():
+        return np.array([0])
+    points = loads[:, active]
+    if points.shape[0] <= points.shape[1] + 1:
+        return np.arange(points.shape[0])
+    scale = np.ptp(points, axis=0)
+    hull = ConvexHull(points / scale, qhull_options="QJ")
+    return np.unique(hull.vertices)
+
+
+def influence_candidates(influence, loads: np.ndarray, n_angles: int = 8) -> np.ndarray:
+    r"""
+    Load cases that can be critical for at least one fastener of a group.
+
+    The tensile force of each fastener is linear in the loads, so its extremes are the cases
+    with the largest and smallest projection on the tension row of the influence matrix.
+    The shear force is the norm of two linear functions; with n_angles directions in that
+    plane every case is projected, and all cases with a projection within
+    :math:`cos(\pi / n_{angles})` of the largest one are kept, which always includes the
+    case with the largest shear force.
+
+    :param influence: influence coefficients of the fastener group
+    :type influence: GroupInfluence
+    :param loads: load cases about the origin, (N, 6)
+    :type loads: np.ndarray
+    :param n_angles: number of directions in the shear plane
+    :type n_angles: int
+    :return: sorted unique indices of the candidate cases
+    :rtype: np.ndarray
+    """
+    tension = loads @ influence.tension.T
+    candidates = [np.argmax(tension, axis=0), np.argmin(tension, axis=0)]
+
+    angles = 2 * np.pi * np.arange(n_angles) / n_angles
+    force_fsy = loads @ influence.shear_y.T
+    force_fsz = loads @ influence.shear_z.T
+    projection = np.max(
+        force_fsy[:, :, None] * np.cos(angles) + force_fsz[:, :, None] * np.sin(angles),
+        axis=2,
+    )
+    threshold = np.max(projection, axis=0) * math.cos(np.pi / n_angles)
+    candidates.append(np.nonzero((projection >= threshold).any(axis=1))[0])
+
+    return np.unique(np.concatenate(candidates))
+
+
+@dataclass
+class ScreeningResult:
+    """
+    Result of a screened HSB 21030-01 run
+
+    :param indices: indices of the load cases passed to the solver
+    :type indices: np.ndarray
+    :param n_cases: number of load cases before screening
+    :type n_cases: int
+    :param envelope: envelope of the screened cases, case ids refer to the full set
+    :type envelope: Envelope
+    :param full_envelope: envelope of the full set, only if verified
+    :type full_envelope: Envelope
+    """
+
+    indices: np.ndarray
+    n_cases: int
+    envelope: Envelope
+    full_envelope: Envelope = field(default=None, repr=False)
+
+    @property
+    def reduction(self) -> float:
+        """ratio of the number of cases before and after screening"""
+        return self.n_cases / max(len(self.indices), 1)
+
+    @property
+    def verified(self) -> bool:
+        """True if the screened envelope equals the envelope of the full set"""
+        if self.full_envelope is None:
+            return False
+        return bool(
+            np.allclose(self.envelope.max_shear, self.full_envelope.max_shear)
+            and np.allclose(self.envelope.max_tension, self.full_envelope.max_tension)
+        )
+
+
+def screen_load_cases(  # pylint: disable=too-many-arguments
+    fastener_group,
+    loads,
+    application_points=None,
+    method: str = "influence",
+    n_angles: int = 8,
+    n_directions: int = 256,
+    seed=None,
+) -> np.ndarray:
+    """
+    Select the load cases that can be critical for a fastener group.
+
+    methods:
+        - "influence": exact for the fastener forces of the group (see influence_candidates)
+        - "directions": cheap approximation of the convex hull vertices of the load cloud by
+          random direction sampling, independent of the group
+        - "hull": exact convex hull vertices of the load cloud (requires scipy)
+
+    :param fastener_group: fastener group or its GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param loads: load cases, (N, 6)
+    :type loads: array-like
+    :param application_points: application points, (N, 3) or (3,)
+    :type application_points: array-like
+    :param method: screening method
+    :type method: str
+    :param n_angles: number of directions in the shear plane ("influence")
+    :type n_angles: int
+    :param n_directions: number of random directions ("directions")
+    :type n_directions: int
+    :param seed: seed of the random directions ("directions")
+    :type seed: int
+    :return: sorted indices of the retained load cases
+    :rtype: np.ndarray
+    """
+    if method not in SCREENING_METHODS:
+        raise ValueError(f"method must be one of {SCREENING_METHODS}, got {method}")
+    loads_u = loads_at_origin(loads, application_points)
+
+    if method == "influence":
+        return influence_candidates(as_influence(fastener_group), loads_u, n_angles)
+
+    # scale the components so forces and moments weigh the same in the directions
+    scale = np.abs(loads_u).max(axis=0)
+    scale[scale == 0] = 1
+    if method == "directions":
+        return direction_candidates(
+            loads_u / scale, random_directions(n_directions, seed)
+        )
+    return hull_candidates(loads_u / scale)
+
+
+def solve_screened(  # pylint: disable=too-many-arguments
+    fastener_group,
+    loads,
+    application_points=None,
+    method: str = "influence",
+    verify: bool = False,
+    **kwargs,
+) -> ScreeningResult:
+    """
+    Screen the load cases and solve HSB 21030-01 for the retained cases only.
+
+    :param fastener_group: fastener group or its GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param loads: load cases, (N, 6)
+    :type loads: array-like
+    :param application_points: application points, (N, 3) or (3,)
+    :type application_points: array-like
+    :param method: screening method, see screen_load_cases
+    :type method: str
+    :param verify: also solve the full set and keep its envelope for comparison
+    :type verify: bool
+    :param kwargs: passed to screen_load_cases
+    :return: retained cases and their envelope
+    :rtype: ScreeningResult
+    """
+    influence = as_influence(fastener_group)
+    loads_u = loads_at_origin(loads, application_points)
+    indices = screen_load_cases(influence, loads_u, method=method, **kwargs)
+
+    envelope = Envelope.from_result(
+        solve_load_cases(influence, loads_u[indices]), case_ids=indices
+    )
+    full_envelope = None
+    if verify:
+        full_envelope = Envelope.from_result(solve_load_cases(influence, loads_u))
+
+    return ScreeningResult(
+        indices=indices,
+        n_cases=loads_u.shape[0],
+        envelope=envelope,
+        full_envelope=full_envelope,
+    )
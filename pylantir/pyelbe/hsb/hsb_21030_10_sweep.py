@@ -0,0 +1,164 @@
+r"""load introduction point sweep for HSB 21030-01
+
+For a fixed load (forces and moments about the application point P) the loads about the
+reference point U are affine in P (moment_x_reference and friends):
+
+:math:`M_{U} = M_{P} + r_{P} \times F`
+
+and the fastener forces are linear in the loads about U, so every fastener force is affine in
+the coordinates of P. Four solves (P at the origin and at the three unit offsets) give the
+coefficients; the forces and reserve factors of a whole grid of application points follow in
+closed form.
+"""
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .hsb_21030_10_batch import (
+    as_influence,
+    interaction_reserve_factor,
+    reserve_factor,
+    solve_load_cases,
+)
+
+
+def grid_points(x_coords, y_coords, z_coords) -> np.ndarray:
+    """
+    Regular grid of application points
+
+    :param x_coords: x coordinates of the grid
+    :type x_coords: array-like
+    :param y_coords: y coordinates of the grid
+    :type y_coords: array-like
+    :param z_coords: z coordinates of the grid
+    :type z_coords: array-like
+    :return: points, (nx, ny, nz, 3)
+    :rtype: np.ndarray
+    """
+    return np.stack(
+        np.meshgrid(x_coords, y_coords, z_coords, indexing="ij"), axis=-1
+    ).astype(float)
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass
+class SweepResult:
+    """
+    Fastener forces and reserve factors over a grid of application points, arrays of shape
+    points.shape[:-1] + (n_fasteners,); the RF maps are the minimum over the fasteners.
+
+    Names follow the attributes of Hsb2103001.
+    """
+
+    points: np.ndarray = field(repr=False)
+    force_fsy: np.ndarray = field(repr=False)
+    force_fsz: np.ndarray = field(repr=False)
+    shear_forces: np.ndarray = field(repr=False)
+    tension_forces: np.ndarray = field(repr=False)
+    reserve_factor_shear: np.ndarray = field(repr=False)
+    reserve_factor_tension: np.ndarray = field(repr=False)
+    reserve_factor_combined: np.ndarray = field(default=None, repr=False)
+
+    @property
+    def min_rf_shear(self) -> np.ndarray:
+        """minimum shear RF of the group at every point"""
+        return self.reserve_factor_shear.min(axis=-1)
+
+    @property
+    def min_rf_tension(self) -> np.ndarray:
+        """minimum tension RF of the group at every point, fasteners in tension only"""
+        return np.where(
+            self.reserve_factor_tension > 0, self.reserve_factor_tension, np.inf
+        ).min(axis=-1)
+
+    @property
+    def min_rf_combined(self) -> np.ndarray:
+        """minimum combined RF of the group at every point, if calculated"""
+        if self.reserve_factor_combined is None:
+            return None
+        return self.reserve_factor_combined.min(axis=-1)
+
+    def best_point(self, rf_map: str = "min_rf_shear") -> np.ndarray:
+        """
+        Application point with the highest value of an RF map
+
+        :param rf_map: name of the RF map
+        :type rf_map: str
+        :return: coordinates of the point
+        :rtype: np.ndarray
+        """
+        values = getattr(self, rf_map)
+        return self.points.reshape(-1, 3)[np.argmax(values.ravel())]
+
+
+def application_point_sweep(
+    fastener_group,
+    loads,
+    points,
+    reference_point=None,
+    interaction: tuple = None,
+) -> SweepResult:
+    """
+    Evaluate HSB 21030-01 for one load over many application points.
+
+    :param fastener_group: fastener group or its precomputed GroupInfluence
+    :type fastener_group: FastenerGroup, GroupInfluence
+    :param loads: load about the application point (force_x, force_y, force_z, moment_x,
+        moment_y, moment_z)
+    :type loads: array-like, (6,)
+    :param points: application points, (..., 3), e.g. from grid_points
+    :type points: array-like
+    :param reference_point: reference point U, ignored if a GroupInfluence is given
+    :type reference_point: namedtuple
+    :param interaction: exponents (a, b) of the shear-tension interaction, if given the
+        combined reserve factors are calculated as well
+    :type interaction: tuple
+    :return: forces and reserve factors at every point
+    :rtype: SweepResult
+    """
+    influence = as_influence(fastener_group, reference_point)
+    loads = np.asarray(loads, dtype=float).reshape(6)
+    points = np.asarray(points, dtype=float)
+
+    # four solves: P at the origin and at the unit offsets give the affine coefficients
+    basis = solve_load_cases(
+        influence, np.tile(loads, (4, 1)), np.vstack([np.zeros(3), np.eye(3)])
+    )
+    shape = points.shape[:-1] + (influence.n_fasteners,)
+
+    def affine(values):
+        gradient = values[1:] - values[0]
+        return (values[0] + points.reshape(-1, 3) @ gradient).reshape(shape)
+
+    force_fsy = affine(basis.force_fsy)
+    force_fsz = affine(basis.force_fsz)
+    shear_forces = np.hypot(force_fsy, force_fsz)
+    tension_forces = affine(basis.tension_forces)
+
+    reserve_factor_combined = None
+    if interaction is not None:
+        reserve_factor_combined = (
+            np.trunc(
+                100
+                * interaction_reserve_factor(
+                    shear_forces / influence.shear_allowable,
+                    tension_forces / influence.tension_allowable,
+                    *interaction,
+                )
+            )
+            / 100
+        )
+
+    return SweepResult(
+        points=points,
+        force_fsy=force_fsy,
+        force_fsz=force_fsz,
+        shear_forces=shear_forces,
+        tension_forces=tension_forces,
+        reserve_factor_shear=reserve_factor(influence.shear_allowable, shear_forces),
+        reserve_factor_tension=reserve_factor(
+            influence.tension_allowable, tension_forces
+        ),
+        reserve_factor_combined=reserve_factor_combined,
+    )
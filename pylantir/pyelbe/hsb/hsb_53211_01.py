@@ -0,0 +1,458 @@
+r"""HSB 53211-01 crippling strength of short metallic sections in compression
+
+The section is idealized as flat plate elements of constant thickness, simply supported
+along their unloaded sides, see Figure 1 for the average widths :math:`b_{i} = A_{i} / t_{i}`
+of the elements of bended and extruded sections.
+
+All functions work on arrays of elements, (..., n_elements), with any leading dimensions
+for catalogues of profiles. Elements with zero width are padding and do not count.
+
+- buckling factor :math:`K_{i} = k_{i} \pi^{2} / (12 (1 - \nu^{2}))`, :math:`k_{i}` = 0.43
+  for elements supported at one side and 4.0 for elements supported at both sides (HSB
+  45111-01)
+- buckling parameter :math:`x_{i} = \frac{b_{i}}{t_{i}} \sqrt{\frac{R_{p0.2}}{K_{i} E_{c}}}`
+- crippling load :math:`F_{crip} = \sum \sigma_{crip,i} A_{i}`, :math:`\sigma_{crip,i} =
+  y_{i} R_{p0.2}`
+
+The effective section under a given load follows from the effective width of the elements
+at the stress of their supported edges, :math:`b_{eff,i} = b_{i} \min(1, \sqrt{\sigma_{cr,i}
+/ \sigma})`, with :math:`\sigma = F / A_{eff}(\sigma)` solved by fixed point iteration for
+all profiles at once.
+"""
+
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+from .hsb_profiles_batch import _bended
+
+# pylint: disable=C0103
+
+# buckling factors k of the elements by number of supported sides (HSB 45111-01)
+BUCKLING_FACTORS = {1: 0.43, 2: 4.0}
+TOLERANCE = 1e-9
+MAX_ITERATIONS = 100
+
+
+@dataclass
+class SectionElements:
+    """
+    Plate elements of sections, arrays of shape (..., n_elements)
+
+    :param a: outside width of the elements
+    :type a: np.ndarray
+    :param b: average width of the elements
+    :type b: np.ndarray
+    :param t: thickness of the elements
+    :type t: np.ndarray
+    :param k: buckling factor of the elements
+    :type k: np.ndarray
+    """
+
+    a: np.ndarray
+    b: np.ndarray
+    t: np.ndarray
+    k: np.ndarray
+
+    @property
+    def area(self) -> np.ndarray:
+        """cross-sectional area of the elements"""
+        return self.b * self.t
+
+
+def _elements(rows) -> SectionElements:
+    """elements from rows of (a, deduction, t, supported sides), broadcast together"""
+    a, deduction, t, sides = zip(*rows)
+    values = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for value in a + deduction + t)
+    )
+    n_elements = len(rows)
+    a, deduction, t = (
+        np.stack(values[i * n_elements : (i + 1) * n_elements], axis=-1)
+        for i in range(3)
+    )
+    k = np.array([BUCKLING_FACTORS[side] for side in sides])
+    return SectionElements(a=a, b=a - deduction, t=t, k=np.broadcast_to(k, a.shape))
+
+
+def corner_deduction(t, t_adjacent, radius, profile_type="extruded") -> np.ndarray:
+    r"""
+    Width lost by an element at a corner with another element, Figure 1
+
+    - bended, (3-1) and (3-5): :math:`\frac{1}{2} (t + r / 2)`
+    - extruded, (3-2) and (3-6): :math:`\frac{t_{adj}}{2} (1 - 0.2 \frac{r^{2}}{t \cdot
+      t_{adj}})`
+
+    :param t: thickness of the element
+    :type t: array-like
+    :param t_adjacent: thickness of the element at the other side of the corner
+    :type t_adjacent: array-like
+    :param radius: bend radius / fillet radius
+    :type radius: array-like
+    :param profile_type: "extruded" or "bended", or an array of them
+    :type profile_type: str, array-like
+    :return: deduction from the outside width
+    :rtype: np.ndarray
+    """
+    bended = _bended(profile_type)
+    t = np.asarray(t, dtype=float)
+    t_adjacent = np.asarray(t_adjacent, dtype=float)
+    radius = np.asarray(radius, dtype=float)
+    extruded = t_adjacent / 2 * (1 - 0.2 * radius**2 / (t * t_adjacent))
+    return np.where(bended, (t + radius / 2) / 2, extruded)
+
+
+def junction_deductions(t_1, t_2, radius) -> tuple:
+    r"""
+    Widths lost by the flange and the web at the junction of extruded T and I sections,
+    Figure 1
+
+    - flange, (3-3): :math:`\frac{t_{2}}{2} (0.25 \frac{t_{2}}{t_{1}} - 0.2
+      \frac{r^{2}}{t_{1} \cdot t_{2}})`
+    - web, (3-4) and half of (3-7): :math:`\frac{t_{1}}{2} (2 - 0.5 \frac{t_{2}}{t_{1}} - 0.2
+      \frac{r^{2}}{t_{1} \cdot t_{2}})`
+
+    :param t_1: thickness of the flange
+    :type t_1: array-like
+    :param t_2: thickness of the web
+    :type t_2: array-like
+    :param radius: fillet radius
+    :type radius: array-like
+    :return: deduction of every half flange and of the web
+    :rtype: tuple
+    """
+    t_1 = np.asarray(t_1, dtype=float)
+    t_2 = np.asarray(t_2, dtype=float)
+    fillets = 0.2 * np.asarray(radius, dtype=float) ** 2 / (t_1 * t_2)
+    flange = t_2 / 2 * (0.25 * t_2 / t_1 - fillets)
+    web = t_1 / 2 * (2 - 0.5 * t_2 / t_1 - fillets)
+    return flange, web
+
+
+# pylint: disable=too-many-arguments
+def l_section_elements(
+    b, h, t_fx, t_fy=None, radius=0, profile_type="extruded"
+) -> SectionElements:
+    """
+    Elements of L sections, parameters like l_profile_elements: the flange (a_1,1 = b) and
+    the web (a_1,2 = h), both supported at one side
+
+    :return: section elements, (..., 2)
+    :rtype: SectionElements
+    """
+    t_fx = np.asarray(t_fx, dtype=float)
+    t_fy = t_fx if t_fy is None else np.where(_bended(profile_type), t_fx, t_fy)
+    return _elements(
+        [
+            (b, corner_deduction(t_fx, t_fy, radius, profile_type), t_fx, 1),
+            (h, corner_deduction(t_fy, t_fx, radius, profile_type), t_fy, 1),
+        ]
+    )
+
+
+def c_section_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded"
+) -> SectionElements:
+    """
+    Elements of C and Z sections, parameters like c_profile_elements: both flanges (a_1 =
+    b) supported at one side and the web (a_2 = h) supported at both sides
+
+    :return: section elements, (..., 3)
+    :rtype: SectionElements
+    """
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(_bended(profile_type), t_f, t_w)
+    flange = (b, corner_deduction(t_f, t_w, radius, profile_type), t_f, 1)
+    web = (h, 2 * corner_deduction(t_w, t_f, radius, profile_type), t_w, 2)
+    return _elements([flange, web, flange])
+
+
+def hat_section_elements(
+    b, b_f, h, t_f, t_w=None, radius=0, profile_type="extruded"
+) -> SectionElements:
+    """
+    Elements of hat sections, parameters like hat_profile_elements: the outer flanges (b_f)
+    supported at one side, the webs (h) and the crown (b) supported at both sides
+
+    :return: section elements, (..., 5)
+    :rtype: SectionElements
+    """
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(_bended(profile_type), t_f, t_w)
+    flange = (b_f, corner_deduction(t_f, t_w, radius, profile_type), t_f, 1)
+    web = (h, 2 * corner_deduction(t_w, t_f, radius, profile_type), t_w, 2)
+    crown = (b, 2 * corner_deduction(t_f, t_w, radius, profile_type), t_f, 2)
+    return _elements([flange, web, crown, web, flange])
+
+
+def t_section_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded"
+) -> SectionElements:
+    """
+    Elements of extruded T sections, parameters like t_profile_elements: both halves of the
+    flange (a_1,1 = b / 2 from the web centre) and the web (a_1,2 = h), all supported at one
+    side
+
+    :return: section elements, (..., 3)
+    :rtype: SectionElements
+    """
+    if np.any(_bended(profile_type)):
+        raise ValueError("HSB 53211-01 Figure 1 covers extruded T sections only")
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else t_w
+    flange_deduction, web_deduction = junction_deductions(t_f, t_w, radius)
+    flange = (np.divide(b, 2), flange_deduction, t_f, 1)
+    return _elements([flange, flange, (h, web_deduction, t_w, 1)])
+
+
+def i_section_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded"
+) -> SectionElements:
+    """
+    Elements of extruded I sections, parameters like i_profile_elements: the four halves of
+    the flanges (a_1,1 = b / 2 from the web centre) supported at one side and the web (a_2 =
+    h) supported at both sides
+
+    :return: section elements, (..., 5)
+    :rtype: SectionElements
+    """
+    if np.any(_bended(profile_type)):
+        raise ValueError("HSB 53211-01 Figure 1 covers extruded I sections only")
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else t_w
+    flange_deduction, web_deduction = junction_deductions(t_f, t_w, radius)
+    flange = (np.divide(b, 2), flange_deduction, t_f, 1)
+    return _elements([flange, flange, (h, 2 * web_deduction, t_w, 2), flange, flange])
+
+
+# builders of the section elements of every profile family, see PROFILE_FAMILIES
+SECTION_ELEMENTS = {
+    "L": l_section_elements,
+    "Z": c_section_elements,
+    "C": c_section_elements,
+    "T": t_section_elements,
+    "I": i_section_elements,
+    "hat": hat_section_elements,
+}
+
+
+def buckling_parameter(elements: SectionElements, E_c, R_p02, nu=0.3) -> np.ndarray:
+    """
+    Buckling parameter x of the elements, the square root of the yield over the buckling
+    stress
+
+    :param elements: section elements
+    :type elements: SectionElements
+    :param E_c: modulus of elasticity in compression
+    :type E_c: array-like
+    :param R_p02: 0.2 % tensile yield strength
+    :type R_p02: array-like
+    :param nu: Poisson's ratio
+    :type nu: array-like
+    :return: buckling parameters, (..., n_elements)
+    :rtype: np.ndarray
+    """
+    return np.sqrt(np.divide(R_p02, buckling_stress(elements, E_c, nu)))
+
+
+def buckling_stress(elements: SectionElements, E_c, nu=0.3) -> np.ndarray:
+    """
+    Elastic buckling stress of the elements, K E_c (t / b)^2
+
+    :param elements: section elements
+    :type elements: SectionElements
+    :param E_c: modulus of elasticity in compression
+    :type E_c: array-like
+    :param nu: Poisson's ratio
+    :type nu: array-like
+    :return: buckling stresses, (..., n_elements), infinite for padding elements
+    :rtype: np.ndarray
+    """
+    K = elements.k * np.pi**2 / (12 * (1 - np.square(nu)))
+    with np.errstate(divide="ignore"):
+        return K * np.expand_dims(E_c, -1) * (elements.t / elements.b) ** 2
+
+
+def von_karman(x) -> np.ndarray:
+    """
+    Dimensionless crippling strength y of the elements from the effective width at the yield
+    strength, 1 / x for buckled elements
+
+    :param x: buckling parameters
+    :type x: array-like
+    :return: crippling strength over the yield strength
+    :rtype: np.ndarray
+    """
+    with np.errstate(divide="ignore"):
+        return np.minimum(1.0, 1 / np.asarray(x, dtype=float))
+
+
+@dataclass
+class Crippling:
+    """
+    Crippling strength of sections
+
+    :param x: buckling parameter of the elements
+    :type x: np.ndarray
+    :param stress: crippling stress of the elements
+    :type stress: np.ndarray
+    :param load: crippling load of the sections
+    :type load: np.ndarray
+    """
+
+    x: np.ndarray
+    stress: np.ndarray
+    load: np.ndarray
+
+
+def crippling(
+    elements: SectionElements, E_c, R_p02, nu=0.3, curve: Callable = von_karman
+) -> Crippling:
+    """
+    Crippling load of sections, the sum of the crippling loads of their elements
+
+    :param elements: section elements
+    :type elements: SectionElements
+    :param E_c: modulus of elasticity in compression
+    :type E_c: array-like
+    :param R_p02: 0.2 % tensile yield strength
+    :type R_p02: array-like
+    :param nu: Poisson's ratio
+    :type nu: array-like
+    :param curve: dimensionless crippling strength y of the elements as a function of x
+    :type curve: callable
+    :return: buckling parameters, crippling stresses and loads
+    :rtype: Crippling
+    """
+    x = buckling_parameter(elements, E_c, R_p02, nu)
+    stress = curve(x) * np.expand_dims(R_p02, -1)
+    return Crippling(x=x, stress=stress, load=(stress * elements.area).sum(axis=-1))
+
+
+@dataclass
+class EffectiveSection:
+    """
+    Effective sections under compression loads
+
+    :param stress: stress at the supported edges of the elements
+    :type stress: np.ndarray
+    :param effective_width: effective width of the elements, (..., n_elements)
+    :type effective_width: np.ndarray
+    :param effective_area: effective area of the sections
+    :type effective_area: np.ndarray
+    :param iterations: number of iterations of every section
+    :type iterations: np.ndarray
+    :param converged: mask of the converged sections
+    :type converged: np.ndarray
+    :param crippled: mask of the sections loaded beyond their crippling load, their edge
+        stress is the yield strength
+    :type crippled: np.ndarray
+    """
+
+    stress: np.ndarray
+    effective_width: np.ndarray
+    effective_area: np.ndarray
+    iterations: np.ndarray
+    converged: np.ndarray
+    crippled: np.ndarray
+
+
+def effective_width(elements: SectionElements, buckling, stress) -> np.ndarray:
+    """
+    Effective width of the elements at the stress of their supported edges (von Karman)
+
+    :param elements: section elements
+    :type elements: SectionElements
+    :param buckling: buckling stress of the elements, see buckling_stress
+    :type buckling: array-like
+    :param stress: edge stress of the sections
+    :type stress: array-like
+    :return: effective widths, (..., n_elements)
+    :rtype: np.ndarray
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.sqrt(np.divide(buckling, np.expand_dims(stress, -1)))
+    return elements.b * np.minimum(1.0, np.nan_to_num(ratio, nan=1.0))
+
+
+# pylint: disable=too-many-locals
+def effective_section(
+    elements: SectionElements,
+    load,
+    E_c,
+    R_p02,
+    nu=0.3,
+    tolerance: float = TOLERANCE,
+    max_iterations: int = MAX_ITERATIONS,
+) -> EffectiveSection:
+    r"""
+    Effective sections under compression loads, iterating the edge stress
+    :math:`\sigma = F / A_{eff}(\sigma)` of all sections at once. Sections drop out of the
+    iteration as soon as their relative change is below the tolerance; the effective width
+    shrinks with the square root of the stress, so every step at least halves the error.
+
+    :param elements: section elements
+    :type elements: SectionElements
+    :param load: compression load, positive
+    :type load: array-like
+    :param E_c: modulus of elasticity in compression
+    :type E_c: array-like
+    :param R_p02: 0.2 % tensile yield strength
+    :type R_p02: array-like
+    :param nu: Poisson's ratio
+    :type nu: array-like
+    :param tolerance: relative change of the edge stress to stop at
+    :type tolerance: float
+    :param max_iterations: maximum number of iterations
+    :type max_iterations: int
+    :return: effective sections
+    :rtype: EffectiveSection
+    """
+    buckling = buckling_stress(elements, E_c, nu)
+    shape = np.broadcast_shapes(
+        np.shape(load), np.shape(R_p02), buckling.shape[:-1], elements.b.shape[:-1]
+    )
+    n_elements = buckling.shape[-1]
+    load = np.broadcast_to(load, shape).astype(float).ravel()
+    yield_strength = np.broadcast_to(R_p02, shape).astype(float).ravel()
+    buckling = np.broadcast_to(buckling, shape + (n_elements,)).reshape(-1, n_elements)
+    flat = SectionElements(
+        *(
+            np.broadcast_to(getattr(elements, name), shape + (n_elements,)).reshape(
+                -1, n_elements
+            )
+            for name in ("a", "b", "t", "k")
+        )
+    )
+
+    # beyond the crippling load there is no edge stress below the yield strength
+    capacity = (effective_width(flat, buckling, yield_strength) * flat.t).sum(
+        axis=-1
+    ) * yield_strength
+    crippled = load > capacity
+    stress = np.where(crippled, yield_strength, load / flat.area.sum(axis=-1))
+    iterations = np.zeros(stress.shape, dtype=int)
+    converged = crippled.copy()
+    for _ in range(max_iterations):
+        active = np.flatnonzero(~converged)
+        if not active.size:
+            break
+        section = SectionElements(*(getattr(flat, name)[active] for name in "abtk"))
+        area = (
+            effective_width(section, buckling[active], stress[active]) * section.t
+        ).sum(axis=-1)
+        update = load[active] / area
+        iterations[active] += 1
+        converged[active] = np.abs(update - stress[active]) <= tolerance * update
+        stress[active] = update
+
+    width = effective_width(flat, buckling, stress)
+    return EffectiveSection(
+        stress=stress.reshape(shape),
+        effective_width=width.reshape(shape + (n_elements,)),
+        effective_area=(width * flat.t).sum(axis=-1).reshape(shape),
+        iterations=iterations.reshape(shape),
+        converged=converged.reshape(shape),
+        crippled=crippled.reshape(shape),
+    )
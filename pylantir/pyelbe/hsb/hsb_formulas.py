@@ -322,8 +322,8 @@ def moments_transformation(
         moments.moment_x,
         forces.force_y,
         forces.force_z,
-        application_point.y_coord,
-        application_point.z_coord,
+        z_coord_p=application_point.z_coord,
+        y_coord_p=application_point.y_coord,
     )
 
     moment_y_u = moment_y_reference(
@@ -356,7 +356,77 @@ def moments_transformation(
     return moments_u
 
 
-# TODO: moments_transformation implemented with numpy array for speed and general use
+# moments_transformation for many load cases at once: pylantir.pyelbe.load_transfer
+
+
+def equilibrium_violations(
+    residuals, applied, rtol: float = 1e-9, atol: float = 1e-6
+) -> np.ndarray:
+    """
+    Flag load cases whose fastener forces do not reproduce the applied loads.
+
+    The tolerance of the force (first three) and moment (last three) residuals scales with
+    the largest applied force and moment of the case respectively.
+
+    :param residuals: equilibrium residuals, (N, 6) or (6,)
+    :type residuals: array-like
+    :param applied: applied loads the residuals refer to, same shape
+    :type applied: array-like
+    :param rtol: relative tolerance
+    :type rtol: float
+    :param atol: absolute tolerance
+    :type atol: float
+    :return: True for every case in violation, (N,) or scalar
+    :rtype: np.ndarray
+    """
+    residuals = np.abs(np.asarray(residuals, dtype=float))
+    applied = np.abs(np.asarray(applied, dtype=float))
+    force_tol = atol + rtol * applied[..., :3].max(axis=-1, keepdims=True)
+    moment_tol = atol + rtol * applied[..., 3:].max(axis=-1, keepdims=True)
+    return (residuals[..., :3] > force_tol).any(axis=-1) | (
+        residuals[..., 3:] > moment_tol
+    ).any(axis=-1)
+
+
+def fastener_equilibrium_residuals(
+    loads, application_points, coordinates, fastener_forces
+) -> tuple:
+    r"""
+    Equilibrium residuals of fastener forces against the loads applied about the origin U.
+
+    :math:`\sum F_{i} - F` and :math:`\sum r_{i} \times F_{i} - (M_{P} + r_{P} \times F)`
+
+    The applied moments about U are taken from the loads and their application points
+    directly, not from the moment transformation of the method that is checked.
+
+    :param loads: load cases (force_x, force_y, force_z, moment_x, moment_y, moment_z) about
+        their application points, (..., 6)
+    :type loads: array-like
+    :param application_points: application points, (..., 3), None if the moments are
+        already given about the origin
+    :type application_points: array-like
+    :param coordinates: fastener coordinates (x, y, z), (n_fasteners, 3)
+    :type coordinates: array-like
+    :param fastener_forces: fastener forces (tension, shear y, shear z) along (x, y, z),
+        (..., n_fasteners, 3)
+    :type fastener_forces: array-like
+    :return: residuals and applied loads about U, both (..., 6) in the order of the loads
+    :rtype: tuple
+    """
+    applied = np.array(loads, dtype=float)
+    if application_points is not None:
+        points = np.asarray(application_points, dtype=float)
+        applied[..., 3:] += np.cross(points, applied[..., :3])
+    coordinates = np.asarray(coordinates, dtype=float)
+    fastener_forces = np.asarray(fastener_forces, dtype=float)
+    reactions = np.concatenate(
+        [
+            fastener_forces.sum(axis=-2),
+            np.cross(coordinates, fastener_forces).sum(axis=-2),
+        ],
+        axis=-1,
+    )
+    return reactions - applied, applied
 
 
 # def AbsMaxND(a, axis=None):
@@ -369,7 +439,7 @@ def moments_transformation(
 
 
 def riv_field(
-    forces, moments, application_point, rivets
+    forces, moments, application_point, rivets, check_equilibrium=False
 ):  # pylint: disable=too-many-locals
     """
     Rivet field calculation as given in HSB 21030-01
@@ -380,6 +450,10 @@ def riv_field(
         application_point(float array): coordinates of the application point (X,Y,Z)
         rivets(pandas DataFrame): DataFrame with rivet definition (position) and allowables.
                                   Columns expected are (Shear,Tension,X,Y)
+        check_equilibrium(bool): verify that the rivet forces reproduce the applied loads.
+                                 The residuals (Fx,Fy,Fz,MxU,MyU,MzU) are stored in
+                                 res.attrs["equilibrium_residuals"] and a flag in
+                                 res.attrs["equilibrium_ok"].
 
     Returns:
         res(DataFrame): Result Dataframe based on input DF and with appended result columns.
@@ -456,6 +530,18 @@ def riv_field(
     res.insert(8, "RFs", shear_reserve_factor)
     res.insert(9, "RFt", tension_reserve_factor)
     res = res.astype({"Fsy": "int64", "Fsz": "int64", "Fs": "int64", "Ft": "int64"})
+    if check_equilibrium:
+        # residuals of the unrounded rivet forces, rivets in the plane x = 0
+        residuals, applied = fastener_equilibrium_residuals(
+            np.concatenate([forces, moments]),
+            application_point,
+            np.column_stack([np.zeros(len(rivets)), rivets.X, rivets.Y]),
+            np.column_stack([force_ft, force_fsy, force_fsz]),
+        )
+        res.attrs["equilibrium_residuals"] = residuals
+        res.attrs["equilibrium_ok"] = not equilibrium_violations(residuals, applied)
+        if not res.attrs["equilibrium_ok"]:
+            print(f"WARNING: rivet field violates equilibrium: {residuals}")
     # creating a matrix with the CG information for further use in other functions
     centers_of_gravity = [
         application_point[1],
@@ -1,8 +1,12 @@
 """hsb profiles extention for pyelbe"""
+from collections import OrderedDict, namedtuple
 from dataclasses import dataclass, field
+import json
+from pathlib import Path
 from pylantir.scrolls import logging
 
 from pylantir.pyelbe.profiles import Profile, Rect, Arc, QArc, Fillet
+from pylantir.pyelbe.hsb import hsb_profiles_batch
 
 @dataclass
 class LProfile:
@@ -27,6 +31,9 @@ class LProfile:
     :param y: y-coordinate of origin of the profile
     :type y: float
 
+    NOTE: the sub-elements of extruded profiles overlap in the corner, so the properties of
+    .profile do not match the HSB reference; cached_l_profile_properties and
+    hsb_profiles_batch follow the HSB verified layout instead and are not used here.
     """
 
     b: float
@@ -184,4 +191,161 @@ class LProfile:
         """Material of the profile"""
         return self.profile.mat_list
 
-    
\ No newline at end of file
+
+# section properties of a profile, names follow Profile
+ProfileProperties = namedtuple(
+    "ProfileProperties",
+    ["area", "x_cg", "y_cg", "Ixg", "Iyg", "Ixx", "Iyy", "Ixyg", "Ixy"],
+)
+
+# default number of cached profiles
+CACHE_SIZE = 4096
+# version of the JSON cache files, files of other versions are rejected
+CACHE_FORMAT = 2
+
+
+def l_profile_key(
+    b, h, profile_type, t_fx, t_fy=None, radius=0, x_orig=0, y_orig=0
+) -> tuple:
+    """Canonical parameter tuple of an L profile, resolved like LProfile
+
+    :return: (profile_type, b, h, t_fx, t_fy, radius, x_orig, y_orig)
+    :rtype: tuple
+    """
+    if profile_type == "bended":
+        t_fy = t_fx
+    if radius is None:
+        radius = 2 * t_fx
+    values = (b, h, t_fx, t_fy, radius, x_orig, y_orig)
+    return (profile_type,) + tuple(
+        None if value is None else round(float(value), 9) for value in values
+    )
+
+
+class SectionPropertyCache:
+    """LRU cache of profile section properties, optionally persisted as JSON
+
+    The cached L profile properties follow the HSB verified layout of
+    hsb_profiles_batch, not the sub-elements of LProfile.profile.
+
+    :param maxsize: maximum number of cached profiles, the least recently used are evicted
+    :type maxsize: int
+    :param path: JSON file to load the cache from (if it exists) and save it to
+    :type path: str, Path
+    """
+
+    def __init__(self, maxsize: int = CACHE_SIZE, path=None):
+        """Init function for SectionPropertyCache class"""
+        self.maxsize = maxsize
+        self.path = None if path is None else Path(path)
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if self.path is not None and self.path.exists():
+            self.load(self.path)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key) -> bool:
+        return key in self.entries
+
+    def get(self, key: tuple, compute) -> ProfileProperties:
+        """Cached properties of a key, compute() is only called on a miss
+
+        :param key: canonical parameter tuple
+        :type key: tuple
+        :param compute: function returning the properties of the key
+        :type compute: callable
+        :return: section properties
+        :rtype: ProfileProperties
+        """
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+        self.misses += 1
+        properties = ProfileProperties(*compute())
+        self.entries[key] = properties
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return properties
+
+    def clear(self):
+        """Remove all entries and reset the statistics"""
+        self.entries.clear()
+        self.hits = self.misses = 0
+
+    def save(self, path=None):
+        """Write the entries to a JSON file
+
+        :param path: JSON file, defaults to the path of the cache
+        :type path: str, Path
+        """
+        path = self.path if path is None else Path(path)
+        if path is None:
+            raise ValueError("no path to save the section property cache to")
+        entries = [
+            [list(key), [float(value) for value in properties]]
+            for key, properties in self.entries.items()
+        ]
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump({"format": CACHE_FORMAT, "entries": entries}, file)
+
+    def load(self, path):
+        """Add the entries of a JSON file, the most recent ones are kept if it is too big
+
+        :param path: JSON file written by save
+        :type path: str, Path
+        """
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+            raise ValueError(
+                f"{path} is not a section property cache of format {CACHE_FORMAT}"
+            )
+        entries = data["entries"]
+        for key, values in entries[-self.maxsize :]:
+            self.entries[tuple(key)] = ProfileProperties(*values)
+            self.entries.move_to_end(tuple(key))
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+
+PROFILE_CACHE = SectionPropertyCache()
+
+
+def cached_l_profile_properties(
+    b,
+    h,
+    profile_type,
+    t_fx,
+    t_fy=None,
+    radius=0,
+    x_orig=0,
+    y_orig=0,
+    cache: SectionPropertyCache = None,
+) -> ProfileProperties:
+    """Section properties of an L profile, computed only if they are not cached yet
+
+    The properties are those of hsb_profiles_batch.l_profile_properties for a single
+    profile, rounded like Profile, without building the sub-elements and the Profile. They
+    follow the HSB verified layout and differ from LProfile.profile, e.g. for extruded
+    profiles whose corner LProfile counts twice.
+
+    :param cache: cache to use, defaults to the module cache PROFILE_CACHE
+    :type cache: SectionPropertyCache
+    :return: section properties
+    :rtype: ProfileProperties
+    """
+    cache = PROFILE_CACHE if cache is None else cache
+    key = l_profile_key(b, h, profile_type, t_fx, t_fy, radius, x_orig, y_orig)
+
+    def compute():
+        _, b, h, t_fx, t_fy, radius, x_orig, y_orig = key
+        properties = hsb_profiles_batch.l_profile_properties(
+            b, h, t_fx, t_fy, radius, profile_type, x_orig, y_orig, decimals=2
+        )
+        return (float(getattr(properties, name)) for name in ProfileProperties._fields)
+
+    return cache.get(key, compute)
@@ -0,0 +1,516 @@
+"""batched hsb profiles for sizing studies
+
+Vectorized counterpart of LProfile: every profile parameter may be an array (or a grid from
+np.meshgrid) and the section properties of all design points are returned as arrays.
+
+The L, Z, C, T, I and hat families are all built from template_elements: straight legs and
+90 degree corners, filleted for extruded and rounded for bended profiles.
+"""
+
+import numpy as np
+
+from pylantir.pyelbe.column_screening import column_grid, minimum_inertia
+from pylantir.pyelbe.profiles_batch import (
+    SectionProperties,
+    annular_sector_elements,
+    compose,
+    fillet_elements,
+    rect_elements,
+)
+from pylantir.pyelbe.thin_walled import ThinWalledProperties, polyline_thin_walled
+
+PROFILE_TYPES = ("extruded", "bended")
+
+
+def _stack(rows) -> np.ndarray:
+    """rows of broadcastable values as one float array, (n_rows, n_columns, ...)"""
+    values = np.broadcast_arrays(
+        *(np.asarray(value, dtype=float) for row in rows for value in row)
+    )
+    return np.stack(values).reshape((len(rows), len(rows[0])) + values[0].shape)
+
+
+def _bended(profile_type) -> np.ndarray:
+    """mask of the bended profiles, checking the profile types"""
+    profile_type = np.asarray(profile_type)
+    unknown = np.setdiff1d(profile_type, PROFILE_TYPES)
+    if unknown.size:
+        raise ValueError(
+            f"unknown profile type {unknown.tolist()}, expected one of {PROFILE_TYPES}"
+        )
+    return profile_type == "bended"
+
+
+def _batch_axes(rows: np.ndarray, ndim: int) -> np.ndarray:
+    """rows with ndim design point axes after the first two, like broadcasting would add"""
+    missing = ndim - (rows.ndim - 2)
+    return rows.reshape(rows.shape[:2] + (1,) * missing + rows.shape[2:])
+
+
+def template_elements(legs, corners, radius, bended) -> list:
+    """
+    Sub-elements of profiles made of orthogonal legs, the template shared by all profile
+    families.
+
+    Every corner joins a horizontal and a vertical leg at a sharp outer corner:
+
+    - extruded: the t_v x t_h corner square and a fillet of the given radius inside
+    - bended: a quarter arc of inner radius r and thickness t_h (= t_v)
+
+    The legs are the straight parts between the corners, for bended profiles they
+    already stop r further from the corner (where the arc ends).
+
+    :param legs: x, y of the lower left point, width and height of every leg,
+        (n_legs, 4, ...)
+    :type legs: array-like
+    :param corners: x, y of the sharp outer corner, direction of the horizontal leg and
+        of the vertical leg from it (1 or -1), thickness t_h of the horizontal leg and t_v
+        of the vertical leg, (n_corners, 6, ...)
+    :type corners: array-like
+    :param radius: radius of the fillets / inner radius of the bends
+    :type radius: array-like
+    :param bended: mask of the bended profiles
+    :type bended: array-like
+    :return: legs, corner squares or arcs and fillets, ElementArrays
+    :rtype: list
+    """
+    legs = np.asarray(legs, dtype=float)
+    corners = np.asarray(corners, dtype=float)
+    radius = np.asarray(radius, dtype=float)
+    # the sub-elements are on the first axis, the design points on the others
+    shape = np.broadcast_shapes(
+        legs.shape[2:], corners.shape[2:], radius.shape, np.shape(bended)
+    )
+    legs = np.broadcast_to(_batch_axes(legs, len(shape)), legs.shape[:2] + shape)
+    corners = np.broadcast_to(
+        _batch_axes(corners, len(shape)), corners.shape[:2] + shape
+    )
+    pos_x, pos_y, width, height = legs.swapaxes(0, 1)
+    x, y, sign_x, sign_y, t_h, t_v = corners.swapaxes(0, 1)
+    square = rect_elements(
+        t_v, t_h, np.where(sign_x < 0, x - t_v, x), np.where(sign_y < 0, y - t_h, y)
+    )
+    fillet = fillet_elements(
+        np.where(bended, 0.0, radius),
+        x + sign_x * t_v,
+        y + sign_y * t_h,
+        sign_x,
+        sign_y,
+    )
+    # the arcs lie in the quadrant of their centre pointing to the outer corner
+    start = np.degrees(np.arctan2(-sign_y, -sign_x)) - 45
+    bend = annular_sector_elements(
+        radius,
+        radius + t_h,
+        start,
+        start + 90,
+        x + sign_x * (t_v + radius),
+        y + sign_y * (t_h + radius),
+    )
+    return (
+        rect_elements(width, height, pos_x, pos_y).unstack()
+        + bend.select(bended, square).unstack()
+        + fillet.unstack()
+    )
+
+
+def _legs(bounds) -> list:
+    """legs from their x0, x1, y0 and y1 bounds"""
+    return [
+        (x0, y0, np.subtract(x1, x0), np.subtract(y1, y0)) for x0, x1, y0, y1 in bounds
+    ]
+
+
+# pylint: disable=too-many-arguments
+def l_profile_elements(
+    b,
+    h,
+    t_fx,
+    t_fy=None,
+    radius=0,
+    profile_type="extruded",
+    x_orig=0,
+    y_orig=0,
+) -> list:
+    """
+    Sub-elements of L profiles, the horizontal flange on the x-axis and the vertical flange on
+    the y-axis:
+
+    - extruded: flange b x t_fx, web t_fy x (h - t_fx) on top of it and a fillet of the given
+      radius in the inner corner
+    - bended: both legs straight up to the bend, a quarter arc of inner radius r and thickness
+      t_fx in the corner (t_fy = t_fx)
+
+    :param b: width of the profile
+    :type b: array-like
+    :param h: height of the profile
+    :type h: array-like
+    :param t_fx: thickness of the horizontal flange
+    :type t_fx: array-like
+    :param t_fy: thickness of the vertical flange, defaults to t_fx, ignored for bended
+        profiles
+    :type t_fy: array-like
+    :param radius: radius of the fillet / inner radius of the bend
+    :type radius: array-like
+    :param profile_type: "extruded" or "bended", or an array of them
+    :type profile_type: str, array-like
+    :param x_orig: x-coordinate of origin of the profile
+    :type x_orig: array-like
+    :param y_orig: y-coordinate of origin of the profile
+    :type y_orig: array-like
+    :return: sub-elements, see template_elements
+    :rtype: list
+    """
+    bended = _bended(profile_type)
+    t_fx = np.asarray(t_fx, dtype=float)
+    t_fy = t_fx if t_fy is None else np.where(bended, t_fx, t_fy)
+    trim = np.where(bended, radius, 0.0)
+    legs = _legs(
+        [
+            (x_orig + t_fy + trim, x_orig + b, y_orig, y_orig + t_fx),
+            (x_orig, x_orig + t_fy, y_orig + t_fx + trim, y_orig + h),
+        ]
+    )
+    corners = [(x_orig, y_orig, 1, 1, t_fx, t_fy)]
+    return template_elements(_stack(legs), _stack(corners), radius, bended)
+
+
+def z_profile_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded", x_orig=0, y_orig=0
+) -> list:
+    """
+    Sub-elements of Z profiles: the lower flange from the origin along the x-axis, the
+    web up at its end and the upper flange continuing in the positive x-direction
+
+    :param b: width of the flanges, including the web
+    :type b: array-like
+    :param h: height of the profile
+    :type h: array-like
+    :param t_f: thickness of the flanges
+    :type t_f: array-like
+    :param t_w: thickness of the web, defaults to t_f, ignored for bended profiles
+    :type t_w: array-like
+    :return: sub-elements, see template_elements and l_profile_elements for the other
+        parameters
+    :rtype: list
+    """
+    bended = _bended(profile_type)
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(bended, t_f, t_w)
+    trim = np.where(bended, radius, 0.0)
+    web = x_orig + np.subtract(b, t_w)
+    top = y_orig + np.asarray(h, dtype=float)
+    legs = _legs(
+        [
+            (x_orig, web - trim, y_orig, y_orig + t_f),
+            (web, web + t_w, y_orig + t_f + trim, top - t_f - trim),
+            (web + t_w + trim, web + b, top - t_f, top),
+        ]
+    )
+    corners = [
+        (web + t_w, y_orig, -1, 1, t_f, t_w),
+        (web, top, 1, -1, t_f, t_w),
+    ]
+    return template_elements(_stack(legs), _stack(corners), radius, bended)
+
+
+def c_profile_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded", x_orig=0, y_orig=0
+) -> list:
+    """
+    Sub-elements of C (channel) profiles: the web on the y-axis and both flanges in the
+    positive x-direction
+
+    :param b: width of the flanges, including the web
+    :type b: array-like
+    :param h: height of the profile
+    :type h: array-like
+    :param t_f: thickness of the flanges
+    :type t_f: array-like
+    :param t_w: thickness of the web, defaults to t_f, ignored for bended profiles
+    :type t_w: array-like
+    :return: sub-elements, see template_elements and l_profile_elements for the other
+        parameters
+    :rtype: list
+    """
+    bended = _bended(profile_type)
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(bended, t_f, t_w)
+    trim = np.where(bended, radius, 0.0)
+    top = y_orig + np.asarray(h, dtype=float)
+    legs = _legs(
+        [
+            (x_orig + t_w + trim, x_orig + b, y_orig, y_orig + t_f),
+            (x_orig, x_orig + t_w, y_orig + t_f + trim, top - t_f - trim),
+            (x_orig + t_w + trim, x_orig + b, top - t_f, top),
+        ]
+    )
+    corners = [
+        (x_orig, y_orig, 1, 1, t_f, t_w),
+        (x_orig, top, 1, -1, t_f, t_w),
+    ]
+    return template_elements(_stack(legs), _stack(corners), radius, bended)
+
+
+def t_profile_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded", x_orig=0, y_orig=0
+) -> list:
+    """
+    Sub-elements of T profiles: the flange on the x-axis and the web up in its middle. A
+    bended T is two bended angles back to back, its web is 2 t_f thick.
+
+    :param b: width of the flange
+    :type b: array-like
+    :param h: height of the profile
+    :type h: array-like
+    :param t_f: thickness of the flange
+    :type t_f: array-like
+    :param t_w: thickness of the web, defaults to t_f, ignored for bended profiles
+    :type t_w: array-like
+    :return: sub-elements, see template_elements and l_profile_elements for the other
+        parameters
+    :rtype: list
+    """
+    bended = _bended(profile_type)
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(bended, 2 * t_f, t_w)
+    trim = np.where(bended, radius, 0.0)
+    middle = x_orig + np.divide(b, 2)
+    legs = _legs(
+        [
+            (x_orig, middle - t_w / 2 - trim, y_orig, y_orig + t_f),
+            (middle + t_w / 2 + trim, x_orig + b, y_orig, y_orig + t_f),
+            (middle - t_w / 2, middle + t_w / 2, y_orig + t_f + trim, y_orig + h),
+        ]
+    )
+    corners = [
+        (middle, y_orig, -1, 1, t_f, t_w / 2),
+        (middle, y_orig, 1, 1, t_f, t_w / 2),
+    ]
+    return template_elements(_stack(legs), _stack(corners), radius, bended)
+
+
+def i_profile_elements(
+    b, h, t_f, t_w=None, radius=0, profile_type="extruded", x_orig=0, y_orig=0
+) -> list:
+    """
+    Sub-elements of I profiles: the lower flange on the x-axis, the web up in its middle
+    and the upper flange on top. A bended I is two bended channels back to back, its web
+    is 2 t_f thick.
+
+    :param b: width of the flanges
+    :type b: array-like
+    :param h: height of the profile
+    :type h: array-like
+    :param t_f: thickness of the flanges
+    :type t_f: array-like
+    :param t_w: thickness of the web, defaults to t_f, ignored for bended profiles
+    :type t_w: array-like
+    :return: sub-elements, see template_elements and l_profile_elements for the other
+        parameters
+    :rtype: list
+    """
+    bended = _bended(profile_type)
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(bended, 2 * t_f, t_w)
+    trim = np.where(bended, radius, 0.0)
+    middle = x_orig + np.divide(b, 2)
+    top = y_orig + np.asarray(h, dtype=float)
+    legs = _legs(
+        [
+            (x_orig, middle - t_w / 2 - trim, y_orig, y_orig + t_f),
+            (middle + t_w / 2 + trim, x_orig + b, y_orig, y_orig + t_f),
+            (middle - t_w / 2, middle + t_w / 2, y_orig + t_f + trim, top - t_f - trim),
+            (x_orig, middle - t_w / 2 - trim, top - t_f, top),
+            (middle + t_w / 2 + trim, x_orig + b, top - t_f, top),
+        ]
+    )
+    corners = [
+        (middle, y_orig, -1, 1, t_f, t_w / 2),
+        (middle, y_orig, 1, 1, t_f, t_w / 2),
+        (middle, top, -1, -1, t_f, t_w / 2),
+        (middle, top, 1, -1, t_f, t_w / 2),
+    ]
+    return template_elements(_stack(legs), _stack(corners), radius, bended)
+
+
+def hat_profile_elements(
+    b, b_f, h, t_f, t_w=None, radius=0, profile_type="extruded", x_orig=0, y_orig=0
+) -> list:
+    """
+    Sub-elements of hat profiles: both outer flanges on the x-axis, the webs up from
+    their inner ends and the crown on top, open to the bottom
+
+    :param b: width of the crown, including the webs
+    :type b: array-like
+    :param b_f: width of the outer flanges, including the webs
+    :type b_f: array-like
+    :param h: height of the profile
+    :type h: array-like
+    :param t_f: thickness of the flanges and the crown
+    :type t_f: array-like
+    :param t_w: thickness of the webs, defaults to t_f, ignored for bended profiles
+    :type t_w: array-like
+    :return: sub-elements, see template_elements and l_profile_elements for the other
+        parameters
+    :rtype: list
+    """
+    bended = _bended(profile_type)
+    t_f = np.asarray(t_f, dtype=float)
+    t_w = t_f if t_w is None else np.where(bended, t_f, t_w)
+    trim = np.where(bended, radius, 0.0)
+    left = x_orig + np.subtract(b_f, t_w)
+    right = left + np.subtract(b, t_w)
+    top = y_orig + np.asarray(h, dtype=float)
+    legs = _legs(
+        [
+            (x_orig, left - trim, y_orig, y_orig + t_f),
+            (left, left + t_w, y_orig + t_f + trim, top - t_f - trim),
+            (left + t_w + trim, right - trim, top - t_f, top),
+            (right, right + t_w, y_orig + t_f + trim, top - t_f - trim),
+            (right + t_w + trim, right + b_f, y_orig, y_orig + t_f),
+        ]
+    )
+    corners = [
+        (left + t_w, y_orig, -1, 1, t_f, t_w),
+        (left, top, 1, -1, t_f, t_w),
+        (right + t_w, top, -1, -1, t_f, t_w),
+        (right, y_orig, 1, 1, t_f, t_w),
+    ]
+    return template_elements(_stack(legs), _stack(corners), radius, bended)
+
+
+# builders of the sub-elements of every profile family
+PROFILE_FAMILIES = {
+    "L": l_profile_elements,
+    "Z": z_profile_elements,
+    "C": c_profile_elements,
+    "T": t_profile_elements,
+    "I": i_profile_elements,
+    "hat": hat_profile_elements,
+}
+
+
+def profile_properties(family: str, *args, decimals: int = None, **kwargs):
+    """
+    Section properties of a profile family over arrays of profile parameters
+
+    :param family: one of PROFILE_FAMILIES
+    :type family: str
+    :param args: parameters of the family's elements function, e.g. z_profile_elements
+    :param decimals: round the area and the center of gravity like Profile (2)
+    :type decimals: int
+    :param kwargs: parameters of the family's elements function
+    :return: section properties, broadcast over the parameters
+    :rtype: SectionProperties
+    """
+    if family not in PROFILE_FAMILIES:
+        raise ValueError(
+            f"unknown profile family {family!r}, "
+            f"expected one of {list(PROFILE_FAMILIES)}"
+        )
+    return compose(PROFILE_FAMILIES[family](*args, **kwargs), decimals)
+
+
+def l_profile_properties(
+    b,
+    h,
+    t_fx,
+    t_fy=None,
+    radius=0,
+    profile_type="extruded",
+    x_orig=0,
+    y_orig=0,
+    decimals: int = None,
+) -> SectionProperties:
+    """
+    Section properties of L profiles over arrays of profile parameters, see
+    l_profile_elements for the parameters
+
+    :param decimals: round the area and the center of gravity like Profile (2)
+    :type decimals: int
+    :return: area, x_cg, y_cg, Ixg, Iyg, Ixx, Iyy, Ixyg and Ixy, broadcast over the
+        parameters
+    :rtype: SectionProperties
+    """
+    return compose(
+        l_profile_elements(b, h, t_fx, t_fy, radius, profile_type, x_orig, y_orig),
+        decimals,
+    )
+
+
+def l_profile_midline(b, h, t_fx, t_fy=None, x_orig=0, y_orig=0) -> tuple:
+    """
+    Midline of L profiles with sharp corners: from the free end of the horizontal flange to
+    the corner and up to the free end of the vertical flange. The bend / fillet radius is
+    neglected.
+
+    :return: points, (..., 3, 2), and thickness of both legs, (..., 2)
+    :rtype: tuple
+    """
+    t_fy = t_fx if t_fy is None else t_fy
+    b, h, t_fx, t_fy, x_orig, y_orig = np.broadcast_arrays(
+        *(
+            np.asarray(value, dtype=float)
+            for value in (b, h, t_fx, t_fy, x_orig, y_orig)
+        )
+    )
+    corner_x = x_orig + t_fy / 2
+    corner_y = y_orig + t_fx / 2
+    points = np.stack(
+        [
+            np.stack([x_orig + b, corner_y], axis=-1),
+            np.stack([corner_x, corner_y], axis=-1),
+            np.stack([corner_x, y_orig + h], axis=-1),
+        ],
+        axis=-2,
+    )
+    return points, np.stack([t_fx, t_fy], axis=-1)
+
+
+def l_profile_thin_walled(
+    b, h, t_fx, t_fy=None, x_orig=0, y_orig=0
+) -> ThinWalledProperties:
+    """
+    Torsion constant, shear centre and warping constant of L profiles from their midline,
+    see l_profile_midline
+
+    :return: thin-walled section properties, broadcast over the parameters
+    :rtype: ThinWalledProperties
+    """
+    return polyline_thin_walled(*l_profile_midline(b, h, t_fx, t_fy, x_orig, y_orig))
+
+
+def l_profile_column_grid(profiles: dict, lengths, fixities, materials: dict):
+    """
+    Column allowables of batched L profiles over lengths, end-fixities and materials, with
+    the Needham crippling stress of an angle, see column_grid
+
+    :param profiles: keyword arguments of l_profile_properties, arrays of n_profiles
+    :type profiles: dict
+    :param lengths: column lengths, (n_lengths,)
+    :type lengths: array-like
+    :param fixities: end-fixity names or coefficients, (n_fixities,)
+    :type fixities: iterable
+    :param materials: "E" and "fcy" arrays of n_materials each, see material_arrays
+    :type materials: dict
+    :return: allowables of shape (n_profiles, n_lengths, n_fixities, n_materials)
+    :rtype: ColumnAllowables
+    """
+    props = l_profile_properties(**profiles)
+    t_fx = np.asarray(profiles["t_fx"], dtype=float)
+    t_fy = profiles.get("t_fy")
+    bended = np.asarray(profiles.get("profile_type", "extruded")) == "bended"
+    t_fy = t_fx if t_fy is None else np.where(bended, t_fx, t_fy)
+    b_prime = (np.asarray(profiles["b"], dtype=float) + profiles["h"]) / 2
+    return column_grid(
+        {
+            "area": props.area,
+            "I_min": minimum_inertia(props.Ixg, props.Iyg, props.Ixyg),
+            "b_prime": np.broadcast_to(b_prime, props.area.shape),
+            "thickness": np.broadcast_to((t_fx + t_fy) / 2, props.area.shape),
+        },
+        lengths,
+        fixities,
+        materials,
+    )
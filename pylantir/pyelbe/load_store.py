@@ -0,0 +1,275 @@
+"""indexed binary load case store with memory-mapped columns
+
+A store is a directory holding one NPY file per column, opened as memory maps:
+
+    meta.json                  number of cases and the values of every tag
+    loads.npy                  (N, 6) force_x, force_y, force_z, moment_x, moment_y, moment_z
+    points.npy                 (N, 3) application points
+    names.npy                  (N,) case names
+    name_sorted.npy            (N,) sorted case names, for binary search
+    name_order.npy             (N,) rows of the sorted names
+    tag_<tag>.npy              (N,) code of the tag value of every case
+    tag_<tag>_order.npy        (N,) rows grouped by tag value
+    tag_<tag>_offsets.npy      (n_values + 1,) start of every tag value in the order
+
+Name lookups are binary searches, tag lookups return the rows of one value directly, so
+selecting k cases reads O(k) rows (plus O(k log N) for names) and never parses text.
+"""
+
+from dataclasses import dataclass, field
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from pylantir.pyelbe.loads import LoadCaseSet
+
+STORE_VERSION = 1
+
+
+def _tag_index(values) -> tuple:
+    """categories, codes, grouped rows and group offsets of one tag column"""
+    categories, codes = np.unique(np.asarray(values, dtype=str), return_inverse=True)
+    order = np.argsort(codes, kind="stable")
+    offsets = np.zeros(len(categories) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(codes, minlength=len(categories)))
+    return categories, codes.astype(np.int32), order.astype(np.int64), offsets
+
+
+@dataclass
+class LoadCaseStore:
+    """
+    Read access to a load case store directory (see module description)
+
+    :param path: store directory
+    :type path: str, Path
+    """
+
+    path: Path
+    n_cases: int = field(init=False)
+    tags: Dict[str, List[str]] = field(init=False)
+    loads: np.ndarray = field(init=False, repr=False)
+    points: np.ndarray = field(init=False, repr=False)
+    names: np.ndarray = field(init=False, repr=False)
+    name_sorted: np.ndarray = field(init=False, repr=False)
+    name_order: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Post initialization of the load case store, opens the memory maps
+        """
+        self.path = Path(self.path)
+        with open(self.path / "meta.json", encoding="utf-8") as file:
+            meta = json.load(file)
+        if meta["version"] != STORE_VERSION:
+            raise ValueError(f"unsupported load case store version {meta['version']}")
+        self.n_cases = meta["n_cases"]
+        self.tags = meta["tags"]
+        self.loads = self._column("loads")
+        self.points = self._column("points")
+        self.names = self._column("names")
+        self.name_sorted = self._column("name_sorted")
+        self.name_order = self._column("name_order")
+
+    def _column(self, name: str) -> np.ndarray:
+        """memory map of one column file"""
+        return np.load(self.path / f"{name}.npy", mmap_mode="r")
+
+    @classmethod
+    def write(  # pylint: disable=too-many-arguments
+        cls,
+        path,
+        loads,
+        application_points=None,
+        names=None,
+        tags: Dict[str, list] = None,
+    ) -> "LoadCaseStore":
+        """
+        Write a new load case store and open it
+
+        :param path: store directory, created if missing, existing columns are overwritten
+        :type path: str, Path
+        :param loads: load cases about their application points, (N, 6)
+        :type loads: array-like
+        :param application_points: application points, (N, 3) or (3,), defaults to the origin
+        :type application_points: array-like
+        :param names: unique case names, defaults to the row numbers
+        :type names: list
+        :param tags: tag name -> tag value of every case, e.g. {"phase": [...],
+            "load_type": [...], "joint": [...]}
+        :type tags: dict
+        :return: the opened store
+        :rtype: LoadCaseStore
+        """
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        loads = np.atleast_2d(np.asarray(loads, dtype=np.float64))
+        n_cases = loads.shape[0]
+        points = np.zeros((n_cases, 3))
+        if application_points is not None:
+            points[:] = application_points
+        if names is None:
+            names = np.arange(n_cases)
+        names = np.asarray(names, dtype=str)
+        if names.shape != (n_cases,):
+            raise ValueError(f"expected {n_cases} names, got {names.shape}")
+        name_order = np.argsort(names, kind="stable")
+        name_sorted = names[name_order]
+        if n_cases > 1 and np.any(name_sorted[1:] == name_sorted[:-1]):
+            raise ValueError("case names must be unique")
+
+        np.save(path / "loads.npy", loads)
+        np.save(path / "points.npy", points)
+        np.save(path / "names.npy", names)
+        np.save(path / "name_sorted.npy", name_sorted)
+        np.save(path / "name_order.npy", name_order.astype(np.int64))
+
+        categories = {}
+        for tag, values in (tags or {}).items():
+            if len(values) != n_cases:
+                raise ValueError(
+                    f"tag {tag} has {len(values)} values for {n_cases} cases"
+                )
+            values, codes, order, offsets = _tag_index(values)
+            categories[tag] = values.tolist()
+            np.save(path / f"tag_{tag}.npy", codes)
+            np.save(path / f"tag_{tag}_order.npy", order)
+            np.save(path / f"tag_{tag}_offsets.npy", offsets)
+
+        with open(path / "meta.json", "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": STORE_VERSION, "n_cases": n_cases, "tags": categories}, file
+            )
+        return cls(path)
+
+    @classmethod
+    def from_load_case_set(
+        cls, path, load_cases: LoadCaseSet, names=None, tags: Dict[str, list] = None
+    ) -> "LoadCaseStore":
+        """
+        Write a LoadCaseSet to a new store, named after its case ids by default
+
+        :param path: store directory
+        :type path: str, Path
+        :param load_cases: load cases
+        :type load_cases: LoadCaseSet
+        :param names: unique case names, defaults to the case ids
+        :type names: list
+        :param tags: tag name -> tag value of every case
+        :type tags: dict
+        :return: the opened store
+        :rtype: LoadCaseStore
+        """
+        if names is None:
+            names = load_cases.case_ids
+        return cls.write(
+            path, load_cases.loads, load_cases.application_points, names, tags
+        )
+
+    def __len__(self) -> int:
+        return self.n_cases
+
+    def rows(self, names) -> np.ndarray:
+        """
+        Rows of named cases (binary search in the sorted names)
+
+        :param names: case names
+        :type names: list
+        :return: rows, in the order of the names
+        :rtype: np.ndarray
+        """
+        names = np.atleast_1d(np.asarray(names, dtype=str))
+        positions = np.searchsorted(self.name_sorted, names)
+        positions = np.minimum(positions, max(self.n_cases - 1, 0))
+        found = self.name_sorted[positions] == names
+        if not np.all(found):
+            raise KeyError(f"unknown load cases {names[~found].tolist()}")
+        return np.asarray(self.name_order[positions])
+
+    def tag_rows(self, tag: str, value: str) -> np.ndarray:
+        """
+        Rows of all cases with one tag value
+
+        :param tag: tag name
+        :type tag: str
+        :param value: tag value
+        :type value: str
+        :return: sorted rows
+        :rtype: np.ndarray
+        """
+        if tag not in self.tags:
+            raise KeyError(f"unknown tag {tag}, the store has {list(self.tags)}")
+        if value not in self.tags[tag]:
+            return np.empty(0, dtype=np.int64)
+        code = self.tags[tag].index(value)
+        offsets = self._column(f"tag_{tag}_offsets")
+        return np.asarray(
+            self._column(f"tag_{tag}_order")[offsets[code] : offsets[code + 1]]
+        )
+
+    def select_rows(self, names=None, **tags) -> np.ndarray:
+        """
+        Rows of the cases matching all criteria, e.g. select_rows(load_type="gust", joint="J")
+
+        :param names: case names, all cases if None
+        :type names: list
+        :param tags: tag name -> value, or list of values
+        :return: sorted rows
+        :rtype: np.ndarray
+        """
+        rows = None
+        if names is not None:
+            rows = np.sort(self.rows(names))
+        for tag, values in tags.items():
+            if isinstance(values, str):
+                values = [values]
+            tag_rows = np.concatenate(
+                [np.empty(0, dtype=np.int64)]
+                + [self.tag_rows(tag, value) for value in values]
+            )
+            rows = (
+                np.unique(tag_rows)
+                if rows is None
+                else np.intersect1d(rows, tag_rows, assume_unique=True)
+            )
+        if rows is None:
+            return np.arange(self.n_cases)
+        return rows
+
+    def read(self, rows) -> LoadCaseSet:
+        """
+        Read the given rows into a LoadCaseSet, the case ids are the rows
+
+        :param rows: rows of the store
+        :type rows: array-like
+        :return: load cases
+        :rtype: LoadCaseSet
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        return LoadCaseSet.from_arrays(self.loads[rows], self.points[rows], rows)
+
+    def select(self, names=None, **tags) -> LoadCaseSet:
+        """
+        Load cases matching all criteria, see select_rows
+
+        :param names: case names, all cases if None
+        :type names: list
+        :param tags: tag name -> value, or list of values
+        :return: load cases
+        :rtype: LoadCaseSet
+        """
+        return self.read(self.select_rows(names, **tags))
+
+    def tag_values(self, tag: str, rows) -> np.ndarray:
+        """
+        Tag values of the given rows
+
+        :param tag: tag name
+        :type tag: str
+        :param rows: rows of the store
+        :type rows: array-like
+        :return: tag values
+        :rtype: np.ndarray
+        """
+        return np.asarray(self.tags[tag])[self._column(f"tag_{tag}")[rows]]
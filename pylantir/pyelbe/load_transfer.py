@@ -0,0 +1,227 @@
+"""vectorized rigid body load transfer and coordinate system transformations
+
+All load arrays have the six components (force_x, force_y, force_z, moment_x, moment_y,
+moment_z) on the last axis, all points and angles their three components on the last axis.
+Leading axes broadcast against each other as in numpy.
+"""
+
+import numpy as np
+
+AXES = "xyz"
+
+
+def transfer_loads(loads, from_points, to_points=(0.0, 0.0, 0.0)) -> np.ndarray:
+    r"""
+    Move loads from the points they are given about to new reference points (rigid body).
+
+    :math:`F_{B} = F_{A}`, :math:`M_{B} = M_{A} + (r_{A} - r_{B}) \times F_{A}`
+
+    For moments given about P and the reference point U this is moments_transformation,
+    evaluated for all cases at once.
+
+    :param loads: loads about from_points, (..., 6)
+    :type loads: array-like
+    :param from_points: points the moments are given about, (..., 3)
+    :type from_points: array-like
+    :param to_points: new reference points, (..., 3), defaults to the origin
+    :type to_points: array-like
+    :return: loads about to_points, broadcast shape (..., 6)
+    :rtype: np.ndarray
+    """
+    loads = np.asarray(loads, dtype=float)
+    lever = np.asarray(from_points, dtype=float) - np.asarray(to_points, dtype=float)
+    forces = loads[..., :3]
+    moments = loads[..., 3:] + np.cross(lever, forces)
+    forces = np.broadcast_to(forces, moments.shape)
+    return np.concatenate([forces, moments], axis=-1)
+
+
+def transfer_to_points(loads, from_points, to_points) -> np.ndarray:
+    """
+    Move N load cases to each of M interface points.
+
+    :param loads: load cases, (N, 6)
+    :type loads: array-like
+    :param from_points: points the moments are given about, (N, 3) or (3,)
+    :type from_points: array-like
+    :param to_points: interface points, (M, 3)
+    :type to_points: array-like
+    :return: loads about every interface point, (M, N, 6)
+    :rtype: np.ndarray
+    """
+    loads = np.atleast_2d(np.asarray(loads, dtype=float))
+    to_points = np.atleast_2d(np.asarray(to_points, dtype=float))
+    return transfer_loads(loads[None], from_points, to_points[:, None, :])
+
+
+def elementary_rotation(axis: str, angles) -> np.ndarray:
+    r"""
+    Rotation matrices about one coordinate axis.
+
+    e.g. about z: :math:`R_{z} = [[cos \theta, -sin \theta, 0], [sin \theta, cos \theta, 0],
+    [0, 0, 1]]`
+
+    :param axis: "x", "y" or "z"
+    :type axis: str
+    :param angles: rotation angles in radians, (...)
+    :type angles: array-like
+    :return: rotation matrices, (..., 3, 3)
+    :rtype: np.ndarray
+    """
+    if axis not in AXES:
+        raise ValueError(f"axis must be one of {tuple(AXES)}, got {axis}")
+    angles = np.asarray(angles, dtype=float)
+    cos, sin = np.cos(angles), np.sin(angles)
+    first, second = [index for index in range(3) if index != AXES.index(axis)]
+
+    rotation = np.zeros(angles.shape + (3, 3))
+    rotation[..., AXES.index(axis), AXES.index(axis)] = 1.0
+    rotation[..., first, first] = cos
+    rotation[..., second, second] = cos
+    rotation[..., first, second] = -sin
+    rotation[..., second, first] = sin
+    return rotation
+
+
+def euler_rotation(angles, sequence: str = "xyz", degrees: bool = False) -> np.ndarray:
+    """
+    Rotation matrices from intrinsic Euler angles.
+
+    The system is first rotated about its axis sequence[0], then about the rotated axis
+    sequence[1] and last about sequence[2], R = R_0 R_1 R_2. The columns of R are the axes of
+    the rotated system expressed in the original one.
+
+    :param angles: Euler angles, (..., 3)
+    :type angles: array-like
+    :param sequence: rotation axes, e.g. "xyz" or "zyx" (yaw, pitch, roll), axes may repeat
+        as in "zxz"
+    :type sequence: str
+    :param degrees: angles are given in degrees
+    :type degrees: bool
+    :return: rotation matrices, (..., 3, 3)
+    :rtype: np.ndarray
+    """
+    if len(sequence) != 3:
+        raise ValueError(f"sequence must have 3 axes, got {sequence}")
+    angles = np.asarray(angles, dtype=float)
+    if degrees:
+        angles = np.radians(angles)
+    rotation = elementary_rotation(sequence[0], angles[..., 0])
+    for position in (1, 2):
+        rotation = rotation @ elementary_rotation(
+            sequence[position], angles[..., position]
+        )
+    return rotation
+
+
+def as_rotation(
+    rotation=None, angles=None, sequence: str = "xyz", degrees: bool = False
+):
+    """
+    Rotation matrices given either directly or as Euler angles (see euler_rotation)
+
+    :param rotation: rotation matrices, (..., 3, 3)
+    :type rotation: array-like
+    :param angles: Euler angles, (..., 3)
+    :type angles: array-like
+    :param sequence: Euler sequence
+    :type sequence: str
+    :param degrees: angles are given in degrees
+    :type degrees: bool
+    :return: rotation matrices, (..., 3, 3)
+    :rtype: np.ndarray
+    """
+    if (rotation is None) == (angles is None):
+        raise ValueError("give either rotation matrices or Euler angles")
+    if rotation is None:
+        return euler_rotation(angles, sequence, degrees)
+    return np.asarray(rotation, dtype=float)
+
+
+def rotate_loads(loads, rotation) -> np.ndarray:
+    """
+    Apply rotation matrices to the force and moment vectors, v' = R v.
+
+    :param loads: loads, (..., 6)
+    :type loads: array-like
+    :param rotation: rotation matrices, (..., 3, 3)
+    :type rotation: array-like
+    :return: rotated loads, (..., 6)
+    :rtype: np.ndarray
+    """
+    loads = np.asarray(loads, dtype=float)
+    rotation = np.asarray(rotation, dtype=float)
+    forces = np.einsum("...ij,...j->...i", rotation, loads[..., :3])
+    moments = np.einsum("...ij,...j->...i", rotation, loads[..., 3:])
+    return np.concatenate([forces, moments], axis=-1)
+
+
+def to_local(  # pylint: disable=too-many-arguments
+    loads,
+    from_points,
+    origin,
+    rotation=None,
+    angles=None,
+    sequence: str = "xyz",
+    degrees: bool = False,
+) -> np.ndarray:
+    """
+    Express global loads in a local coordinate system.
+
+    The loads are moved to the origin of the local system and their components are projected
+    on its axes, v_local = R^T v_global.
+
+    :param loads: loads in global components, (..., 6)
+    :type loads: array-like
+    :param from_points: global points the moments are given about, (..., 3)
+    :type from_points: array-like
+    :param origin: global position of the local origin, (..., 3)
+    :type origin: array-like
+    :param rotation: local axes as columns in global components, (..., 3, 3)
+    :type rotation: array-like
+    :param angles: Euler angles of the local system instead of rotation, (..., 3)
+    :type angles: array-like
+    :param sequence: Euler sequence, see euler_rotation
+    :type sequence: str
+    :param degrees: angles are given in degrees
+    :type degrees: bool
+    :return: loads about the local origin in local components, (..., 6)
+    :rtype: np.ndarray
+    """
+    rotation = as_rotation(rotation, angles, sequence, degrees)
+    return rotate_loads(
+        transfer_loads(loads, from_points, origin), np.swapaxes(rotation, -1, -2)
+    )
+
+
+def to_global(  # pylint: disable=too-many-arguments
+    loads,
+    origin,
+    rotation=None,
+    angles=None,
+    sequence: str = "xyz",
+    degrees: bool = False,
+    to_points=(0.0, 0.0, 0.0),
+) -> np.ndarray:
+    """
+    Express loads given in a local coordinate system in global components, inverse of to_local.
+
+    :param loads: loads about the local origin in local components, (..., 6)
+    :type loads: array-like
+    :param origin: global position of the local origin, (..., 3)
+    :type origin: array-like
+    :param rotation: local axes as columns in global components, (..., 3, 3)
+    :type rotation: array-like
+    :param angles: Euler angles of the local system instead of rotation, (..., 3)
+    :type angles: array-like
+    :param sequence: Euler sequence, see euler_rotation
+    :type sequence: str
+    :param degrees: angles are given in degrees
+    :type degrees: bool
+    :param to_points: global reference points of the result, defaults to the global origin
+    :type to_points: array-like
+    :return: loads about to_points in global components, (..., 6)
+    :rtype: np.ndarray
+    """
+    rotation = as_rotation(rotation, angles, sequence, degrees)
+    return transfer_loads(rotate_loads(loads, rotation), origin, to_points)
@@ -1,7 +1,19 @@
 """Loads Classes"""
 from dataclasses import dataclass, field
 from collections import namedtuple
+from typing import Iterator, List, Tuple
 
+import numpy as np
+
+from pylantir.pyelbe.abstractions import ReferencePoint
+from pylantir.pyelbe.load_transfer import transfer_loads
+
+LOAD_COMPONENTS = ("force_x", "force_y", "force_z", "moment_x", "moment_y", "moment_z")
+POINT_COMPONENTS = ("x_coord", "y_coord", "z_coord")
+# one record per load case: id, six load components and the application point
+LOAD_CASE_DTYPE = np.dtype(
+    [("case_id", np.int64), ("loads", np.float64, (6,)), ("point", np.float64, (3,))]
+)
 
 
 #TODO: make class LOADS
@@ -33,14 +45,7 @@ class Forces:
         """
         Post initialization of forces
         """
-        self.namedtuple = namedtuple(
-            self.name,
-            [
-                "force_x",
-                "force_y",
-                "force_z",
-            ],
-        )
+        # plain tuple, creating a namedtuple class per instance is slow and memory hungry
         self.namedtuple = (
             self.force_x,
             self.force_y,
@@ -73,17 +78,433 @@ class Moments:
         """
         Post initialization of moments
         """
-        self.namedtuple = namedtuple(
-            self.name,
-            [
-                "moment_x",
-                "moment_y",
-                "moment_z",
-            ],
-        )
         self.namedtuple = (
             self.moment_x,
             self.moment_y,
             self.moment_z,
         )
 
+
+@dataclass(eq=False)
+class LoadCaseSet:
+    """
+    Array backed set of load cases.
+
+    All cases are stored in one structured array (LOAD_CASE_DTYPE) holding the case id, the six
+    load components (force_x, force_y, force_z, moment_x, moment_y, moment_z) about the
+    application point and the application point (x_coord, y_coord, z_coord). Slicing, filtering
+    and chunked iteration return views or new sets without creating a Python object per case.
+
+    :param data: structured array of dtype LOAD_CASE_DTYPE
+    :type data: np.ndarray
+    """
+
+    data: np.ndarray
+
+    def __post_init__(self):
+        """
+        Post initialization of the load case set
+        """
+        self.data = np.atleast_1d(np.asarray(self.data))
+        if self.data.dtype != LOAD_CASE_DTYPE:
+            raise TypeError(
+                f"data must be of dtype {LOAD_CASE_DTYPE}, got {self.data.dtype}"
+            )
+
+    @classmethod
+    def empty(cls, n_cases: int) -> "LoadCaseSet":
+        """
+        Zero initialized set of n_cases load cases, numbered from 0
+
+        :param n_cases: number of load cases
+        :type n_cases: int
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        data = np.zeros(n_cases, dtype=LOAD_CASE_DTYPE)
+        data["case_id"] = np.arange(n_cases)
+        return cls(data)
+
+    @classmethod
+    def from_arrays(
+        cls, loads, application_points=None, case_ids=None
+    ) -> "LoadCaseSet":
+        """
+        Load case set from plain arrays
+
+        :param loads: load cases, (N, 6) or (6,)
+        :type loads: array-like
+        :param application_points: application points, (N, 3) or (3,), defaults to the origin
+        :type application_points: array-like
+        :param case_ids: case ids, defaults to 0 ... N - 1
+        :type case_ids: array-like
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        loads = np.atleast_2d(np.asarray(loads, dtype=float))
+        if loads.shape[1] != 6:
+            raise ValueError(f"loads must have 6 components, got {loads.shape[1]}")
+        load_cases = cls.empty(loads.shape[0])
+        load_cases.data["loads"] = loads
+        if application_points is not None:
+            load_cases.data["point"] = application_points
+        if case_ids is not None:
+            load_cases.data["case_id"] = case_ids
+        return load_cases
+
+    @classmethod
+    def from_objects(
+        cls,
+        forces: List[Forces],
+        moments: List[Moments],
+        application_points: List[ReferencePoint] = None,
+        case_ids=None,
+    ) -> "LoadCaseSet":
+        """
+        Load case set from the Forces, Moments and ReferencePoint classes
+
+        :param forces: forces of every case
+        :type forces: list
+        :param moments: moments of every case, about its application point
+        :type moments: list
+        :param application_points: application point of every case, defaults to the origin
+        :type application_points: list
+        :param case_ids: case ids, defaults to 0 ... N - 1
+        :type case_ids: array-like
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        loads = [
+            force.namedtuple + moment.namedtuple
+            for force, moment in zip(forces, moments)
+        ]
+        points = None
+        if application_points is not None:
+            points = [point.namedtuple for point in application_points]
+        return cls.from_arrays(loads, points, case_ids)
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __getitem__(self, index) -> "LoadCaseSet":
+        """
+        Sub set of the load cases, a view for slices and a copy for masks and index arrays.
+        An integer selects a set of one case.
+        """
+        if isinstance(index, (int, np.integer)):
+            index = slice(index, index + 1 or None)
+        return LoadCaseSet(self.data[index])
+
+    def __iter__(self) -> Iterator[np.void]:
+        """iterate over the records of the cases, no load classes are created"""
+        return iter(self.data)
+
+    @property
+    def case_ids(self) -> np.ndarray:
+        """case ids, (N,)"""
+        return self.data["case_id"]
+
+    @property
+    def loads(self) -> np.ndarray:
+        """load cases about their application points, (N, 6) view"""
+        return self.data["loads"]
+
+    @property
+    def application_points(self) -> np.ndarray:
+        """application points, (N, 3) view"""
+        return self.data["point"]
+
+    def component(self, name: str) -> np.ndarray:
+        """
+        One load component or application point coordinate of all cases
+
+        :param name: one of LOAD_COMPONENTS or POINT_COMPONENTS
+        :type name: str
+        :return: view of the component, (N,)
+        :rtype: np.ndarray
+        """
+        if name in LOAD_COMPONENTS:
+            return self.data["loads"][:, LOAD_COMPONENTS.index(name)]
+        if name in POINT_COMPONENTS:
+            return self.data["point"][:, POINT_COMPONENTS.index(name)]
+        raise KeyError(f"unknown component {name}")
+
+    def select(self, case_ids) -> "LoadCaseSet":
+        """
+        Sub set of the cases with the given ids, in the order of the set
+
+        :param case_ids: case ids to keep
+        :type case_ids: array-like
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        return self[np.isin(self.case_ids, case_ids)]
+
+    def filter(self, mask) -> "LoadCaseSet":
+        """
+        Sub set of the cases where mask is True, e.g. set.filter(set.component("force_x") > 0)
+
+        :param mask: boolean mask, (N,)
+        :type mask: array-like
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        return self[np.asarray(mask, dtype=bool)]
+
+    def chunks(self, chunk_size: int) -> Iterator["LoadCaseSet"]:
+        """
+        Iterate over the set in chunks of at most chunk_size cases (views, no copies)
+
+        :param chunk_size: number of cases per chunk
+        :type chunk_size: int
+        """
+        for start in range(0, len(self), chunk_size):
+            yield LoadCaseSet(self.data[start : start + chunk_size])
+
+    def at_origin(self) -> np.ndarray:
+        r"""
+        Load cases resolved at the origin U
+
+        :math:`M_{U} = M_{P} + r_{P} \times F`
+
+        :return: load cases about the origin, (N, 6)
+        :rtype: np.ndarray
+        """
+        return transfer_loads(self.loads, self.application_points)
+
+    def transfer(self, to_point) -> "LoadCaseSet":
+        """
+        Copy of the set with all cases moved to a new application point
+
+        :param to_point: new application point, (3,) or (N, 3)
+        :type to_point: array-like
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        load_cases = LoadCaseSet(self.data.copy())
+        load_cases.data["loads"] = transfer_loads(
+            self.loads, self.application_points, to_point
+        )
+        load_cases.data["point"] = to_point
+        return load_cases
+
+    def to_objects(self, index: int) -> Tuple[Forces, Moments, ReferencePoint]:
+        """
+        One load case as Forces, Moments and ReferencePoint, named after the case id
+
+        :param index: position of the case in the set
+        :type index: int
+        :return: forces, moments and application point
+        :rtype: tuple
+        """
+        record = self.data[index]
+        name = str(record["case_id"])
+        loads = record["loads"].tolist()
+        return (
+            Forces(name, *loads[:3]),
+            Moments(name, *loads[3:]),
+            ReferencePoint(name, *record["point"].tolist()),
+        )
+
+    @staticmethod
+    def concatenate(load_case_sets: List["LoadCaseSet"]) -> "LoadCaseSet":
+        """
+        Join several load case sets
+
+        :param load_case_sets: load case sets
+        :type load_case_sets: list
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        return LoadCaseSet(np.concatenate([cases.data for cases in load_case_sets]))
+
+
+# pylint: disable=too-many-instance-attributes
+@dataclass(eq=False)
+class LoadCombination:
+    r"""
+    Lazy linear combination of primary load cases.
+
+    Combined case i is :math:`L_{i} = \sum_{j} c_{ij} P_{j}`, with the primary cases P
+    resolved at a common reference point first. The combination factors are kept in
+    compressed sparse row form and the combined cases are only generated chunk by chunk, so
+    millions of combinations never have to exist in memory at the same time.
+
+    :param primary: primary (unit) load cases, (P, 6)
+    :type primary: array-like
+    :param factors: combination factors (C, P), dense, a scipy.sparse matrix or a
+        (rows, columns, values) triplet
+    :type factors: array-like, scipy.sparse matrix, tuple
+    :param application_points: application points of the primary cases, (P, 3) or (3,), None
+        if the moments are given about the reference point
+    :type application_points: array-like
+    :param reference_point: point the combined cases are given about, defaults to the origin
+    :type reference_point: array-like
+    :param case_ids: case id of every combined case, defaults to 0 ... C - 1
+    :type case_ids: array-like
+    :param chunk_size: number of combined cases generated at once
+    :type chunk_size: int
+    :param n_combinations: number of combined cases C, defaults to the number of rows of the
+        factors; needed for triplets whose last combinations are empty
+    :type n_combinations: int
+    """
+
+    primary: np.ndarray
+    factors: object = field(repr=False)
+    application_points: np.ndarray = None
+    reference_point: np.ndarray = None
+    case_ids: np.ndarray = None
+    chunk_size: int = 65536
+    n_combinations: int = None
+    n_cases: int = field(init=False)
+    indptr: np.ndarray = field(init=False, repr=False)
+    indices: np.ndarray = field(init=False, repr=False)
+    values: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """
+        Post initialization of the load combination
+        """
+        self.primary = np.atleast_2d(np.asarray(self.primary, dtype=float))
+        if self.reference_point is None:
+            self.reference_point = np.zeros(3)
+        self.reference_point = np.asarray(self.reference_point, dtype=float)
+        if self.application_points is not None:
+            self.primary = transfer_loads(
+                self.primary, self.application_points, self.reference_point
+            )
+        self.indptr, self.indices, self.values = self.compress_factors(
+            self.factors, self.primary.shape[0], self.n_combinations
+        )
+        self.n_cases = len(self.indptr) - 1
+        if self.case_ids is None:
+            self.case_ids = np.arange(self.n_cases)
+        self.case_ids = np.asarray(self.case_ids)
+
+    @staticmethod
+    def compress_factors(factors, n_primary: int, n_cases: int = None) -> tuple:
+        """
+        Compressed sparse row arrays of the combination factors
+
+        :param factors: dense (C, P) array, scipy.sparse matrix or (rows, columns, values)
+        :param n_primary: number of primary cases P
+        :type n_primary: int
+        :param n_cases: number of combined cases C, defaults to the number of rows of the
+            factors (the largest row index + 1 for triplets)
+        :type n_cases: int
+        :return: indptr (C + 1,), column indices and values of the non zero factors
+        :rtype: tuple
+        """
+        if hasattr(factors, "tocsr"):
+            matrix = factors.tocsr()
+            matrix.sum_duplicates()
+            if matrix.shape[1] != n_primary:
+                raise ValueError(
+                    f"factors have {matrix.shape[1]} columns for {n_primary} primary cases"
+                )
+            if n_cases is not None and matrix.shape[0] != n_cases:
+                raise ValueError(
+                    f"factors have {matrix.shape[0]} rows for {n_cases} combinations"
+                )
+            return (
+                np.asarray(matrix.indptr, dtype=np.int64),
+                np.asarray(matrix.indices, dtype=np.int64),
+                np.asarray(matrix.data, dtype=float),
+            )
+        if isinstance(factors, tuple):
+            rows, columns, values = (np.asarray(item) for item in factors)
+            if n_cases is None:
+                n_cases = int(rows.max()) + 1 if rows.size else 0
+            if rows.size and (rows.min() < 0 or rows.max() >= n_cases):
+                raise ValueError(f"factor rows must be in [0, {n_cases})")
+        else:
+            dense = np.atleast_2d(np.asarray(factors, dtype=float))
+            if dense.shape[1] != n_primary:
+                raise ValueError(
+                    f"factors have {dense.shape[1]} columns for {n_primary} primary cases"
+                )
+            if n_cases is not None and dense.shape[0] != n_cases:
+                raise ValueError(
+                    f"factors have {dense.shape[0]} rows for {n_cases} combinations"
+                )
+            rows, columns = np.nonzero(dense)
+            values = dense[rows, columns]
+            n_cases = dense.shape[0]
+        if columns.size and (columns.min() < 0 or columns.max() >= n_primary):
+            raise ValueError(f"factor columns must be in [0, {n_primary})")
+        order = np.argsort(rows, kind="stable")
+        indptr = np.zeros(n_cases + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(rows, minlength=n_cases))
+        return (
+            indptr,
+            columns[order].astype(np.int64),
+            values[order].astype(float),
+        )
+
+    def __len__(self) -> int:
+        return self.n_cases
+
+    def combine(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """
+        Generate the combined cases start ... stop - 1
+
+        :param start: first combined case
+        :type start: int
+        :param stop: end of the range, defaults to all cases
+        :type stop: int
+        :return: combined cases about the reference point, (stop - start, 6)
+        :rtype: np.ndarray
+        """
+        stop = self.n_cases if stop is None else min(stop, self.n_cases)
+        if not 0 <= start <= stop:
+            raise ValueError(
+                f"invalid range [{start}, {stop}) of {self.n_cases} combined cases"
+            )
+        n_rows = stop - start
+        first, last = self.indptr[start], self.indptr[start + n_rows]
+        rows = np.repeat(
+            np.arange(n_rows), np.diff(self.indptr[start : start + n_rows + 1])
+        )
+        weighted = (
+            self.values[first:last, None] * self.primary[self.indices[first:last]]
+        )
+        combined = np.empty((n_rows, 6))
+        for component in range(6):
+            combined[:, component] = np.bincount(
+                rows, weighted[:, component], minlength=n_rows
+            )
+        return combined
+
+    def chunks(self, chunk_size: int = None) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Iterate over the combined cases in chunks
+
+        :param chunk_size: number of cases per chunk, defaults to self.chunk_size
+        :type chunk_size: int
+        :return: case ids (k,) and combined cases about the reference point (k, 6) of every
+            chunk
+        :rtype: iterator
+        """
+        chunk_size = chunk_size or self.chunk_size
+        for start in range(0, self.n_cases, chunk_size):
+            yield self.case_ids[start : start + chunk_size], self.combine(
+                start, start + chunk_size
+            )
+
+    def to_load_case_set(self, start: int = 0, stop: int = None) -> LoadCaseSet:
+        """
+        Materialize the combined cases start ... stop - 1 as a LoadCaseSet
+
+        :param start: first combined case
+        :type start: int
+        :param stop: end of the range, defaults to all cases
+        :type stop: int
+        :return: load case set
+        :rtype: LoadCaseSet
+        """
+        stop = self.n_cases if stop is None else min(stop, self.n_cases)
+        return LoadCaseSet.from_arrays(
+            self.combine(start, stop),
+            self.reference_point,
+            self.case_ids[start:stop],
+        )
@@ -0,0 +1,230 @@
+r"""general cross-sections from polygons and polylines
+
+Area, first moments and the full inertia tensor of a polygon follow from Green's theorem as
+sums over its edges, with :math:`c_{i} = x_{i} y_{i+1} - x_{i+1} y_{i}`:
+
+- :math:`A = \frac{1}{2} \sum c_{i}`
+- :math:`S_{x} = \int y \, dA = \frac{1}{6} \sum (y_{i} + y_{i+1}) c_{i}`
+- :math:`I_{xx} = \int y^{2} \, dA = \frac{1}{12} \sum (y_{i}^{2} + y_{i} y_{i+1} +
+  y_{i+1}^{2}) c_{i}`
+- :math:`I_{xy} = \int x y \, dA = \frac{1}{24} \sum (x_{i} y_{i+1} + 2 x_{i} y_{i} + 2
+  x_{i+1} y_{i+1} + x_{i+1} y_{i}) c_{i}`
+
+All edges of all rings (outer boundary and holes) are evaluated in one vectorized pass. Arcs
+are discretized to a chord height tolerance with arc_points. Names of the results follow
+Profile.
+"""
+
+from typing import Iterable
+
+import numpy as np
+
+from .profiles_batch import SectionProperties
+
+# pylint: disable=C0103
+
+# default chord height of discretized arcs
+ARC_TOLERANCE = 1e-3
+# moments returned by polygon_moments, in this order
+MOMENTS = ("area", "Sx", "Sy", "Ixx", "Iyy", "Ixy")
+
+
+def _edge_moments(x, y, x_next, y_next) -> np.ndarray:
+    """Green's theorem terms of the edges, (6, ...) ordered like MOMENTS"""
+    cross = x * y_next - x_next * y
+    return np.stack(
+        [
+            cross / 2,
+            (y + y_next) * cross / 6,
+            (x + x_next) * cross / 6,
+            (y * y + y * y_next + y_next * y_next) * cross / 12,
+            (x * x + x * x_next + x_next * x_next) * cross / 12,
+            (x * y_next + 2 * x * y + 2 * x_next * y_next + x_next * y) * cross / 24,
+        ]
+    )
+
+
+def polygon_moments(vertices) -> np.ndarray:
+    """
+    Signed moments of polygons about the origin, positive for counter-clockwise vertices
+
+    :param vertices: vertices of the polygons, (..., n, 2), the last vertex connects to the
+        first
+    :type vertices: array-like
+    :return: area, Sx, Sy, Ixx, Iyy and Ixy, (..., 6)
+    :rtype: np.ndarray
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    following = np.roll(vertices, -1, axis=-2)
+    moments = _edge_moments(
+        vertices[..., 0], vertices[..., 1], following[..., 0], following[..., 1]
+    )
+    return np.moveaxis(moments.sum(axis=-1), 0, -1)
+
+
+def ring_moments(rings: Iterable) -> np.ndarray:
+    """
+    Signed moments of rings with different numbers of vertices, in one pass over all edges
+
+    :param rings: vertices of every ring, (n_i, 2) each
+    :type rings: iterable
+    :return: area, Sx, Sy, Ixx, Iyy and Ixy of every ring, (n_rings, 6)
+    :rtype: np.ndarray
+    """
+    rings = [np.asarray(ring, dtype=float).reshape(-1, 2) for ring in rings]
+    sizes = np.array([len(ring) for ring in rings], dtype=np.int64)
+    if np.any(sizes < 3):
+        raise ValueError("rings need at least 3 vertices")
+    vertices = np.concatenate(rings)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    # index of the following vertex, wrapping around at the end of every ring
+    following = np.arange(1, len(vertices) + 1)
+    following[starts + sizes - 1] = starts
+    moments = _edge_moments(
+        vertices[:, 0],
+        vertices[:, 1],
+        vertices[following, 0],
+        vertices[following, 1],
+    )
+    return np.add.reduceat(moments, starts, axis=1).T
+
+
+def section_from_moments(moments) -> SectionProperties:
+    """
+    Section properties from moments about the origin
+
+    :param moments: area, Sx, Sy, Ixx, Iyy and Ixy, (..., 6)
+    :type moments: array-like
+    :return: section properties, including the products of inertia
+    :rtype: SectionProperties
+    """
+    area, Sx, Sy, Ixx, Iyy, Ixy = np.moveaxis(np.asarray(moments, dtype=float), -1, 0)
+    x_cg = Sy / area
+    y_cg = Sx / area
+    return SectionProperties(
+        area=area,
+        x_cg=x_cg,
+        y_cg=y_cg,
+        Ixg=Ixx - area * y_cg**2,
+        Iyg=Iyy - area * x_cg**2,
+        Ixx=Ixx,
+        Iyy=Iyy,
+        Ixyg=Ixy - area * x_cg * y_cg,
+        Ixy=Ixy,
+    )
+
+
+def polygon_properties(vertices) -> SectionProperties:
+    """
+    Section properties of many simple polygons with the same number of vertices, in either
+    orientation
+
+    :param vertices: vertices of the polygons, (..., n, 2)
+    :type vertices: array-like
+    :return: section properties, arrays of shape (...)
+    :rtype: SectionProperties
+    """
+    moments = polygon_moments(vertices)
+    return section_from_moments(moments * np.sign(moments[..., :1]))
+
+
+def section_properties(outer, holes: Iterable = ()) -> SectionProperties:
+    """
+    Section properties of a polygon with holes, in either orientation
+
+    :param outer: vertices of the outer boundary, (n, 2)
+    :type outer: array-like
+    :param holes: vertices of every hole, (n_i, 2) each
+    :type holes: iterable
+    :return: section properties
+    :rtype: SectionProperties
+    """
+    moments = ring_moments([outer, *holes])
+    # outer boundary counts positive, holes negative, whatever the vertex order
+    signs = -np.sign(moments[:, 0])
+    signs[0] = -signs[0]
+    return section_from_moments((moments * signs[:, None]).sum(axis=0))
+
+
+def arc_points(
+    center,
+    radius: float,
+    start_angle: float,
+    end_angle: float,
+    tolerance: float = ARC_TOLERANCE,
+) -> np.ndarray:
+    """
+    Points on a circular arc, as few as needed to keep the chord height below the tolerance
+
+    :param center: centre of the circle (x, y)
+    :type center: array-like
+    :param radius: radius of the circle
+    :type radius: float
+    :param start_angle: start angle, degrees
+    :type start_angle: float
+    :param end_angle: end angle, degrees, smaller than the start angle for clockwise arcs
+    :type end_angle: float
+    :param tolerance: maximum chord height (distance between arc and chord)
+    :type tolerance: float
+    :return: points including both ends, (n, 2)
+    :rtype: np.ndarray
+    """
+    opening = np.radians(end_angle - start_angle)
+    if radius <= tolerance:
+        n_segments = 1
+    else:
+        # chord height r (1 - cos(step / 2)) = tolerance
+        step = 2 * np.arccos(1 - tolerance / radius)
+        n_segments = max(int(np.ceil(abs(opening) / step)), 1)
+    angles = np.radians(start_angle) + np.linspace(0, opening, n_segments + 1)
+    return np.asarray(center, dtype=float) + radius * np.column_stack(
+        [np.cos(angles), np.sin(angles)]
+    )
+
+
+def circle_points(center, radius: float, tolerance: float = ARC_TOLERANCE):
+    """
+    Closed ring of points on a circle, counter-clockwise
+
+    :param center: centre of the circle (x, y)
+    :type center: array-like
+    :param radius: radius of the circle
+    :type radius: float
+    :param tolerance: maximum chord height
+    :type tolerance: float
+    :return: points, (n, 2)
+    :rtype: np.ndarray
+    """
+    return arc_points(center, radius, 0, 360, tolerance)[:-1]
+
+
+def polyline_properties(points, thickness) -> SectionProperties:
+    """
+    Section properties of a thin-walled section given by its wall centre line, every segment
+    is a rectangle of the segment thickness centred on the line (overlaps at the corners are
+    counted twice, like sub-elements of a Profile)
+
+    :param points: points of the centre line, (n, 2)
+    :type points: array-like
+    :param thickness: wall thickness, scalar or one per segment (n - 1,)
+    :type thickness: array-like
+    :return: section properties
+    :rtype: SectionProperties
+    """
+    points = np.asarray(points, dtype=float)
+    start, end = points[:-1], points[1:]
+    direction = end - start
+    length = np.hypot(direction[:, 0], direction[:, 1])
+    if np.any(length == 0):
+        raise ValueError("polyline segments must have a length")
+    offset = (
+        np.column_stack([-direction[:, 1], direction[:, 0]])
+        / length[:, None]
+        * np.broadcast_to(thickness, length.shape)[:, None]
+        / 2
+    )
+    rectangles = np.stack(
+        [start - offset, end - offset, end + offset, start + offset], axis=1
+    )
+    # all rectangles are counter-clockwise
+    return section_from_moments(polygon_moments(rectangles).sum(axis=0))
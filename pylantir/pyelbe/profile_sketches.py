@@ -0,0 +1,262 @@
+"""headless batch rendering of profile sketches
+
+Profiles are reduced to sketches, plain tuples of the patch parameters and the face colour
+(fc) of their sub-elements, which are cheap to send to worker processes. A page lays out a
+grid of sketches, each scaled into its cell, and draws all patches of the page as one
+PatchCollection on an Agg canvas, without pyplot and without changing the matplotlib
+backend.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Sequence
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.collections import PatchCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Polygon, Rectangle, Wedge
+from matplotlib.transforms import Affine2D
+
+from .profiles import Arc, Fillet, QArc, Rect
+
+# A4 portrait, inches
+PAGE_SIZE = (8.27, 11.69)
+# fraction of its grid cell taken by a sketch
+CELL_FILL = 0.8
+# number of points on the arc of a fillet
+FILLET_POINTS = 9
+
+
+def profile_sketch(profile) -> list:
+    """
+    Sketch of a profile: kind, patch parameters and face colour of every sub-element
+
+    - "rect": lower left point, width, height and angle
+    - "wedge": centre, outer radius, start and end angle and thickness
+    - "fillet": corner, radius; the square of side r in the positive x- and y-direction
+      minus the quarter circle centred at its opposite corner
+
+    :param profile: Profile, or an object holding one as .profile (e.g. LProfile)
+    :type profile: Profile
+    :return: (kind, parameters, fc) of every sub-element
+    :rtype: list
+    """
+    sketch = []
+    for subel in getattr(profile, "profile", profile).subel_list:
+        if isinstance(subel, Rect):
+            params = (subel.pos_x, subel.pos_y, subel.width, subel.height, subel.angle)
+            sketch.append(("rect", params, subel.fc))
+        elif isinstance(subel, (Arc, QArc)):
+            params = (
+                subel.pos_x,
+                subel.pos_y,
+                subel.outer_radius,
+                subel.start_angle,
+                subel.end_angle,
+                subel.thickness,
+            )
+            sketch.append(("wedge", params, subel.fc))
+        elif isinstance(subel, Fillet):
+            sketch.append(
+                ("fillet", (subel.pos_x, subel.pos_y, subel.radius), subel.fc)
+            )
+        else:
+            raise TypeError(f"cannot sketch sub-element {type(subel).__name__}")
+    return sketch
+
+
+def _as_sketch(item) -> list:
+    """sketch of a profile, sketches are passed through"""
+    return item if isinstance(item, list) else profile_sketch(item)
+
+
+def _patch(kind: str, params: tuple):
+    """matplotlib patch of a sketch entry"""
+    if kind == "rect":
+        pos_x, pos_y, width, height, angle = params
+        return Rectangle((pos_x, pos_y), width, height, angle=angle)
+    if kind == "wedge":
+        pos_x, pos_y, radius, start_angle, end_angle, thickness = params
+        return Wedge((pos_x, pos_y), radius, start_angle, end_angle, width=thickness)
+    pos_x, pos_y, radius = params
+    angles = np.radians(np.linspace(270, 180, FILLET_POINTS))
+    arc = np.column_stack(
+        [pos_x + radius * (1 + np.cos(angles)), pos_y + radius * (1 + np.sin(angles))]
+    )
+    return Polygon(np.vstack([[pos_x, pos_y], arc]), closed=True)
+
+
+def page_figure(
+    sketches: Sequence[list],
+    titles: Sequence[str] = None,
+    ncols: int = 4,
+    nrows: int = 6,
+    figsize: tuple = PAGE_SIZE,
+) -> Figure:
+    """
+    Figure of a page of sketches on a grid, filled row by row from the top left
+
+    :param sketches: sketches of the profiles, see profile_sketch, at most ncols * nrows
+    :type sketches: sequence
+    :param titles: title below every sketch
+    :type titles: sequence
+    :param ncols: number of columns of the grid
+    :type ncols: int
+    :param nrows: number of rows of the grid
+    :type nrows: int
+    :param figsize: size of the page, inches
+    :type figsize: tuple
+    :return: figure with an Agg canvas
+    :rtype: Figure
+    """
+    if len(sketches) > ncols * nrows:
+        raise ValueError(
+            f"{len(sketches)} sketches do not fit on a {ncols} x {nrows} page"
+        )
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    axes = figure.add_axes([0, 0, 1, 1])
+    patches, colors = [], []
+    for index, sketch in enumerate(sketches):
+        row, col = divmod(index, ncols)
+        local = [_patch(kind, params) for kind, params, _ in sketch]
+        if not local:
+            continue
+        # vertices in the profile coordinates, before moving the patches into the cell
+        points = np.vstack([patch.get_verts() for patch in local])
+        lower, upper = points.min(axis=0), points.max(axis=0)
+        scale = CELL_FILL / max(upper - lower)
+        transform = (
+            Affine2D()
+            .translate(*(-(lower + upper) / 2))
+            .scale(scale)
+            .translate(col + 0.5, nrows - row - 0.5)
+        )
+        for patch in local:
+            patch.set_transform(transform)
+        patches.extend(local)
+        colors.extend(fc for _, _, fc in sketch)
+        if titles is not None:
+            axes.text(
+                col + 0.5,
+                nrows - row - 1 + (1 - CELL_FILL) / 4,
+                titles[index],
+                ha="center",
+                va="center",
+                fontsize=6,
+            )
+    axes.add_collection(
+        PatchCollection(patches, facecolors=colors, edgecolors="black", linewidths=0.2)
+    )
+    axes.set_xlim(0, ncols)
+    axes.set_ylim(0, nrows)
+    axes.set_aspect("equal")
+    axes.set_axis_off()
+    return figure
+
+
+def _pages(sketches: list, titles, per_page: int) -> list:
+    """sketches and titles of every page"""
+    return [
+        (
+            sketches[start : start + per_page],
+            None if titles is None else list(titles[start : start + per_page]),
+        )
+        for start in range(0, len(sketches), per_page)
+    ]
+
+
+def _map(function: Callable, tasks: list, workers: int = None) -> list:
+    """function over the tasks, in worker processes unless workers is 0 or 1"""
+    if (workers is not None and workers <= 1) or len(tasks) <= 1:
+        return [function(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, tasks))
+
+
+def _save_page(task: tuple) -> str:
+    """render a page into a file"""
+    path, sketches, titles, layout, dpi = task
+    page_figure(sketches, titles, *layout).savefig(path, dpi=dpi)
+    return path
+
+
+# pylint: disable=too-many-arguments
+def render_png(
+    profiles: Sequence,
+    path,
+    titles: Sequence[str] = None,
+    ncols: int = 4,
+    nrows: int = 6,
+    figsize: tuple = PAGE_SIZE,
+    dpi: int = 150,
+    workers: int = None,
+) -> List[Path]:
+    """
+    Render profile sketches into PNG pages of ncols x nrows, path_001.png, path_002.png, ...
+
+    :param profiles: Profile objects, or sketches from profile_sketch
+    :type profiles: sequence
+    :param path: path of the pages without the page number
+    :type path: str, Path
+    :param titles: title below every sketch
+    :type titles: sequence
+    :param ncols: number of columns per page
+    :type ncols: int
+    :param nrows: number of rows per page
+    :type nrows: int
+    :param figsize: size of the pages, inches
+    :type figsize: tuple
+    :param dpi: resolution
+    :type dpi: int
+    :param workers: number of worker processes, None for one per CPU, 0 or 1 to render in
+        this process
+    :type workers: int
+    :return: paths of the pages
+    :rtype: list
+    """
+    path = Path(path)
+    sketches = [_as_sketch(item) for item in profiles]
+    tasks = [
+        (
+            str(path.with_name(f"{path.stem}_{page:03d}.png")),
+            page_sketches,
+            page_titles,
+            (ncols, nrows, figsize),
+            dpi,
+        )
+        for page, (page_sketches, page_titles) in enumerate(
+            _pages(sketches, titles, ncols * nrows), start=1
+        )
+    ]
+    return [Path(item) for item in _map(_save_page, tasks, workers)]
+
+
+def render_pdf(
+    profiles: Sequence,
+    path,
+    titles: Sequence[str] = None,
+    ncols: int = 4,
+    nrows: int = 6,
+    figsize: tuple = PAGE_SIZE,
+) -> Path:
+    """
+    Render profile sketches into a multi-page PDF of ncols x nrows per page, see render_png
+    for the parameters. The pages are vector graphics written to a single stream, so they
+    are drawn in this process.
+
+    :param profiles: Profile objects, or sketches from profile_sketch
+    :type profiles: sequence
+    :param path: path of the PDF
+    :type path: str, Path
+    :return: path of the PDF
+    :rtype: Path
+    """
+    path = Path(path)
+    sketches = [_as_sketch(item) for item in profiles]
+    with PdfPages(path) as pdf:
+        for page_sketches, page_titles in _pages(sketches, titles, ncols * nrows):
+            pdf.savefig(page_figure(page_sketches, page_titles, ncols, nrows, figsize))
+    return path
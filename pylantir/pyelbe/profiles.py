@@ -23,6 +23,7 @@ from .geometry_helpers import (
     inertia_arc_sector,
     inertia_circle_sector,
     inertia_rectangle,
+    product_inertia_rectangle,
     translate_inertia,
 )
 
@@ -144,6 +145,9 @@ class Rect(SubEl):
         self.Ixg, self.Iyg = inertia_rectangle(
             width=self.width, height=self.height, angle=self.angle
         )
+        self.Ixy = product_inertia_rectangle(
+            width=self.width, height=self.height, angle=self.angle
+        )
 
         # self.calc_Ixx_rect()
         # self.Iyy = self.calc_Iyy_rect()
@@ -484,6 +488,7 @@ class Profile:
         self.y_cg = self.calculate_ycg()
         self.Ixg = self.calculate_Ix()
         self.Iyg = self.calculate_Iy()
+        self.Ixyg = self.calculate_Ixy()
 
         # inertia of the profile around the origin
         self.Ixx = translate_inertia(self.Ixg, self.area, self.y_cg)
@@ -573,3 +578,267 @@ class Profile:
         """Calculate the moment of inertia of the profile around the y-axis"""
 
         return sum(i.Iyg + i.area * (i.xcg - self.x_cg) ** 2 for i in self.subel_list)
+
+    def calculate_Ixy(self):
+        """Calculate the product of inertia of the profile in the center of gravity"""
+
+        return sum(
+            getattr(i, "Ixy", 0) + i.area * (i.xcg - self.x_cg) * (i.ycg - self.y_cg)
+            for i in self.subel_list
+        )
+
+    def corner_points(self) -> np.ndarray:
+        """Corners of the rectangular sub-elements, e.g. as stress recovery points
+
+        :return: corner points (x, y), (4 * n_rect, 2)
+        :rtype: np.ndarray
+        """
+        corners = []
+        for subel in self.subel_list:
+            if not isinstance(subel, Rect):
+                continue
+            alpha = radians(subel.angle)
+            rotation = np.array([[cos(alpha), -sin(alpha)], [sin(alpha), cos(alpha)]])
+            width, height = subel.width, subel.height
+            local = np.array([[0, 0], [width, 0], [width, height], [0, height]])
+            corners.append(local @ rotation.T + [subel.pos_x, subel.pos_y])
+        return np.concatenate(corners) if corners else np.empty((0, 2))
+
+    def normal_stress(self, loads, points=None) -> np.ndarray:
+        """Normal stress of many load cases at recovery points, see normal_stress
+
+        :param loads: axial force N and moments Mx, My, (N_cases, 3)
+        :type loads: array-like
+        :param points: recovery points (x, y), (n_points, 2), defaults to the corners of
+            the rectangular sub-elements
+        :type points: array-like
+        :return: normal stress, (N_cases, n_points)
+        :rtype: np.ndarray
+        """
+        if points is None:
+            points = self.corner_points()
+        properties = (self.area, self.x_cg, self.y_cg, self.Ixg, self.Iyg, self.Ixyg)
+        return normal_stress(loads, points, *properties)
+
+
+def normal_stress(loads, points, area, x_cg, y_cg, Ixg, Iyg, Ixyg=0.0) -> np.ndarray:
+    r"""Normal stress of many load cases at recovery points of a section, unsymmetric
+    bending included
+
+    :math:`\sigma = \frac{N}{A} + \frac{M_{y} I_{x} - M_{x} I_{xy}}{D} x +
+    \frac{M_{x} I_{y} - M_{y} I_{xy}}{D} y`, :math:`D = I_{x} I_{y} - I_{xy}^{2}`
+
+    with x, y relative to the center of gravity; for :math:`I_{xy} = 0` this is
+    :math:`\sigma = N/A + M_{y} x / I_{y} + M_{x} y / I_{x}`
+
+    :param loads: axial force N and moments Mx, My, (N_cases, 3)
+    :type loads: array-like
+    :param points: recovery points (x, y), (n_points, 2)
+    :type points: array-like
+    :param area: area of the section
+    :type area: float
+    :param x_cg: x-coordinate of the center of gravity
+    :type x_cg: float
+    :param y_cg: y-coordinate of the center of gravity
+    :type y_cg: float
+    :param Ixg: moment of inertia around the x-axis through the center of gravity
+    :type Ixg: float
+    :param Iyg: moment of inertia around the y-axis through the center of gravity
+    :type Iyg: float
+    :param Ixyg: product of inertia in the center of gravity
+    :type Ixyg: float
+    :return: normal stress, (N_cases, n_points)
+    :rtype: np.ndarray
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 2)
+    x = points[:, 0] - x_cg
+    y = points[:, 1] - y_cg
+    determinant = Ixg * Iyg - Ixyg**2
+    # stress of unit N, Mx and My at every point
+    coefficients = np.stack(
+        [
+            np.full_like(x, 1 / area),
+            (Iyg * y - Ixyg * x) / determinant,
+            (Ixg * x - Ixyg * y) / determinant,
+        ]
+    )
+    return np.asarray(loads, dtype=float).reshape(-1, 3) @ coefficients
+
+
+class ProfileBuilder:
+    """
+    Mutable profile with running moment sums. Adding, removing or replacing a
+    sub-element updates the sums of the area, the first moments, the moments of
+    inertia and the product of inertia around the origin, all section properties
+    follow from them in O(1).
+
+    Unlike Profile, area and center of gravity are not rounded; to_profile returns the
+    equivalent Profile.
+
+    :param subel_list: initial sub-elements
+    :type subel_list: list
+    :param name: name of the profile
+    :type name: str
+    """
+
+    def __init__(self, subel_list: list = None, name: str = "Profile"):
+        """Init function for ProfileBuilder class"""
+        self.name = name
+        self.subels = {}
+        self._next_key = 0
+        self.recompute(subel_list or [])
+
+    @staticmethod
+    def _moments(subel) -> tuple:
+        """area, first and second moments around the origin of a sub-element"""
+        area = subel.area
+        return (
+            area,
+            area * subel.xcg,
+            area * subel.ycg,
+            subel.Ixg + area * subel.ycg**2,
+            subel.Iyg + area * subel.xcg**2,
+            getattr(subel, "Ixy", 0) + area * subel.xcg * subel.ycg,
+        )
+
+    def _update(self, subel, sign: int):
+        """add (1) or subtract (-1) the moments of a sub-element from the sums"""
+        area, Sy, Sx, Ixx, Iyy, Ixy = self._moments(subel)
+        self._area += sign * area
+        self._Sy += sign * Sy
+        self._Sx += sign * Sx
+        self._Ixx += sign * Ixx
+        self._Iyy += sign * Iyy
+        self._Ixy += sign * Ixy
+
+    def recompute(self, subel_list: list = None):
+        """
+        Sum the moments from scratch, e.g. to remove round-off after many edits
+
+        :param subel_list: replace all sub-elements with these, keep them if None
+        :type subel_list: list
+        """
+        if subel_list is not None:
+            self.subels = {}
+            for subel in subel_list:
+                self.subels[self._new_key()] = subel
+        self._area = self._Sy = self._Sx = self._Ixx = self._Iyy = self._Ixy = 0.0
+        for subel in self.subels.values():
+            self._update(subel, 1)
+
+    def _new_key(self):
+        """next free automatic key"""
+        key = self._next_key
+        self._next_key += 1
+        return key
+
+    def add(self, subel, key=None):
+        """
+        Add a sub-element
+
+        :param subel: sub-element
+        :type subel: SubEl
+        :param key: key to address the sub-element later, defaults to a running number
+        :type key: hashable
+        :return: key of the sub-element
+        :rtype: hashable
+        """
+        if key is None:
+            key = self._new_key()
+        elif key in self.subels:
+            raise KeyError(f"{self.name}: sub-element {key} exists, use replace")
+        self.subels[key] = subel
+        self._update(subel, 1)
+        return key
+
+    def remove(self, key):
+        """
+        Remove a sub-element
+
+        :param key: key of the sub-element
+        :type key: hashable
+        :return: the removed sub-element
+        :rtype: SubEl
+        """
+        subel = self.subels.pop(key)
+        self._update(subel, -1)
+        return subel
+
+    def replace(self, key, subel):
+        """
+        Replace a sub-element
+
+        :param key: key of the sub-element
+        :type key: hashable
+        :param subel: new sub-element
+        :type subel: SubEl
+        :return: the replaced sub-element
+        :rtype: SubEl
+        """
+        old = self.subels[key]
+        self._update(old, -1)
+        self.subels[key] = subel
+        self._update(subel, 1)
+        return old
+
+    def __len__(self) -> int:
+        return len(self.subels)
+
+    @property
+    def subel_list(self) -> list:
+        """sub-elements in insertion order"""
+        return list(self.subels.values())
+
+    @property
+    def area(self):
+        """Area of the profile"""
+        return self._area
+
+    @property
+    def x_cg(self):
+        """x-coordinate of the center of gravity of the profile"""
+        return self._Sy / self._area
+
+    @property
+    def y_cg(self):
+        """y-coordinate of the center of gravity of the profile"""
+        return self._Sx / self._area
+
+    @property
+    def Ixx(self):
+        """Moment of inertia of the profile around the x-axis through the origin"""
+        return self._Ixx
+
+    @property
+    def Iyy(self):
+        """Moment of inertia of the profile around the y-axis through the origin"""
+        return self._Iyy
+
+    @property
+    def Ixy(self):
+        """Product of inertia of the profile around the origin"""
+        return self._Ixy
+
+    @property
+    def Ixg(self):
+        """Moment of inertia of the profile around the x-axis through the cg"""
+        return self._Ixx - self._Sx**2 / self._area
+
+    @property
+    def Iyg(self):
+        """Moment of inertia of the profile around the y-axis through the cg"""
+        return self._Iyy - self._Sy**2 / self._area
+
+    @property
+    def Ixyg(self):
+        """Product of inertia of the profile in the cg"""
+        return self._Ixy - self._Sx * self._Sy / self._area
+
+    def to_profile(self) -> Profile:
+        """
+        Profile of the current sub-elements
+
+        :return: profile
+        :rtype: Profile
+        """
+        return Profile(self.subel_list, name=self.name)
@@ -0,0 +1,289 @@
+"""batched section properties
+
+Sub-elements are described by arrays of their area, centre of gravity and inertia in their
+centre of gravity, one array entry per design point. A profile is a list of such sub-elements
+and is composed into arrays of section properties with a few vectorized sums, so a whole grid
+of profile parameters is evaluated at once instead of building SubEl and Profile objects point
+by point. Names follow Profile.
+"""
+
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pandas as pd
+
+from .geometry_kernels import area_rectangle, centroid_rectangle, inertia_rectangle
+
+# pylint: disable=C0103
+
+SECTION_PROPERTIES = ("area", "x_cg", "y_cg", "Ixg", "Iyg", "Ixx", "Iyy")
+ELEMENT_FIELDS = ("area", "xcg", "ycg", "Ixg", "Iyg", "Ixyg")
+
+
+@dataclass
+class ElementArrays:
+    """
+    Sub-element properties over many design points
+
+    :param area: area
+    :type area: np.ndarray
+    :param xcg: x-coordinate of the center of gravity
+    :type xcg: np.ndarray
+    :param ycg: y-coordinate of the center of gravity
+    :type ycg: np.ndarray
+    :param Ixg: moment of inertia around the x-axis through the center of gravity
+    :type Ixg: np.ndarray
+    :param Iyg: moment of inertia around the y-axis through the center of gravity
+    :type Iyg: np.ndarray
+    :param Ixyg: product of inertia in the center of gravity
+    :type Ixyg: np.ndarray
+    """
+
+    area: np.ndarray
+    xcg: np.ndarray
+    ycg: np.ndarray
+    Ixg: np.ndarray
+    Iyg: np.ndarray
+    Ixyg: np.ndarray = 0.0
+
+    def select(self, mask, other: "ElementArrays") -> "ElementArrays":
+        """
+        Element properties of self where mask is True, of other elsewhere
+
+        :param mask: selection of the design points
+        :type mask: np.ndarray
+        :param other: alternative sub-element
+        :type other: ElementArrays
+        :return: merged sub-element
+        :rtype: ElementArrays
+        """
+        return ElementArrays(
+            *(
+                np.where(mask, getattr(self, name), getattr(other, name))
+                for name in ELEMENT_FIELDS
+            )
+        )
+
+    def unstack(self) -> List["ElementArrays"]:
+        """
+        Split sub-elements stacked along the first axis
+
+        :return: one sub-element per entry of the first axis
+        :rtype: list
+        """
+        values = np.broadcast_arrays(*(getattr(self, name) for name in ELEMENT_FIELDS))
+        return [ElementArrays(*fields) for fields in zip(*values)]
+
+
+def rect_elements(width, height, pos_x=0, pos_y=0) -> ElementArrays:
+    """
+    Rectangles, origin is the lower left point like Rect
+
+    :param width: width of the rectangles
+    :type width: array-like
+    :param height: height of the rectangles
+    :type height: array-like
+    :param pos_x: x-coordinate of the lower left points
+    :type pos_x: array-like
+    :param pos_y: y-coordinate of the lower left points
+    :type pos_y: array-like
+    :return: sub-element arrays
+    :rtype: ElementArrays
+    """
+    xcg, ycg = centroid_rectangle(width, height)
+    Ixg, Iyg = inertia_rectangle(width, height)
+    return ElementArrays(
+        area_rectangle(width, height), xcg + pos_x, ycg + pos_y, Ixg, Iyg
+    )
+
+
+def fillet_elements(radius, pos_x=0, pos_y=0, sign_x=1, sign_y=1) -> ElementArrays:
+    r"""
+    Fillets (spandrels), the square of side r with its corner at the given position minus the
+    quarter circle centred at the opposite corner.
+
+    :math:`A = r^{2} (1 - \pi / 4)`, centre of gravity at :math:`r (10 - 3 \pi) / (12 - 3
+    \pi)` from the corner in both directions
+
+    :param radius: radius of the fillets
+    :type radius: array-like
+    :param pos_x: x-coordinate of the corners
+    :type pos_x: array-like
+    :param pos_y: y-coordinate of the corners
+    :type pos_y: array-like
+    :param sign_x: direction of the fillet from the corner in x, 1 or -1
+    :type sign_x: array-like
+    :param sign_y: direction of the fillet from the corner in y, 1 or -1
+    :type sign_y: array-like
+    :return: sub-element arrays
+    :rtype: ElementArrays
+    """
+    radius = np.asarray(radius, dtype=float)
+    area = radius**2 * (1 - np.pi / 4)
+    distance = radius * (10 - 3 * np.pi) / (12 - 3 * np.pi)
+    # inertia around the straight edges minus the parallel axis term
+    inertia = radius**4 * (1 - 5 * np.pi / 16) - area * distance**2
+    product = radius**4 * (19 / 24 - np.pi / 4) - area * distance**2
+    return ElementArrays(
+        area,
+        pos_x + np.multiply(sign_x, distance),
+        pos_y + np.multiply(sign_y, distance),
+        inertia,
+        inertia.copy(),
+        np.multiply(np.multiply(sign_x, sign_y), product),
+    )
+
+
+def annular_sector_elements(
+    inner_radius, outer_radius, start_angle, end_angle, pos_x=0, pos_y=0
+) -> ElementArrays:
+    r"""
+    Annular sectors (arcs of finite thickness), origin is the centre of the circle like Arc.
+
+    Inertia around the centre of the circle, for :math:`\theta_{1} \le \theta \le
+    \theta_{2}`: :math:`I_{x} = \frac{r_{o}^{4} - r_{i}^{4}}{8} (\Delta\theta - \frac{\sin
+    2\theta_{2} - \sin 2\theta_{1}}{2})` and :math:`I_{xy} = \frac{r_{o}^{4} - r_{i}^{4}}{16}
+    (\cos 2\theta_{1} - \cos 2\theta_{2})`, moved to the centre of gravity.
+
+    :param inner_radius: inner radius
+    :type inner_radius: array-like
+    :param outer_radius: outer radius
+    :type outer_radius: array-like
+    :param start_angle: start angle, degrees
+    :type start_angle: array-like
+    :param end_angle: end angle, degrees
+    :type end_angle: array-like
+    :param pos_x: x-coordinate of the centre of the circle
+    :type pos_x: array-like
+    :param pos_y: y-coordinate of the centre of the circle
+    :type pos_y: array-like
+    :return: sub-element arrays
+    :rtype: ElementArrays
+    """
+    inner_radius = np.asarray(inner_radius, dtype=float)
+    outer_radius = np.asarray(outer_radius, dtype=float)
+    start = np.radians(start_angle)
+    end = np.radians(end_angle)
+    opening = end - start
+    area = (outer_radius**2 - inner_radius**2) / 2 * opening
+    first_moment = (outer_radius**3 - inner_radius**3) / 3
+    second_moment = (outer_radius**4 - inner_radius**4) / 8
+    sin_2 = (np.sin(2 * end) - np.sin(2 * start)) / 2
+    cos_2 = (np.cos(2 * start) - np.cos(2 * end)) / 2
+    # zero thickness sectors have no area, keep their centre of gravity finite
+    safe_area = np.where(area == 0, 1.0, area)
+    xcg = first_moment * (np.sin(end) - np.sin(start)) / safe_area
+    ycg = first_moment * (np.cos(start) - np.cos(end)) / safe_area
+    return ElementArrays(
+        area,
+        xcg + pos_x,
+        ycg + pos_y,
+        second_moment * (opening - sin_2) - area * ycg**2,
+        second_moment * (opening + sin_2) - area * xcg**2,
+        second_moment * cos_2 - area * xcg * ycg,
+    )
+
+
+@dataclass
+class SectionProperties:
+    """
+    Section properties over many design points, names follow Profile
+
+    :param area: area of the profile
+    :type area: np.ndarray
+    :param x_cg: x-coordinate of the center of gravity
+    :type x_cg: np.ndarray
+    :param y_cg: y-coordinate of the center of gravity
+    :type y_cg: np.ndarray
+    :param Ixg: moment of inertia around the x-axis through the center of gravity
+    :type Ixg: np.ndarray
+    :param Iyg: moment of inertia around the y-axis through the center of gravity
+    :type Iyg: np.ndarray
+    :param Ixx: moment of inertia around the x-axis through the origin
+    :type Ixx: np.ndarray
+    :param Iyy: moment of inertia around the y-axis through the origin
+    :type Iyy: np.ndarray
+    :param Ixyg: product of inertia in the center of gravity, if calculated
+    :type Ixyg: np.ndarray
+    :param Ixy: product of inertia in the origin, if calculated
+    :type Ixy: np.ndarray
+    """
+
+    area: np.ndarray
+    x_cg: np.ndarray
+    y_cg: np.ndarray
+    Ixg: np.ndarray
+    Iyg: np.ndarray
+    Ixx: np.ndarray
+    Iyy: np.ndarray
+    Ixyg: np.ndarray = None
+    Ixy: np.ndarray = None
+
+    def __len__(self) -> int:
+        return self.area.size
+
+    def to_frame(self, **parameters) -> pd.DataFrame:
+        """
+        Section properties as a flat table, one row per design point
+
+        :param parameters: profile parameters to add as columns, e.g. b=b, h=h
+        :return: table of parameters and section properties
+        :rtype: pd.DataFrame
+        """
+        shape = self.area.shape
+        columns = {
+            name: np.broadcast_to(value, shape).ravel()
+            for name, value in parameters.items()
+        }
+        columns.update(
+            {
+                name: getattr(self, name).ravel()
+                for name in SECTION_PROPERTIES + ("Ixyg", "Ixy")
+                if getattr(self, name) is not None
+            }
+        )
+        return pd.DataFrame(columns)
+
+
+def compose(elements: List[ElementArrays], decimals: int = None) -> SectionProperties:
+    """
+    Combine sub-elements into section properties, the vectorized counterpart of Profile
+
+    :param elements: sub-elements of the profile, broadcastable against each other
+    :type elements: list
+    :param decimals: round the area and the center of gravity like Profile (2), None to keep
+        them exact
+    :type decimals: int
+    :return: section properties
+    :rtype: SectionProperties
+    """
+    # (n_elements, ...) arrays of every sub-element property
+    values = np.broadcast_arrays(
+        *(getattr(item, name) for name in ELEMENT_FIELDS for item in elements)
+    )
+    area, xcg, ycg, Ixg, Iyg, Ixyg = np.stack(values).reshape(
+        (len(ELEMENT_FIELDS), len(elements)) + values[0].shape
+    )
+    total = area.sum(axis=0)
+    x_cg = (area * xcg).sum(axis=0) / total
+    y_cg = (area * ycg).sum(axis=0) / total
+    if decimals is not None:
+        total = np.round(total, decimals)
+        x_cg = np.round(x_cg, decimals)
+        y_cg = np.round(y_cg, decimals)
+
+    Ix = (Ixg + area * (ycg - y_cg) ** 2).sum(axis=0)
+    Iy = (Iyg + area * (xcg - x_cg) ** 2).sum(axis=0)
+    Ixy = (Ixyg + area * (xcg - x_cg) * (ycg - y_cg)).sum(axis=0)
+    return SectionProperties(
+        area=total,
+        x_cg=x_cg,
+        y_cg=y_cg,
+        Ixg=Ix,
+        Iyg=Iy,
+        Ixx=Ix + total * y_cg**2,
+        Iyy=Iy + total * x_cg**2,
+        Ixyg=Ixy,
+        Ixy=Ixy + total * x_cg * y_cg,
+    )
@@ -0,0 +1,208 @@
+r"""open thin-walled sections from their wall midline
+
+The midline is a set of straight segments between nodes, forming a tree (open section, no
+closed cells). All integrals are closed form per segment, with coordinates and the sectorial
+coordinate :math:`\omega` varying linearly along it, e.g. for two linear functions f and g:
+
+:math:`\int f g \, dA = \frac{L t}{6} (2 f_{0} g_{0} + f_{0} g_{1} + f_{1} g_{0} + 2 f_{1}
+g_{1})`
+
+- torsion constant :math:`J = \sum \frac{L t^{3}}{3}`
+- shear centre from the sectorial products about the centroid
+- warping constant :math:`C_{w} = \int \omega_{n}^{2} \, dA` with the normalized sectorial
+  coordinate about the shear centre
+
+Node coordinates may carry leading batch dimensions, (..., n_nodes, 2), for a catalogue of
+sections sharing the same topology; the segment loop is O(n) and vectorized over the batch.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+# pylint: disable=C0103
+
+
+@dataclass
+class ThinWalledProperties:
+    """
+    Properties of open thin-walled sections, arrays over the batch dimensions
+
+    :param area: area
+    :type area: np.ndarray
+    :param x_cg: x-coordinate of the center of gravity
+    :type x_cg: np.ndarray
+    :param y_cg: y-coordinate of the center of gravity
+    :type y_cg: np.ndarray
+    :param Ixg: moment of inertia around the x-axis through the center of gravity
+    :type Ixg: np.ndarray
+    :param Iyg: moment of inertia around the y-axis through the center of gravity
+    :type Iyg: np.ndarray
+    :param Ixyg: product of inertia in the center of gravity
+    :type Ixyg: np.ndarray
+    :param J: torsion constant (St. Venant)
+    :type J: np.ndarray
+    :param x_sc: x-coordinate of the shear centre
+    :type x_sc: np.ndarray
+    :param y_sc: y-coordinate of the shear centre
+    :type y_sc: np.ndarray
+    :param Cw: warping constant about the shear centre
+    :type Cw: np.ndarray
+    """
+
+    area: np.ndarray
+    x_cg: np.ndarray
+    y_cg: np.ndarray
+    Ixg: np.ndarray
+    Iyg: np.ndarray
+    Ixyg: np.ndarray
+    J: np.ndarray
+    x_sc: np.ndarray
+    y_sc: np.ndarray
+    Cw: np.ndarray
+
+
+def polyline_segments(n_points: int) -> np.ndarray:
+    """
+    Segments of an unbranched midline through n points in order
+
+    :param n_points: number of points
+    :type n_points: int
+    :return: node pairs, (n_points - 1, 2)
+    :rtype: np.ndarray
+    """
+    return np.column_stack([np.arange(n_points - 1), np.arange(1, n_points)])
+
+
+def tree_order(segments, n_nodes: int) -> list:
+    """
+    Segments ordered from the first node outwards, every segment after the one leading to it
+
+    :param segments: node pairs, (n_segments, 2)
+    :type segments: array-like
+    :param n_nodes: number of nodes
+    :type n_nodes: int
+    :return: (parent node, child node) of every segment
+    :rtype: list
+    """
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 2)
+    if len(segments) != n_nodes - 1:
+        raise ValueError(
+            f"an open section with {n_nodes} nodes has {n_nodes - 1} segments, "
+            f"got {len(segments)} (closed cells are not supported)"
+        )
+    neighbours = [[] for _ in range(n_nodes)]
+    for first, second in segments.tolist():
+        neighbours[first].append(second)
+        neighbours[second].append(first)
+    order = []
+    visited = {int(segments[0, 0])}
+    queue = [int(segments[0, 0])]
+    while queue:
+        parent = queue.pop(0)
+        for child in neighbours[parent]:
+            if child not in visited:
+                visited.add(child)
+                queue.append(child)
+                order.append((parent, child))
+    if len(visited) != n_nodes:
+        raise ValueError("the midline segments are not connected")
+    return order
+
+
+def _linear_product(dA, f0, f1, g0, g1):
+    """sum of the integrals of f g over the segments, f and g linear along them"""
+    return (dA * (2 * f0 * g0 + f0 * g1 + f1 * g0 + 2 * f1 * g1) / 6).sum(axis=-1)
+
+
+# pylint: disable=too-many-locals
+def thin_walled_properties(nodes, segments, thickness) -> ThinWalledProperties:
+    """
+    Section, torsion and warping properties of open thin-walled sections
+
+    :param nodes: midline nodes, (..., n_nodes, 2)
+    :type nodes: array-like
+    :param segments: node pairs of the midline segments, (n_segments, 2), forming a tree
+    :type segments: array-like
+    :param thickness: wall thickness, scalar or (..., n_segments)
+    :type thickness: array-like
+    :return: section properties
+    :rtype: ThinWalledProperties
+    """
+    nodes = np.asarray(nodes, dtype=float)
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 2)
+    order = tree_order(segments, nodes.shape[-2])
+    start, end = segments[:, 0], segments[:, 1]
+    thickness = np.broadcast_to(
+        np.asarray(thickness, dtype=float), nodes.shape[:-2] + (len(segments),)
+    )
+
+    x, y = nodes[..., 0], nodes[..., 1]
+    length = np.hypot(x[..., end] - x[..., start], y[..., end] - y[..., start])
+    dA = length * thickness
+    area = dA.sum(axis=-1)
+    x_cg = (dA * (x[..., start] + x[..., end])).sum(axis=-1) / (2 * area)
+    y_cg = (dA * (y[..., start] + y[..., end])).sum(axis=-1) / (2 * area)
+
+    # centroidal coordinates of the nodes and at the segment ends
+    x = x - x_cg[..., None]
+    y = y - y_cg[..., None]
+    x0, x1, y0, y1 = x[..., start], x[..., end], y[..., start], y[..., end]
+    Ixg = _linear_product(dA, y0, y1, y0, y1)
+    Iyg = _linear_product(dA, x0, x1, x0, x1)
+    Ixyg = _linear_product(dA, x0, x1, y0, y1)
+    J = (length * thickness**3).sum(axis=-1) / 3
+
+    # sectorial coordinate about the centroid, d omega = x dy - y dx
+    omega = np.zeros_like(x)
+    for parent, child in order:
+        omega[..., child] = (
+            omega[..., parent]
+            + x[..., parent] * y[..., child]
+            - x[..., child] * y[..., parent]
+        )
+    omega_x = _linear_product(dA, omega[..., start], omega[..., end], x0, x1)
+    omega_y = _linear_product(dA, omega[..., start], omega[..., end], y0, y1)
+
+    # shear centre: the sectorial coordinate about it has no products with x and y
+    determinant = Ixg * Iyg - Ixyg**2
+    dx_sc = (Iyg * omega_y - Ixyg * omega_x) / determinant
+    dy_sc = (Ixyg * omega_y - Ixg * omega_x) / determinant
+
+    # normalized sectorial coordinate about the shear centre
+    omega = omega - dx_sc[..., None] * y + dy_sc[..., None] * x
+    omega0, omega1 = omega[..., start], omega[..., end]
+    mean = (dA * (omega0 + omega1)).sum(axis=-1) / (2 * area)
+    omega0 = omega0 - mean[..., None]
+    omega1 = omega1 - mean[..., None]
+    Cw = _linear_product(dA, omega0, omega1, omega0, omega1)
+
+    return ThinWalledProperties(
+        area=area,
+        x_cg=x_cg,
+        y_cg=y_cg,
+        Ixg=Ixg,
+        Iyg=Iyg,
+        Ixyg=Ixyg,
+        J=J,
+        x_sc=x_cg + dx_sc,
+        y_sc=y_cg + dy_sc,
+        Cw=Cw,
+    )
+
+
+def polyline_thin_walled(points, thickness) -> ThinWalledProperties:
+    """
+    Properties of open thin-walled sections given by an unbranched midline polyline
+
+    :param points: midline points in order, (..., n, 2)
+    :type points: array-like
+    :param thickness: wall thickness, scalar or (..., n - 1)
+    :type thickness: array-like
+    :return: section properties
+    :rtype: ThinWalledProperties
+    """
+    points = np.asarray(points, dtype=float)
+    return thin_walled_properties(
+        points, polyline_segments(points.shape[-2]), thickness
+    )
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from pylantir.pyelbe.fasteners import Fastener, FastenerGroup
+
+
+@pytest.fixture
+def hsb_group():
+    """factory for the HSB 21030-01 Issue D 1978 (page 6) example group, translated by offset"""
+
+    def make_group(name="test", offset=(0, 0, 0)):
+        coords = [(-70, 35), (-40, 35), (-40, 15), (-60, 15)]
+        fasteners = [
+            Fastener(
+                name=f"fast{i + 1}",
+                specification="test",
+                material="test",
+                shear_allowable=18500,
+                tension_allowable=12000,
+                x_coord=0 + offset[0],
+                y_coord=y_coord + offset[1],
+                z_coord=z_coord + offset[2],
+            )
+            for i, (y_coord, z_coord) in enumerate(coords)
+        ]
+        return FastenerGroup(name=name, fasteners=fasteners)
+
+    return make_group
@@ -6,6 +6,7 @@ from pylantir.pyelbe.geometry_helpers import (
     area_rectangle,
     centroid_rectangle,
     inertia_rectangle,
+    product_inertia_rectangle,
     area_circle_sector,
     area_arc_sector,
     centroid_circle_sector,
@@ -59,6 +60,15 @@ def test_inertia_rectangle():
     # rotate 45 degrees
 
 
+def test_product_inertia_rectangle():
+    """Test product of inertia of rotated rectangle"""
+    assert product_inertia_rectangle(2, 1) == 0
+    assert isclose(product_inertia_rectangle(2, 1, 45), (8 / 12 - 2 / 12) / 2)
+    assert isclose(product_inertia_rectangle(2, 1, -45), -(8 / 12 - 2 / 12) / 2)
+    # the same rectangle turned by 90 degrees
+    assert isclose(product_inertia_rectangle(2, 1, 90), 0, abs_tol=1e-12)
+
+
 # test for area of circle segment
 def test_area_circle_sector():
     """Test area of circle segment"""
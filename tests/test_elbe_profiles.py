@@ -4,7 +4,9 @@ from math import pi, isclose
 from collections import namedtuple
 import pytest
 
-from pylantir.pyelbe.profiles import SubEl, Profile, Rect, Arc, QArc, Fillet
+from pylantir.pyelbe.profiles import SubEl, Profile, ProfileBuilder, Rect, Arc, QArc, Fillet
+from pylantir.pyelbe.polygon_sections import polygon_properties
+import numpy as np
 from pylantir.pyweser.matreel.material import Material
 
 
@@ -236,4 +238,92 @@ def test_profile_init():
 
 
 
-    
\ No newline at end of file
+    
+
+def test_profile_builder():
+    """test incremental profile edits against a new Profile"""
+    rect_1 = Rect(width=9, height=1, pos_x=1, pos_y=99)
+    rect_2 = Rect(width=1, height=100, pos_x=0, pos_y=0)
+    rect_3 = Rect(width=9, height=1, pos_x=-9, pos_y=0)
+
+    builder = ProfileBuilder([rect_1, rect_2], name="test")
+    key = builder.add(rect_3, key="bottom")
+    assert key == "bottom"
+    assert len(builder) == 3
+    assert builder.subel_list == [rect_1, rect_2, rect_3]
+
+    # same values as the ISAMI checked profile of test_profile_init
+    assert isclose(builder.area, 118)
+    assert isclose(builder.x_cg, 0.5)
+    assert isclose(builder.y_cg, 50)
+    assert round(builder.Ixg) == 127439
+    assert round(builder.Iyg) == 580
+    assert round(builder.Ixx) == 422439
+    assert round(builder.Iyy) == 609
+
+    # replace and remove
+    wide = Rect(width=20, height=1, pos_x=-20, pos_y=0)
+    assert builder.replace("bottom", wide) is rect_3
+    profile = Profile([rect_1, rect_2, wide])
+    assert isclose(builder.area, profile.area)
+    assert isclose(builder.Ixg, profile.calculate_Ix(), rel_tol=1e-3)
+    assert isclose(builder.Ixyg, profile.Ixyg, rel_tol=1e-3)
+    assert builder.Ixyg > 0
+    assert builder.remove(0) is rect_1
+    profile = builder.to_profile()
+    assert profile.subel_list == [rect_2, wide]
+    assert isclose(builder.Iyy, profile.Iyy, rel_tol=1e-3)
+
+    with pytest.raises(KeyError):
+        builder.add(rect_1, key="bottom")
+    with pytest.raises(KeyError):
+        builder.remove(0)
+
+
+def test_profile_normal_stress():
+    """test stress recovery against a single case and unsymmetric bending"""
+    # symmetric I-like profile, 0.5 x 0.5 in the center of gravity
+    rect_1 = Rect(width=10, height=1, pos_x=-5, pos_y=0)
+    rect_2 = Rect(width=1, height=10, pos_x=-0.5, pos_y=1)
+    rect_3 = Rect(width=10, height=1, pos_x=-5, pos_y=11)
+    profile = Profile([rect_1, rect_2, rect_3])
+    assert profile.Ixyg == 0
+    points = profile.corner_points()
+    assert points.shape == (12, 2)
+
+    loads = np.array([[300, 0, 0], [0, 1000, 0], [0, 0, 1000], [300, 1000, -500]])
+    stress = profile.normal_stress(loads, points)
+    assert stress.shape == (4, 12)
+    x = points[:, 0] - profile.x_cg
+    y = points[:, 1] - profile.y_cg
+    expected = 300 / profile.area + 1000 * y / profile.Ixg - 500 * x / profile.Iyg
+    assert np.allclose(stress[3], expected)
+    assert np.allclose(stress[0], 300 / profile.area)
+
+    # unsymmetric L: the moments of the stress field are the applied moments
+    angle = Profile(
+        [
+            Rect(width=20, height=2, pos_x=0, pos_y=0),
+            Rect(width=2, height=28, pos_x=0, pos_y=2),
+        ]
+    )
+    assert angle.Ixyg != 0
+    stress = angle.normal_stress([[0, 1000, 0], [0, 0, 1000]], angle.corner_points())
+    # linear stress field through three corners gives sigma = a x + b y + c
+    corners = angle.corner_points()[:3]
+    field = np.linalg.solve(np.column_stack([corners, np.ones(3)]), stress[:, :3].T)
+    a, b = field[0], field[1]
+    Ix, Iy, Ixy = angle.Ixg, angle.Iyg, angle.Ixyg
+    assert np.allclose(a * Ixy + b * Ix, [1000, 0])
+    assert np.allclose(a * Iy + b * Ixy, [0, 1000])
+
+
+def test_profile_rotated_rect_Ixy():
+    """product of inertia of an inclined rectangle against the polygon of its corners"""
+    profile = Profile([Rect(width=10, height=1, angle=30, pos_x=0, pos_y=0)])
+    polygon = polygon_properties(profile.corner_points())
+    # the profile rounds its center of gravity to 0.01
+    assert isclose(profile.Ixyg, polygon.Ixyg, rel_tol=1e-5)
+    assert isclose(profile.Ixg, polygon.Ixg, rel_tol=1e-5)
+    assert isclose(profile.Iyg, polygon.Iyg, rel_tol=1e-5)
+    assert isclose(profile.Ixyg, 35.72, abs_tol=0.01)
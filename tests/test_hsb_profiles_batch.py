@@ -0,0 +1,153 @@
+"""tests of the batched profile engine"""
+
+from math import isclose
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.hsb.hsb_profiles_batch import (
+    PROFILE_FAMILIES,
+    l_profile_properties,
+    profile_properties,
+)
+from pylantir.pyelbe.polygon_sections import arc_points, section_properties
+from pylantir.pyelbe.profiles import Profile, Rect
+from pylantir.pyelbe.profiles_batch import (
+    annular_sector_elements,
+    compose,
+    fillet_elements,
+    rect_elements,
+)
+
+
+def test_l_profile_hsb_example():
+    """Test the L profiles of the HSB 21030-01 Issue D 1978 example (page 6)"""
+    props = l_profile_properties(100, 100, 2, 2, 4, ["extruded", "bended"], decimals=2)
+    assert props.area.shape == (2,)
+    assert np.allclose(props.x_cg, [25.55, 26.03])
+    assert np.allclose(props.y_cg, props.x_cg)
+    assert isclose(props.Ixg[0], 406188, abs_tol=50)
+    assert isclose(props.Ixg[1], 401556, abs_tol=50)
+    assert np.allclose(props.Iyg, props.Ixg)
+    assert np.allclose(props.Ixx, props.Ixg + props.area * props.y_cg**2)
+
+    with pytest.raises(ValueError):
+        l_profile_properties(100, 100, 2, profile_type="rolled")
+
+
+def test_compose_matches_profile():
+    """Test that composing rectangles gives the same values as Profile"""
+    profile = Profile(
+        [
+            Rect(width=40, height=3, pos_x=0, pos_y=0),
+            Rect(width=2, height=27, pos_x=19, pos_y=3),
+        ]
+    )
+    props = compose(
+        [rect_elements(40, 3, 0, 0), rect_elements(2, 27, 19, 3)], decimals=2
+    )
+    for name in ("area", "x_cg", "y_cg", "Ixg", "Iyg", "Ixx", "Iyy"):
+        assert isclose(getattr(props, name), getattr(profile, name), rel_tol=1e-12)
+
+
+def test_fillet_is_square_minus_quarter_circle():
+    """Test the fillet against a square minus a quarter circle"""
+    radius = np.array([1.0, 4.0])
+    fillet = compose([fillet_elements(radius, 1.0, 2.0)])
+    square = rect_elements(radius, radius, 1.0, 2.0)
+    quarter = annular_sector_elements(0, radius, 180, 270, 1.0 + radius, 2.0 + radius)
+    # removing the quarter circle: negative area, same first and second moments
+    quarter.area, quarter.Ixg, quarter.Iyg = -quarter.area, -quarter.Ixg, -quarter.Iyg
+    difference = compose([square, quarter])
+    for name in ("area", "x_cg", "y_cg", "Ixg", "Iyg"):
+        assert np.allclose(getattr(fillet, name), getattr(difference, name))
+
+
+def test_l_profile_grid():
+    """Test that the parameters broadcast over a design grid"""
+    b, t_fx = np.meshgrid([40.0, 60.0, 80.0], [1.5, 2.0], indexing="ij")
+    props = l_profile_properties(b, 50, t_fx, radius=3, profile_type="bended")
+    assert props.area.shape == (3, 2)
+    single = l_profile_properties(60, 50, 2.0, radius=3, profile_type="bended")
+    assert np.isclose(props.Ixg[1, 1], single.Ixg)
+    frame = props.to_frame(b=b, t_fx=t_fx)
+    assert len(frame) == len(props) == 6
+    assert frame["b"].tolist() == b.ravel().tolist()
+
+
+@pytest.mark.parametrize(
+    "family, args, outline",
+    [
+        (
+            "Z",
+            (30, 50, 2, 3),
+            [(0, 0), (30, 0), (30, 48), (57, 48), (57, 50), (27, 50), (27, 2), (0, 2)],
+        ),
+        (
+            "C",
+            (30, 50, 2, 3),
+            [(0, 0), (30, 0), (30, 2), (3, 2), (3, 48), (30, 48), (30, 50), (0, 50)],
+        ),
+        (
+            "T",
+            (30, 50, 2, 3),
+            [(0, 0), (30, 0), (30, 2), (16.5, 2), (16.5, 50), (13.5, 50), (13.5, 2)]
+            + [(0, 2)],
+        ),
+        (
+            "I",
+            (30, 50, 2, 3),
+            [(0, 0), (30, 0), (30, 2), (16.5, 2), (16.5, 48), (30, 48), (30, 50)]
+            + [(0, 50), (0, 48), (13.5, 48), (13.5, 2), (0, 2)],
+        ),
+        (
+            "hat",
+            (40, 20, 50, 2, 3),
+            [(0, 0), (20, 0), (20, 48), (54, 48), (54, 0), (74, 0), (74, 2), (57, 2)]
+            + [(57, 50), (17, 50), (17, 2), (0, 2)],
+        ),
+    ],
+)
+def test_profile_families_sharp_corners(family, args, outline):
+    """Test the extruded profile families without fillets against their outline"""
+    props = profile_properties(family, *args)
+    polygon = section_properties(outline)
+    for name in ("area", "x_cg", "y_cg", "Ixg", "Iyg", "Ixyg"):
+        assert isclose(getattr(props, name), getattr(polygon, name), abs_tol=1e-9)
+
+
+def test_bended_channel():
+    """Test a bended channel against its outline with discretized bends"""
+    b, h, t, r = 30.0, 50.0, 2.0, 4.0
+    outline = np.concatenate(
+        [
+            [(b, 0)],
+            arc_points((t + r, t + r), t + r, 270, 180, 1e-6),
+            arc_points((t + r, h - t - r), t + r, 180, 90, 1e-6),
+            [(b, h), (b, h - t)],
+            arc_points((t + r, h - t - r), r, 90, 180, 1e-6),
+            arc_points((t + r, t + r), r, 180, 270, 1e-6),
+            [(b, t)],
+        ]
+    )
+    props = profile_properties("C", b, h, t, radius=r, profile_type="bended")
+    polygon = section_properties(outline)
+    for name in ("area", "x_cg", "y_cg", "Ixg", "Iyg"):
+        assert isclose(getattr(props, name), getattr(polygon, name), rel_tol=1e-6)
+
+
+def test_profile_families_batch():
+    """Test that every family broadcasts over profile types and parameters"""
+    b = np.linspace(20, 60, 1000)[:, None]
+    profile_type = np.array(["extruded", "bended"])
+    for family, elements in PROFILE_FAMILIES.items():
+        args = (b, 20, 50) if family == "hat" else (b, 50)
+        props = profile_properties(
+            family, *args, 2, radius=3, profile_type=profile_type
+        )
+        assert props.area.shape == (1000, 2)
+        single = compose(elements(60, *args[1:], 2, radius=3, profile_type="bended"))
+        assert isclose(props.Ixg[-1, 1], single.Ixg)
+
+    with pytest.raises(ValueError):
+        profile_properties("U", 30, 50, 2)
@@ -0,0 +1,72 @@
+"""tests of the section property cache"""
+
+import json
+from math import isclose
+
+import pytest
+
+from pylantir.pyelbe.hsb.hsb_profiles import (
+    SectionPropertyCache,
+    cached_l_profile_properties,
+    l_profile_key,
+)
+from pylantir.pyelbe.hsb.hsb_profiles_batch import l_profile_properties
+
+PARAMETERS = dict(b=60, h=40, profile_type="extruded", t_fx=2, t_fy=3, radius=4)
+
+
+def test_cache_hits_and_values():
+    """Test that cached properties equal those of the batched L profile"""
+    cache = SectionPropertyCache()
+    first = cached_l_profile_properties(**PARAMETERS, cache=cache)
+    second = cached_l_profile_properties(**PARAMETERS, cache=cache)
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    expected = l_profile_properties(60, 40, 2, 3, 4, "extruded", decimals=2)
+    for name in first._fields:
+        assert isclose(getattr(first, name), getattr(expected, name))
+    assert isclose(first.area, 237.43)
+    # an angle is unsymmetric
+    assert first.Ixyg != 0
+
+    # integers and floats are the same profile
+    assert l_profile_key(**PARAMETERS) == l_profile_key(
+        **{**PARAMETERS, "b": 60.0, "t_fx": 2.0}
+    )
+    # t_fy of bended profiles is t_fx
+    assert l_profile_key(60, 40, "bended", 2, 5) == l_profile_key(60, 40, "bended", 2)
+
+
+def test_cache_eviction():
+    """Test that the least recently used profile is evicted"""
+    cache = SectionPropertyCache(maxsize=2)
+    for b in (50, 60, 50, 70):
+        cached_l_profile_properties(**{**PARAMETERS, "b": b}, cache=cache)
+    assert len(cache) == 2
+    assert l_profile_key(**{**PARAMETERS, "b": 60}) not in cache
+    assert l_profile_key(**{**PARAMETERS, "b": 50}) in cache
+
+
+def test_cache_persistence(tmp_path):
+    """Test saving and loading the cache"""
+    path = tmp_path / "profiles.json"
+    cache = SectionPropertyCache(path=path)
+    expected = cached_l_profile_properties(**PARAMETERS, cache=cache)
+    cache.save()
+
+    loaded = SectionPropertyCache(path=path)
+    assert len(loaded) == 1
+    assert cached_l_profile_properties(**PARAMETERS, cache=loaded) == expected
+    assert (loaded.hits, loaded.misses) == (1, 0)
+
+    with pytest.raises(ValueError):
+        SectionPropertyCache().save()
+
+    # files of the first format, a plain list of entries without Ixyg, are rejected
+    old = tmp_path / "old.json"
+    old.write_text(
+        json.dumps([[list(l_profile_key(**PARAMETERS)), list(expected)[:7]]])
+    )
+    with pytest.raises(ValueError):
+        SectionPropertyCache(path=old)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+
+import contextlib
+import io
+
+import numpy as np
+import pandas as pd
+
+from pylantir.pyelbe.hsb import hsb_21030_10, hsb_21030_10_batch
+from pylantir.pyelbe.hsb.hsb_21030_10 import Hsb2103001
+from pylantir.pyelbe.hsb.hsb_21030_10_batch import (
+    Envelope,
+    GroupInfluence,
+    Hsb2103001Workspace,
+    interaction_reserve_factor,
+    solve_load_cases,
+)
+from pylantir.pyelbe.hsb.hsb_formulas import moments_transformation, riv_field
+from pylantir.pyelbe.load_transfer import transfer_loads
+from pylantir.pyelbe.loads import Moments, Forces
+from pylantir.pyelbe.abstractions import ReferencePoint
+
+
+def random_loads(n_cases, seed=0):
+    """random load cases and application points"""
+    rng = np.random.default_rng(seed)
+    loads = rng.normal(size=(n_cases, 6)) * [1e4, 1e4, 1e4, 1e5, 1e5, 1e5]
+    points = rng.normal(size=(n_cases, 3)) * 50
+    return loads, points
+
+
+def test_solve_load_cases(hsb_group):
+    """the vectorized solve reproduces Hsb2103001 case by case"""
+    group = hsb_group()
+    loads, points = random_loads(5)
+    result = solve_load_cases(group, loads, points)
+    assert result.shear_forces.shape == (5, 4)
+
+    for case in range(5):
+        with contextlib.redirect_stdout(io.StringIO()):
+            calc = Hsb2103001(
+                name="case",
+                fastener_group=group,
+                forces=Forces("forces", *loads[case, :3]),
+                moments=Moments("moments", *loads[case, 3:]),
+                application_point=ReferencePoint("P", *points[case]),
+                reference_point=ReferencePoint("U", 0, 0, 0),
+            )
+        assert np.allclose(result.force_fsy[case], calc.force_fsy)
+        assert np.allclose(result.force_fsz[case], calc.force_fsz)
+        assert np.allclose(result.tension_forces[case], calc.tension_forces)
+        assert np.allclose(result.reserve_factor_shear[case], calc.reserve_factor_shear)
+
+
+def test_envelope(hsb_group):
+    """chunked envelope equals the envelope of the full set"""
+    influence = GroupInfluence(hsb_group())
+    loads, points = random_loads(100)
+    result = solve_load_cases(influence, loads, points)
+    full = Envelope.from_result(result)
+
+    assert np.allclose(full.max_shear, result.shear_forces.max(axis=0))
+    assert np.array_equal(full.max_shear_case, result.shear_forces.argmax(axis=0))
+
+    chunked = Envelope(influence.n_fasteners)
+    for start in range(0, 100, 30):
+        chunked.update(
+            solve_load_cases(
+                influence, loads[start : start + 30], points[start : start + 30]
+            )
+        )
+    assert chunked.n_cases == 100
+    assert np.array_equal(chunked.max_tension_case, full.max_tension_case)
+    assert np.allclose(chunked.min_rf_tension, full.min_rf_tension)
+
+    merged = Envelope.from_result(solve_load_cases(influence, loads[:50], points[:50]))
+    merged.merge(
+        Envelope.from_result(
+            solve_load_cases(influence, loads[50:], points[50:]),
+            case_ids=np.arange(50, 100),
+        )
+    )
+    assert np.array_equal(merged.min_rf_shear_case, full.min_rf_shear_case)
+
+
+def test_interaction_reserve_factor():
+    """closed forms and Newton iteration satisfy the interaction equation"""
+    rng = np.random.default_rng(3)
+    ratio_s = rng.uniform(0, 2, size=(50, 4))
+    ratio_t = rng.uniform(-1, 2, size=(50, 4))
+    ratio_t[0] = 0
+    for exp_s, exp_t in ((2, 2), (1, 2), (2, 1), (1.5, 2.5), (1, 3)):
+        rf_combined = interaction_reserve_factor(ratio_s, ratio_t, exp_s, exp_t)
+        residual = (
+            (rf_combined * ratio_s) ** exp_s
+            + (rf_combined * np.clip(ratio_t, 0, None)) ** exp_t
+            - 1
+        )
+        assert np.allclose(residual, 0, atol=1e-10)
+        assert np.all(rf_combined <= 1 / ratio_s + 1e-12)
+
+    assert np.isinf(interaction_reserve_factor(0.0, 0.0, 1.5, 2.5))
+
+
+def test_combined_envelope(hsb_group):
+    """combined reserve factors are enveloped in the same pass"""
+    loads, points = random_loads(200, seed=4)
+    result = solve_load_cases(hsb_group(), loads, points, interaction=(2, 3))
+    envelope = Envelope.from_result(result)
+    assert np.allclose(
+        envelope.min_rf_combined, result.reserve_factor_combined.min(axis=0)
+    )
+    assert np.all(envelope.min_rf_combined <= envelope.min_rf_shear)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        calc = Hsb2103001(
+            name="case",
+            fastener_group=hsb_group(),
+            forces=Forces("forces", *loads[0, :3]),
+            moments=Moments("moments", *loads[0, 3:]),
+            application_point=ReferencePoint("P", *points[0]),
+            reference_point=ReferencePoint("U", 0, 0, 0),
+        )
+    assert np.allclose(
+        calc.calculate_fastener_interaction_reserve_factor(2, 3),
+        result.reserve_factor_combined[0],
+    )
+
+
+def test_workspace(hsb_group):
+    """repeated single case solves reuse the buffers and match the batch solve"""
+    loads, points = random_loads(20, seed=5)
+    batch = solve_load_cases(hsb_group(), loads, points)
+    workspace = Hsb2103001Workspace(hsb_group())
+
+    buffer = workspace.result.shear_forces
+    for case in range(20):
+        result = workspace.solve(loads[case], points[case])
+        assert result.shear_forces is buffer
+        assert np.allclose(result.shear_forces, batch.shear_forces[case])
+        assert np.allclose(result.tension_forces, batch.tension_forces[case])
+        assert np.allclose(
+            result.reserve_factor_tension, batch.reserve_factor_tension[case]
+        )
+
+    own = workspace.allocate_result()
+    workspace.solve(loads[0], points[0], out=own)
+    workspace.solve(loads[1], points[1])
+    assert np.allclose(own.force_fsz, batch.force_fsz[0])
+
+
+def test_equilibrium_check(hsb_group):
+    """the fastener forces reproduce the applied loads, in batch, per case and per rivet field"""
+    group = hsb_group()
+    loads, points = random_loads(20)
+    result = solve_load_cases(group, loads, points, check_equilibrium=True)
+    assert result.equilibrium_residuals.shape == (20, 6)
+    assert not result.equilibrium_violations.any()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        calc = Hsb2103001(
+            name="case",
+            fastener_group=group,
+            forces=Forces("forces", *loads[0, :3]),
+            moments=Moments("moments", *loads[0, 3:]),
+            application_point=ReferencePoint("P", *points[0]),
+            reference_point=ReferencePoint("U", 0, 0, 0),
+            check_equilibrium=True,
+        )
+    assert calc.equilibrium_ok
+    assert np.allclose(calc.equilibrium_residuals, result.equilibrium_residuals[0])
+
+    rivets = pd.DataFrame(
+        {
+            "Shear": group.shear,
+            "Tension": group.tension,
+            "X": group.y_array,
+            "Y": [fastener.z_coord for fastener in group.fasteners],
+        }
+    )
+    res, _ = riv_field(
+        loads[0, :3], loads[0, 3:], points[0], rivets, check_equilibrium=True
+    )
+    assert res.attrs["equilibrium_ok"]
+    assert np.allclose(res.attrs["equilibrium_residuals"], 0, atol=1e-6)
+
+
+def test_equilibrium_check_detects_wrong_transformation(hsb_group, monkeypatch):
+    """swapping y and z of the application point in the transformation fails the check"""
+
+    def swapped_transformation(moments, forces, point):
+        swapped = ReferencePoint(
+            point.name, point.x_coord, point.z_coord, point.y_coord
+        )
+        return moments_transformation(moments, forces, swapped)
+
+    def swapped_loads_at_origin(loads, application_points=None):
+        return transfer_loads(loads, np.asarray(application_points)[..., [0, 2, 1]])
+
+    monkeypatch.setattr(hsb_21030_10, "moments_transformation", swapped_transformation)
+    monkeypatch.setattr(hsb_21030_10_batch, "loads_at_origin", swapped_loads_at_origin)
+    group = hsb_group()
+    loads, points = random_loads(20)
+
+    result = solve_load_cases(group, loads, points, check_equilibrium=True)
+    assert result.equilibrium_violations.all()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        calc = Hsb2103001(
+            name="case",
+            fastener_group=group,
+            forces=Forces("forces", *loads[0, :3]),
+            moments=Moments("moments", *loads[0, 3:]),
+            application_point=ReferencePoint("P", *points[0]),
+            reference_point=ReferencePoint("U", 0, 0, 0),
+            check_equilibrium=True,
+        )
+    assert not calc.equilibrium_ok
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from math import isclose
+import numpy as np
+
+from pylantir.pyelbe.hsb.hsb_21030_10 import Hsb2103001
+from pylantir.pyelbe.hsb.hsb_21030_10_dedup import (
+    canonical_group,
+    solve_deduplicated,
+)
+from pylantir.pyelbe.loads import Moments, Forces
+from pylantir.pyelbe.abstractions import ReferencePoint
+from pylantir.pyelbe.fasteners import FastenerGroup
+
+
+def test_canonical_group(hsb_group):
+    """translated groups share the same key, different allowables do not"""
+    key_1, origin_1 = canonical_group(hsb_group("a"))
+    key_2, origin_2 = canonical_group(hsb_group("b", offset=(100, 250.5, -3)))
+    assert key_1 == key_2
+    assert np.allclose(origin_2 - origin_1, (100, 250.5, -3))
+
+    group = hsb_group("c")
+    group.fasteners[0].shear_allowable = 1
+    group = FastenerGroup(name="c", fasteners=group.fasteners)
+    assert canonical_group(group)[0] != key_1
+
+
+def test_solve_deduplicated(hsb_group):
+    """duplicated joints and load cases are solved once and match the direct solve"""
+    offset = (10, 200, -50)
+    group_1 = hsb_group("clip_1")
+    group_2 = hsb_group("clip_2", offset=offset)
+    forces = Forces(name="forces", force_x=10000, force_y=12000, force_z=-2000)
+    moments = Moments(name="moments", moment_x=-240000, moment_y=200000, moment_z=0)
+    point_1 = ReferencePoint(name="P", x_coord=30, y_coord=0, z_coord=0)
+    point_2 = ReferencePoint(
+        name="P", x_coord=30 + offset[0], y_coord=offset[1], z_coord=offset[2]
+    )
+    other = Forces(name="forces", force_x=5000, force_y=0, force_z=1000)
+
+    instances = [
+        (group_1, forces, moments, point_1),
+        (group_2, forces, moments, point_2),
+        (group_1, forces, moments, point_1),
+        (group_2, other, moments, point_2),
+    ]
+    result = solve_deduplicated(instances)
+
+    assert len(result) == 4
+    assert result.n_unique == 2
+    assert list(result.index) == [0, 0, 0, 1]
+
+    direct = Hsb2103001(
+        name="direct",
+        fastener_group=hsb_group("direct"),
+        forces=forces,
+        moments=moments,
+        application_point=point_1,
+        reference_point=ReferencePoint(name="U", x_coord=0, y_coord=0, z_coord=0),
+    )
+    for instance in range(3):
+        assert np.allclose(result[instance].shear_forces, direct.shear_forces)
+        assert np.allclose(result[instance].tension_forces, direct.tension_forces)
+
+    fanned = result.fan_out()
+    assert len(fanned) == 4
+    assert np.allclose(fanned[1]["Y"], group_2.y_array)
+    assert isclose(fanned[1]["Shear Force"][0], direct.shear_forces[0])
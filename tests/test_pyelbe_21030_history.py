@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pylantir.pyelbe.hsb.hsb_21030_10_batch import solve_load_cases
+from pylantir.pyelbe.hsb.hsb_21030_10_history import fastener_histories
+
+
+def test_fastener_histories(tmp_path, hsb_group):
+    """chunked memory mapped histories equal the batch solve of every sample"""
+    rng = np.random.default_rng(0)
+    history = rng.normal(size=(1000, 6)) * [1e4, 1e4, 1e4, 1e5, 1e5, 1e5]
+    np.save(tmp_path / "history.npy", history)
+    point = (30, 5, -10)
+
+    histories = fastener_histories(
+        hsb_group(),
+        tmp_path / "history.npy",
+        application_point=point,
+        output=tmp_path / "out",
+        chunk_size=128,
+        shear_components=True,
+    )
+    expected = solve_load_cases(hsb_group(), history, point)
+    assert len(histories) == 1000
+    assert histories.shear.dtype == np.float32
+
+    shear = np.load(tmp_path / "out" / "shear.npy", mmap_mode="r")
+    tension = np.load(tmp_path / "out" / "tension.npy", mmap_mode="r")
+    assert np.allclose(shear, expected.shear_forces, rtol=1e-5)
+    assert np.allclose(tension, expected.tension_forces, rtol=1e-5, atol=1e-2)
+    assert np.allclose(histories.shear_y, expected.force_fsy, rtol=1e-5, atol=1e-2)
+
+    in_memory = fastener_histories(hsb_group(), history, point, dtype=np.float64)
+    assert np.allclose(in_memory.tension, expected.tension_forces)
+
+    # plain nested lists are accepted as well
+    from_list = fastener_histories(
+        hsb_group(), history[:10].tolist(), point, dtype=np.float64
+    )
+    assert np.allclose(from_list.tension, expected.tension_forces[:10])
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+from pylantir.pyelbe.hsb.hsb_21030_10_batch import Envelope, solve_load_cases
+from pylantir.pyelbe.hsb.hsb_21030_10_pipeline import (
+    prefetch,
+    read_chunks,
+    run_pipeline,
+)
+from pylantir.pyelbe.loads import LOAD_COMPONENTS, POINT_COMPONENTS
+
+
+def load_file_data(n_cases, seed=0):
+    """random load cases with application points"""
+    rng = np.random.default_rng(seed)
+    loads = rng.normal(size=(n_cases, 6)) * [1e4, 1e4, 1e4, 1e5, 1e5, 1e5]
+    points = rng.normal(size=(n_cases, 3)) * 50
+    return loads, points
+
+
+def test_read_chunks(tmp_path):
+    """CSV and NPY files are read in bounded chunks with the same content"""
+    loads, points = load_file_data(250)
+    csv_path = tmp_path / "loads.csv"
+    frame = pd.DataFrame(
+        np.hstack([loads, points]), columns=LOAD_COMPONENTS + POINT_COMPONENTS
+    )
+    frame.insert(0, "case_id", np.arange(250) + 1000)
+    frame.to_csv(csv_path, index=False)
+    npy_path = tmp_path / "loads.npy"
+    np.save(npy_path, np.hstack([loads, points]))
+
+    csv_chunks = list(read_chunks(csv_path, chunk_size=100))
+    npy_chunks = list(prefetch(read_chunks(npy_path, chunk_size=100), max_pending=1))
+    assert [len(chunk) for chunk in csv_chunks] == [100, 100, 50]
+    assert csv_chunks[0].case_ids[0] == 1000
+    for csv_chunk, npy_chunk in zip(csv_chunks, npy_chunks):
+        assert np.allclose(csv_chunk.at_origin(), npy_chunk.at_origin())
+
+
+def test_run_pipeline(tmp_path, hsb_group):
+    """the streamed envelope and written results equal the in-memory solve"""
+    loads, points = load_file_data(500, seed=1)
+    npy_path = tmp_path / "loads.npy"
+    np.save(npy_path, np.hstack([loads, points]))
+    output = tmp_path / "results.csv"
+
+    envelope = run_pipeline(hsb_group(), npy_path, chunk_size=64, output=output)
+    result = solve_load_cases(hsb_group(), loads, points)
+    full = Envelope.from_result(result)
+    assert envelope.n_cases == 500
+    assert np.allclose(envelope.max_shear, full.max_shear)
+    assert np.array_equal(envelope.min_rf_shear_case, full.min_rf_shear_case)
+
+    written = pd.read_csv(output)
+    assert len(written) == 500 * 4
+    assert np.allclose(written["Ft"].to_numpy(), result.tension_forces.ravel())
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.hsb.hsb_21030_10_screening import (
+    screen_load_cases,
+    solve_screened,
+)
+
+
+def test_solve_screened(hsb_group):
+    """screened envelope equals the full envelope with far fewer cases"""
+    rng = np.random.default_rng(1)
+    loads = rng.normal(size=(5000, 6)) * [1e4, 1e4, 1e4, 1e5, 1e5, 1e5]
+
+    result = solve_screened(hsb_group(), loads, verify=True)
+    assert result.verified
+    assert result.reduction > 10
+    assert np.array_equal(
+        result.envelope.max_shear_case, result.full_envelope.max_shear_case
+    )
+
+
+def test_screen_load_cases_methods(hsb_group):
+    """hull and direction sampling keep only extreme cases of the cloud"""
+    rng = np.random.default_rng(2)
+    loads = rng.normal(size=(2000, 6))
+    # the corners of the cloud must be retained
+    loads[0] = 100
+    loads[1] = -100
+
+    directions = screen_load_cases(hsb_group(), loads, method="directions", seed=0)
+    assert {0, 1} <= set(directions)
+    assert len(directions) < 2000
+
+    pytest.importorskip("scipy")
+    hull = screen_load_cases(hsb_group(), loads, method="hull")
+    assert {0, 1} <= set(hull)
+    assert set(directions) <= set(hull)
+
+    with pytest.raises(ValueError):
+        screen_load_cases(hsb_group(), loads, method="unknown")
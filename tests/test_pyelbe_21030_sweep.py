@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pylantir.pyelbe.hsb.hsb_21030_10_batch import solve_load_cases
+from pylantir.pyelbe.hsb.hsb_21030_10_sweep import application_point_sweep, grid_points
+
+
+def test_application_point_sweep(hsb_group):
+    """the closed form sweep equals solving every application point"""
+    loads = np.array([10000, 12000, -2000, -240000, 200000, 5000], dtype=float)
+    points = grid_points(np.linspace(0, 60, 4), np.linspace(-80, 0, 5), [0, 25])
+    sweep = application_point_sweep(hsb_group(), loads, points, interaction=(2, 2))
+    assert sweep.shear_forces.shape == (4, 5, 2, 4)
+    assert sweep.min_rf_shear.shape == (4, 5, 2)
+
+    direct = solve_load_cases(
+        hsb_group(),
+        np.tile(loads, (40, 1)),
+        points.reshape(-1, 3),
+        interaction=(2, 2),
+    )
+    assert np.allclose(sweep.shear_forces.reshape(-1, 4), direct.shear_forces)
+    assert np.allclose(sweep.tension_forces.reshape(-1, 4), direct.tension_forces)
+    assert np.allclose(
+        sweep.reserve_factor_combined.reshape(-1, 4), direct.reserve_factor_combined
+    )
+    best = sweep.best_point("min_rf_shear")
+    assert np.isclose(
+        sweep.min_rf_shear.max(), direct.reserve_factor_shear.min(axis=1).max()
+    )
+    assert best.shape == (3,)
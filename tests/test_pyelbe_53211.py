@@ -0,0 +1,79 @@
+"""tests of the HSB 53211-01 crippling strength of short sections"""
+
+from math import isclose
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.hsb.hsb_53211_01 import (
+    SECTION_ELEMENTS,
+    c_section_elements,
+    crippling,
+    effective_section,
+    i_section_elements,
+    l_section_elements,
+)
+from pylantir.pyelbe.hsb.hsb_profiles_batch import profile_properties
+
+E_C, R_P02 = 72000.0, 400.0
+
+
+def test_average_widths():
+    """Test the average widths against Figure 1"""
+    bended = l_section_elements(40, 30, 2, radius=4, profile_type="bended")
+    assert np.allclose(bended.b, [40 - (2 + 2) / 2, 30 - (2 + 2) / 2])  # (3-1)
+    channel = c_section_elements(30, 50, 2, radius=4, profile_type="bended")
+    assert np.allclose(channel.b, [28, 46, 28])  # (3-1), (3-5)
+    assert np.allclose(channel.k, [0.43, 4.0, 0.43])
+
+    reduction = 1 - 0.2 * 16 / 6
+    extruded = l_section_elements(40, 30, 2, 3, radius=4)
+    assert np.allclose(extruded.b, [40 - 1.5 * reduction, 30 - reduction])  # (3-2)
+    channel = c_section_elements(30, 50, 2, 3, radius=4)
+    assert isclose(channel.b[1], 50 - 2 * reduction)  # (3-6)
+
+    fillets = 0.2 * 16 / 6
+    section = i_section_elements(40, 60, 2, 3, radius=4)
+    assert isclose(section.b[0], 20 - 1.5 * (0.25 * 1.5 - fillets))  # (3-3)
+    assert isclose(section.b[2], 60 - 2 * (2 - 0.5 * 1.5 - fillets))  # (3-7)
+
+    with pytest.raises(ValueError):
+        i_section_elements(40, 60, 2, profile_type="bended")
+
+
+def test_average_widths_keep_the_area():
+    """Test that the element areas add up to about the area of the profile"""
+    for family, args in [
+        ("L", (40, 30, 2, 3)),
+        ("C", (30, 50, 2, 3)),
+        ("T", (40, 30, 2, 3)),
+        ("I", (40, 60, 2, 3)),
+        ("hat", (40, 20, 50, 2, 3)),
+    ]:
+        elements = SECTION_ELEMENTS[family](*args, radius=3)
+        area = profile_properties(family, *args, radius=3).area
+        assert isclose(elements.area.sum(), area, rel_tol=0.01)
+
+
+def test_effective_section():
+    """Test the iterated effective sections of a catalogue of channels"""
+    t = np.linspace(0.8, 3, 50)[:, None]
+    elements = c_section_elements(40, 60, t, radius=3, profile_type="bended")
+    capacity = crippling(elements, E_C, R_P02).load
+    load = capacity * np.array([0.1, 0.5, 0.99, 1.1])
+    result = effective_section(elements, load, E_C, R_P02)
+    assert result.stress.shape == result.effective_area.shape == (50, 4)
+    assert result.effective_width.shape == (50, 4, 3)
+
+    assert np.all(result.crippled == (load > capacity))
+    assert np.all(result.converged)
+    valid = ~result.crippled
+    assert np.allclose(
+        result.effective_area[valid] * result.stress[valid], load[valid], rtol=1e-8
+    )
+    assert np.all(result.stress[valid] <= R_P02)
+    assert np.all(result.effective_width <= elements.b + 1e-12)
+
+    # a single iteration is not enough for buckled sections
+    short = effective_section(elements, load, E_C, R_P02, max_iterations=1)
+    assert not np.all(short.converged)
@@ -0,0 +1,115 @@
+"""tests of the column buckling and crippling screening"""
+
+from math import isclose, pi
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.column_screening import (
+    MODES,
+    column_allowables,
+    column_grid,
+    material_arrays,
+    minimum_inertia,
+    needham_crippling,
+    profile_arrays,
+)
+from pylantir.pyelbe.hsb.hsb_profiles import LProfile
+from pylantir.pyelbe.hsb.hsb_profiles_batch import (
+    l_profile_column_grid,
+    l_profile_properties,
+)
+from pylantir.pyelbe.polygon_sections import section_properties
+from pylantir.pyelbe.profiles import ProfileBuilder, Rect
+
+E, FCC = 72000.0, 300.0
+
+
+def test_euler_johnson():
+    """Test the Euler and Johnson branches and the transition between them"""
+    transition = pi * np.sqrt(2 * E / FCC)
+    # rho = 1: the length is the slenderness
+    lengths = np.array([0.0, 0.5, 1.0, 2.0]) * transition
+    allowables = column_allowables(1.0, 1.0, FCC, E, lengths)
+    assert allowables.mode_names.tolist() == ["johnson", "johnson", "euler", "euler"]
+    assert isclose(allowables.allowable_stress[0], FCC)
+    assert isclose(allowables.allowable_stress[1], FCC * (1 - 0.25 / 2))
+    assert isclose(allowables.allowable_stress[2], FCC / 2)
+    assert isclose(allowables.allowable_stress[3], pi**2 * E / lengths[3] ** 2)
+
+    # fixed ends quadruple the Euler stress
+    fixed = column_allowables(1.0, 1.0, FCC, E, lengths[3], fixity=4.0)
+    assert isclose(fixed.euler_stress, 4 * allowables.euler_stress[3])
+
+
+def test_minimum_inertia_of_angle():
+    """Test the principal inertia of a batched angle against the polygon engine"""
+    props = l_profile_properties(60, 40, 3, 2)
+    polygon = section_properties([(0, 0), (60, 0), (60, 3), (2, 3), (2, 40), (0, 40)])
+    assert isclose(props.Ixyg, polygon.Ixyg)
+    assert isclose(
+        minimum_inertia(props.Ixg, props.Iyg, props.Ixyg),
+        minimum_inertia(polygon.Ixg, polygon.Iyg, polygon.Ixyg),
+    )
+    assert minimum_inertia(props.Ixg, props.Iyg, props.Ixyg) < min(props.Ixg, props.Iyg)
+
+
+def test_column_grid():
+    """Test the design grid layout against single evaluations"""
+    materials = material_arrays(
+        [SimpleNamespace(E=72000.0), SimpleNamespace(E1=110000.0, E=None)],
+        [400.0, 900.0],
+    )
+    profiles = dict(b=np.array([30.0, 50.0]), h=30.0, t_fx=2.0, radius=3.0)
+    lengths = [100.0, 500.0, 1500.0]
+    grid = l_profile_column_grid(profiles, lengths, ["pinned", "fixed"], materials)
+    assert grid.allowable_stress.shape == (2, 3, 2, 2)
+    assert set(np.unique(grid.mode)) <= set(range(len(MODES)))
+    # longer columns carry less
+    assert np.all(np.diff(grid.allowable_stress, axis=1) < 0)
+
+    props = l_profile_properties(50.0, 30.0, 2.0, radius=3.0)
+    crippling = needham_crippling(40.0, 2.0, 110000.0, 900.0)
+    single = column_allowables(
+        props.area,
+        minimum_inertia(props.Ixg, props.Iyg, props.Ixyg),
+        crippling,
+        110000.0,
+        500.0,
+        4.0,
+    )
+    assert isclose(grid.allowable_stress[1, 1, 1, 1], single.allowable_stress)
+    assert isclose(grid.allowable_load[1, 1, 1, 1], single.allowable_load)
+
+    with pytest.raises(ValueError):
+        material_arrays([SimpleNamespace(E=72000.0)], [400.0, 500.0])
+
+
+def test_profile_objects():
+    """Test the screening of LProfile objects"""
+    profiles = [
+        LProfile(b=b, h=30, profile_type="extruded", t_fx=2, t_fy=2, radius=3)
+        for b in (30, 50)
+    ]
+    arrays = profile_arrays(profiles)
+    assert np.allclose(arrays["area"], [item.area for item in profiles])
+    assert np.allclose(arrays["b_prime"], [30, 40])
+    grid = column_grid(arrays, [300.0], [1.0], {"E": [E], "fcy": [FCC]})
+    assert grid.allowable_stress.shape == (2, 1, 1, 1)
+    assert np.all(grid.crippling_stress <= FCC)
+
+    # the product of inertia of an unsymmetric builder section lowers I_min
+    builder = ProfileBuilder(
+        [
+            Rect(width=60, height=3, pos_x=0, pos_y=0),
+            Rect(width=2, height=37, pos_x=0, pos_y=3),
+        ]
+    )
+    arrays = profile_arrays([builder])
+    assert isclose(
+        arrays["I_min"][0], minimum_inertia(builder.Ixg, builder.Iyg, builder.Ixyg)
+    )
+    assert arrays["I_min"][0] < min(builder.Ixg, builder.Iyg)
+    with pytest.raises(TypeError):
+        profile_arrays([SimpleNamespace(area=1.0, Ixg=1.0, Iyg=1.0)])
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+from math import isclose
+import numpy as np
+
+from pylantir.pyelbe.fasteners import RainflowDamage, SNCurve, fatigue_damage
+
+
+def test_rainflow_astm_example():
+    """ASTM E1049 example: ranges 3 (0.5), 4 (1.5), 6 (0.5), 8 (1.0), 9 (0.5)"""
+    history = np.array([-2, 1, -3, 5, -1, 3, -4, 4, -2.0])[:, None]
+    linear = SNCurve(slope=1, reference_amplitude=1, reference_cycles=1)
+    expected = (0.5 * 3 + 1.5 * 4 + 0.5 * 6 + 1.0 * 8 + 0.5 * 9) / 2
+    for chunk_size in (1, 2, 9):
+        assert isclose(fatigue_damage(history, linear, chunk_size)[0], expected)
+
+    counter = RainflowDamage(1, linear).update(history)
+    assert isclose(counter.cycles[0], 1.0)
+
+
+def test_rainflow_vectorized():
+    """fasteners are counted independently, in any chunking, with a bounded stack"""
+    rng = np.random.default_rng(0)
+    histories = np.cumsum(rng.normal(size=(2000, 5)), axis=0)
+    histories[:, 4] = 0.0
+    sn_curve = SNCurve(
+        slope=np.array([3, 4, 5, 5, 5]), reference_amplitude=10, endurance_amplitude=0.1
+    )
+
+    damage = fatigue_damage(histories, sn_curve, chunk_size=2000)
+    assert np.allclose(fatigue_damage(histories, sn_curve, chunk_size=37), damage)
+    for fastener in range(4):
+        single = SNCurve(slope=sn_curve.slope[fastener], reference_amplitude=10)
+        single.endurance_amplitude = 0.1
+        assert isclose(
+            fatigue_damage(histories[:, [fastener]], single)[0], damage[fastener]
+        )
+    assert damage[4] == 0
+
+    bounded = RainflowDamage(5, sn_curve, max_depth=8)
+    bounded.update(histories)
+    assert bounded.depth.max() <= 8
+    assert np.all(bounded.total_damage()[:4] > 0)
+
+
+def test_rainflow_flat_segments():
+    """repeated samples do not change the count, also across chunk boundaries"""
+    history = np.array([-2, 1, -3, 5, -1, 3, -4, 4, -2.0])
+    flat = np.repeat(history, [1, 3, 2, 1, 4, 1, 2, 5, 1])
+    ramps = np.concatenate([[0.0], np.linspace(0, 1, 4)[1:], [1, 1, 0.5, 0.0]])
+    linear = SNCurve(slope=1, reference_amplitude=1, reference_cycles=1)
+    expected = fatigue_damage(history[:, None], linear)[0]
+    for chunk_size in (1, 3, 100):
+        assert isclose(fatigue_damage(flat[:, None], linear, chunk_size)[0], expected)
+        counter = RainflowDamage(1, linear)
+        for start in range(0, ramps.size, chunk_size):
+            counter.update(ramps[start : start + chunk_size, None])
+        assert isclose(counter.total_damage()[0], 0.5)
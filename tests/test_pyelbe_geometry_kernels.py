@@ -0,0 +1,89 @@
+"""tests of the vectorized geometry kernels against the scalar helpers"""
+
+import numpy as np
+
+from pylantir.pyelbe import geometry_helpers as helpers
+from pylantir.pyelbe import geometry_kernels as kernels
+
+RNG = np.random.default_rng(40)
+RADIUS = RNG.uniform(0.5, 5, 20)
+THICKNESS = RNG.uniform(0.1, 2, 20)
+START = RNG.uniform(-180, 180, 20)
+END = START + RNG.uniform(10, 360, 20)
+WIDTH = RNG.uniform(0.1, 10, 20)
+HEIGHT = RNG.uniform(0.1, 10, 20)
+ANGLE = RNG.uniform(-90, 90, 20)
+
+
+def scalar(function, *args, **kwargs):
+    """scalar helper evaluated element by element, stacked like the kernel output"""
+    return np.array(
+        [function(*values, **kwargs) for values in zip(*args)], dtype=float
+    ).T
+
+
+def test_rectangle_kernels():
+    """Test the rectangle kernels against the scalar helpers"""
+    assert np.allclose(
+        kernels.area_rectangle(WIDTH, HEIGHT),
+        scalar(helpers.area_rectangle, WIDTH, HEIGHT),
+    )
+    assert np.allclose(
+        kernels.centroid_rectangle(WIDTH, HEIGHT, ANGLE),
+        scalar(helpers.centroid_rectangle, WIDTH, HEIGHT, ANGLE),
+    )
+    assert np.allclose(
+        kernels.inertia_rectangle(WIDTH, HEIGHT, ANGLE),
+        scalar(helpers.inertia_rectangle, WIDTH, HEIGHT, ANGLE),
+    )
+    assert np.allclose(
+        kernels.product_inertia_rectangle(WIDTH, HEIGHT, ANGLE),
+        scalar(helpers.product_inertia_rectangle, WIDTH, HEIGHT, ANGLE),
+    )
+    Ix, Iy = kernels.inertia_rectangle(WIDTH, HEIGHT)
+    assert np.allclose(
+        kernels.rotate_inertia(Ix, Iy, 0.1 * Ix, ANGLE),
+        scalar(helpers.rotate_inertia, Ix, Iy, 0.1 * Ix, ANGLE),
+    )
+    assert np.allclose(
+        kernels.translate_inertia(Ix, WIDTH, HEIGHT, 1.0),
+        scalar(helpers.translate_inertia, Ix, WIDTH, HEIGHT, np.ones(20)),
+    )
+
+
+def test_sector_kernels():
+    """Test the circle and arc sector kernels against the scalar helpers"""
+    assert np.allclose(
+        kernels.area_circle_sector(RADIUS, START, END),
+        scalar(helpers.area_circle_sector, RADIUS, START, END),
+    )
+    assert np.allclose(
+        kernels.area_arc_sector(RADIUS, THICKNESS, START, END),
+        scalar(helpers.area_arc_sector, RADIUS, THICKNESS, START, END),
+    )
+    assert np.allclose(
+        kernels.centroid_circle_sector(RADIUS, START, END),
+        scalar(helpers.centroid_circle_sector, RADIUS, START, END),
+    )
+    assert np.allclose(
+        kernels.centroid_arc_sector(RADIUS, THICKNESS, START, END),
+        scalar(helpers.centroid_arc_sector, RADIUS, THICKNESS, START, END),
+    )
+    for cg in (True, False):
+        assert np.allclose(
+            kernels.inertia_circle_sector(RADIUS, START, END, cg=cg),
+            scalar(helpers.inertia_circle_sector, RADIUS, START, END, cg=cg),
+        )
+        assert np.allclose(
+            kernels.inertia_arc_sector(RADIUS, THICKNESS, START, END, cg=cg),
+            scalar(helpers.inertia_arc_sector, RADIUS, THICKNESS, START, END, cg=cg),
+        )
+
+
+def test_kernels_broadcast():
+    """Test that scalars and arrays broadcast, e.g. one radius for many angles"""
+    Cx, Cy = kernels.centroid_arc_sector(2.0, 0.5, np.zeros((3, 1)), [[90, 180]])
+    assert Cx.shape == Cy.shape == (3, 2)
+    assert np.isclose(Cx[0, 0], helpers.centroid_arc_sector(2.0, 0.5, 0, 90)[0])
+    area = kernels.area_rectangle(2, 3)
+    assert area.shape == () and area == 6.0
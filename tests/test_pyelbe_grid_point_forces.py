@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pylantir.pyelbe.grid_point_forces import Interface, extract_interface_loads
+from pylantir.pyelbe.load_transfer import transfer_loads
+
+
+def gpforce_line(point, element, source, values):
+    """one f06 table line"""
+    numbers = "".join(f"{value:15.6E}" for value in values)
+    point = f"{point:8d}" if point else " " * 8
+    element = f"{element:14d}" if element else " " * 14
+    return f"0{point}{element}       {source:8s}{numbers}\n"
+
+
+def test_extract_interface_loads(tmp_path):
+    """element contributions of the free body are summed at the joint reference point"""
+    rng = np.random.default_rng(0)
+    coordinates = {101: (0, 10, 0), 102: (0, 30, 5), 103: (50, 0, 0)}
+    interface = Interface(
+        "J1", grids=[101, 102], elements=[11, 12], reference_point=(5, 20, 0)
+    )
+    expected = {1: np.zeros(6), 2: np.zeros(6)}
+
+    lines = ["1    MODEL                                                    PAGE 1\n"]
+    lines.append("0   DISPLACEMENT VECTOR\n")
+    lines.append(gpforce_line(101, 0, "G", rng.normal(size=6)))
+    for subcase in (1, 2):
+        lines.append(
+            f"1    MODEL                                       SUBCASE {subcase}\n"
+        )
+        lines.append("0        G R I D   P O I N T   F O R C E   B A L A N C E\n")
+        lines.append(
+            "   POINT-ID    ELEMENT-ID     SOURCE   T1   T2   T3   R1   R2   R3\n"
+        )
+        for point in (101, 102, 103):
+            if point == 102:
+                # page break inside the table
+                lines.append(
+                    f"1    MODEL                                   SUBCASE {subcase}\n"
+                )
+                lines.append(
+                    "0        G R I D   P O I N T   F O R C E   B A L A N C E\n"
+                )
+            lines.append(gpforce_line(point, 0, "APP-LOAD", rng.normal(size=6)))
+            for position, element in enumerate((11, 12, 13)):
+                values = rng.normal(size=6) * 1000
+                lines.append(
+                    gpforce_line(
+                        point if position == 0 else 0, element, "QUAD4", values
+                    )
+                )
+                if point in (101, 102) and element in (11, 12):
+                    expected[subcase] += transfer_loads(
+                        values, coordinates[point], (5, 20, 0)
+                    )
+            lines.append(gpforce_line(point, 0, "*TOTALS*", rng.normal(size=6)))
+    path = tmp_path / "model.f06"
+    path.write_text("".join(lines))
+
+    loads = extract_interface_loads(path, [interface], coordinates, buffer_rows=3)
+    cases = loads["J1"]
+    assert list(cases.case_ids) == [1, 2]
+    assert np.allclose(cases.application_points, (5, 20, 0))
+    assert np.allclose(cases.loads[0], expected[1], atol=1e-2)
+    assert np.allclose(cases.loads[1], expected[2], atol=1e-2)
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.load_store import LoadCaseStore
+from pylantir.pyelbe.hsb.hsb_21030_10_batch import solve_load_cases
+
+
+def test_load_case_store(tmp_path, hsb_group):
+    """named and tagged selection reads the right rows from the memory maps"""
+    rng = np.random.default_rng(0)
+    n_cases = 1000
+    loads = rng.normal(size=(n_cases, 6)) * [1e4, 1e4, 1e4, 1e5, 1e5, 1e5]
+    points = rng.normal(size=(n_cases, 3))
+    names = [f"LC{case:05d}" for case in range(n_cases)][::-1]
+    load_types = rng.choice(["gust", "manoeuvre", "ground"], n_cases)
+    joints = rng.choice(["J1", "J2"], n_cases)
+
+    store = LoadCaseStore.write(
+        tmp_path / "store",
+        loads,
+        points,
+        names,
+        tags={"load_type": load_types, "joint": joints},
+    )
+    store = LoadCaseStore(tmp_path / "store")
+    assert len(store) == n_cases
+    assert isinstance(store.loads, np.memmap)
+
+    rows = store.rows(["LC00007", "LC00500"])
+    assert list(rows) == [n_cases - 1 - 7, n_cases - 1 - 500]
+    with pytest.raises(KeyError):
+        store.rows(["missing"])
+
+    gust = store.select(load_type="gust", joint="J2")
+    expected = np.nonzero((load_types == "gust") & (joints == "J2"))[0]
+    assert np.array_equal(gust.case_ids, expected)
+    assert np.allclose(gust.loads, loads[expected])
+    assert np.all(store.tag_values("joint", gust.case_ids) == "J2")
+    assert len(store.select(load_type=["gust", "ground"])) == np.sum(
+        load_types != "manoeuvre"
+    )
+    assert len(store.select(load_type="unknown")) == 0
+
+    result = solve_load_cases(hsb_group(), gust)
+    direct = solve_load_cases(hsb_group(), loads[expected], points[expected])
+    assert np.allclose(result.shear_forces, direct.shear_forces)
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pylantir.pyelbe.load_transfer import (
+    euler_rotation,
+    rotate_loads,
+    to_global,
+    to_local,
+    transfer_loads,
+    transfer_to_points,
+)
+from pylantir.pyelbe.hsb.hsb_formulas import moments_transformation
+from pylantir.pyelbe.loads import Moments, Forces
+from pylantir.pyelbe.abstractions import ReferencePoint
+
+
+def test_transfer_loads():
+    """vectorized transfer reproduces moments_transformation"""
+    rng = np.random.default_rng(0)
+    loads = rng.normal(size=(10, 6))
+    points = rng.normal(size=(10, 3))
+    loads_u = transfer_loads(loads, points)
+
+    for case in range(10):
+        moments_u = moments_transformation(
+            Moments("m", *loads[case, 3:]),
+            Forces("f", *loads[case, :3]),
+            ReferencePoint("P", *points[case]),
+        )
+        assert np.allclose(loads_u[case, 3:], moments_u)
+    assert np.allclose(loads_u[:, :3], loads[:, :3])
+
+    interfaces = rng.normal(size=(4, 3))
+    per_interface = transfer_to_points(loads, points, interfaces)
+    assert per_interface.shape == (4, 10, 6)
+    assert np.allclose(
+        per_interface[2], transfer_loads(loads_u, (0, 0, 0), interfaces[2])
+    )
+
+
+def test_rotation():
+    """Euler angles, rotation of the loads and local / global round trip"""
+    rotation = euler_rotation([0, 0, 90], degrees=True)
+    assert np.allclose(rotation @ [1, 0, 0], [0, 1, 0])
+
+    rng = np.random.default_rng(1)
+    angles = rng.uniform(-np.pi, np.pi, size=(20, 3))
+    rotations = euler_rotation(angles, sequence="zyx")
+    assert np.allclose(rotations @ np.swapaxes(rotations, -1, -2), np.eye(3))
+    assert np.allclose(
+        rotations[5],
+        euler_rotation([0, 0, angles[5, 0]], "xyz")
+        @ euler_rotation([0, angles[5, 1], 0], "xyz")
+        @ euler_rotation([angles[5, 2], 0, 0], "xyz"),
+    )
+
+    loads = rng.normal(size=(20, 6))
+    rotated = rotate_loads(loads, rotations)
+    assert np.allclose(
+        np.linalg.norm(rotated[:, :3], axis=1), np.linalg.norm(loads[:, :3], axis=1)
+    )
+
+    origin = rng.normal(size=3)
+    points = rng.normal(size=(20, 3))
+    local = to_local(loads, points, origin, angles=angles, sequence="zyx")
+    back = to_global(local, origin, angles=angles, sequence="zyx", to_points=points)
+    assert np.allclose(back, loads)
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.loads import Forces, LoadCaseSet, LoadCombination, Moments
+from pylantir.pyelbe.abstractions import ReferencePoint
+from pylantir.pyelbe.load_transfer import transfer_loads
+from pylantir.pyelbe.hsb.hsb_21030_10_batch import (
+    Envelope,
+    solve_combinations,
+    solve_load_cases,
+)
+
+
+def test_load_case_set():
+    """construction, slicing, filtering and chunking without per case objects"""
+    rng = np.random.default_rng(0)
+    loads = rng.normal(size=(100, 6))
+    points = rng.normal(size=(100, 3))
+    cases = LoadCaseSet.from_arrays(loads, points, case_ids=np.arange(100) + 1000)
+
+    assert len(cases) == 100
+    assert np.array_equal(cases.loads, loads)
+    assert np.array_equal(cases.component("moment_y"), loads[:, 4])
+    assert np.array_equal(cases.component("z_coord"), points[:, 2])
+
+    view = cases[10:20]
+    view.loads[0, 0] = 5.0
+    assert cases.loads[10, 0] == 5.0
+    assert len(cases[-1]) == 1 and cases[-1].case_ids[0] == 1099
+
+    positive = cases.filter(cases.component("force_x") > 0)
+    assert np.all(positive.loads[:, 0] > 0)
+    assert list(cases.select([1005, 1001]).case_ids) == [1001, 1005]
+    assert sum(len(chunk) for chunk in cases.chunks(30)) == 100
+    assert len(LoadCaseSet.concatenate([cases[:10], cases[90:]])) == 20
+
+    with pytest.raises(TypeError):
+        LoadCaseSet(loads)
+
+
+def test_load_case_set_objects(hsb_group):
+    """conversion to and from Forces, Moments and ReferencePoint"""
+    forces = [Forces("f", 10000, 12000, -2000), Forces("f", 5000, 0, 1000)]
+    moments = [Moments("m", -240000, 200000, 0), Moments("m", 0, 0, 1000)]
+    points = [ReferencePoint("P", 30, 0, 0), ReferencePoint("P", 0, 10, 5)]
+    cases = LoadCaseSet.from_objects(forces, moments, points)
+
+    force, moment, point = cases.to_objects(1)
+    assert force.namedtuple == forces[1].namedtuple
+    assert moment.namedtuple == moments[1].namedtuple
+    assert point.namedtuple == points[1].namedtuple
+
+    result = solve_load_cases(hsb_group(), cases)
+    expected = solve_load_cases(hsb_group(), cases.loads, cases.application_points)
+    assert np.allclose(result.tension_forces, expected.tension_forces)
+
+
+def test_load_combination():
+    """lazy chunked combinations equal the dense product, for all factor formats"""
+    rng = np.random.default_rng(2)
+    primary = rng.normal(size=(5, 6))
+    points = rng.normal(size=(5, 3))
+    factors = rng.normal(size=(50, 5)) * (rng.random((50, 5)) < 0.4)
+    expected = factors @ transfer_loads(primary, points)
+
+    combination = LoadCombination(primary, factors, application_points=points)
+    assert len(combination) == 50
+    chunked = np.vstack([loads for _, loads in combination.chunks(7)])
+    assert np.allclose(chunked, expected)
+
+    rows, columns = np.nonzero(factors)
+    triplet = LoadCombination(
+        primary,
+        (rows, columns, factors[rows, columns]),
+        application_points=points,
+        case_ids=np.arange(50) + 100,
+    )
+    assert np.allclose(triplet.combine(10, 20), expected[10:20])
+    cases = triplet.to_load_case_set(0, 5)
+    assert list(cases.case_ids) == [100, 101, 102, 103, 104]
+    with pytest.raises(ValueError):
+        triplet.combine(60)
+
+    # trailing empty combinations are kept with an explicit number of combinations
+    padded = LoadCombination(
+        primary, (rows, columns, factors[rows, columns]), points, n_combinations=60
+    )
+    assert len(padded) == 60
+    assert np.allclose(padded.combine(50), 0)
+    with pytest.raises(ValueError):
+        LoadCombination(
+            primary, (rows, columns, factors[rows, columns]), n_combinations=10
+        )
+
+    sparse = pytest.importorskip("scipy.sparse")
+    matrix = LoadCombination(primary, sparse.csr_matrix(factors), points)
+    assert np.allclose(matrix.combine(), expected)
+
+
+def test_solve_combinations(hsb_group):
+    """the chunked combination envelope equals the envelope of the materialized cases"""
+    rng = np.random.default_rng(3)
+    primary = rng.normal(size=(4, 6)) * [1e4, 1e4, 1e4, 1e5, 1e5, 1e5]
+    factors = rng.uniform(-1.5, 1.5, size=(300, 4))
+    combination = LoadCombination(primary, factors, reference_point=(30, 0, 0))
+
+    envelope = solve_combinations(hsb_group(), combination, chunk_size=64)
+    full = Envelope.from_result(
+        solve_load_cases(hsb_group(), factors @ primary, (30, 0, 0))
+    )
+    assert envelope.n_cases == 300
+    assert np.allclose(envelope.max_shear, full.max_shear)
+    assert np.array_equal(envelope.max_tension_case, full.max_tension_case)
@@ -0,0 +1,96 @@
+"""tests of the polygon section engine"""
+
+from math import isclose, pi
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.geometry_kernels import rotate_inertia
+from pylantir.pyelbe.hsb.hsb_profiles_batch import l_profile_properties
+from pylantir.pyelbe.polygon_sections import (
+    arc_points,
+    circle_points,
+    polygon_properties,
+    polyline_properties,
+    ring_moments,
+    section_properties,
+)
+
+RECTANGLE = [(1, 2), (5, 2), (5, 3), (1, 3)]
+
+
+def test_rectangle():
+    """Test a rectangle in both orientations"""
+    for vertices in (RECTANGLE, RECTANGLE[::-1]):
+        props = section_properties(vertices)
+        assert isclose(props.area, 4)
+        assert isclose(props.x_cg, 3)
+        assert isclose(props.y_cg, 2.5)
+        assert isclose(props.Ixg, 4 * 1**2 / 12)
+        assert isclose(props.Iyg, 1 * 4**3 / 12)
+        assert isclose(props.Ixyg, 0, abs_tol=1e-12)
+        assert isclose(props.Ixy, 4 * 3 * 2.5)
+
+
+def test_rotated_rectangle():
+    """Test the product of inertia of a rotated rectangle"""
+    angle = np.radians(30)
+    rotation = np.array(
+        [[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]]
+    )
+    vertices = np.array([(0, 0), (4, 0), (4, 1), (0, 1)]) @ rotation.T
+    props = section_properties(vertices)
+    # rotating the section by +30 degrees is rotating the axes by -30 degrees
+    Iu, Iv, Iuv = rotate_inertia(1 / 3, 16 / 3, 0, -30)
+    assert np.allclose([props.Ixg, props.Iyg, props.Ixyg], [Iu, Iv, Iuv])
+
+
+def test_l_profile_polygon():
+    """Test an L profile without radius against the batched L profile"""
+    props = section_properties([(0, 0), (100, 0), (100, 2), (3, 2), (3, 80), (0, 80)])
+    reference = l_profile_properties(100, 80, 2, 3)
+    for name in ("area", "x_cg", "y_cg", "Ixg", "Iyg", "Ixx", "Iyy"):
+        assert isclose(getattr(props, name), getattr(reference, name))
+
+
+def test_tube_with_arcs():
+    """Test a tube from discretized circles against the closed form values"""
+    outer = circle_points((10, 5), 20, tolerance=1e-4)
+    inner = circle_points((10, 5), 18, tolerance=1e-4)
+    props = section_properties(outer, [inner])
+    assert isclose(props.area, pi * (20**2 - 18**2), rel_tol=1e-4)
+    assert isclose(props.x_cg, 10) and isclose(props.y_cg, 5)
+    assert isclose(props.Ixg, pi / 4 * (20**4 - 18**4), rel_tol=1e-4)
+    assert isclose(props.Ixyg, 0, abs_tol=1e-6 * props.Ixg)
+
+    # chord height within the tolerance, finer tolerance needs more points
+    points = arc_points((0, 0), 10, 0, 90, tolerance=0.01)
+    middle = (points[1:] + points[:-1]) / 2
+    assert np.all(10 - np.hypot(middle[:, 0], middle[:, 1]) <= 0.01)
+    assert len(arc_points((0, 0), 10, 0, 90, tolerance=0.001)) > len(points)
+
+
+def test_batched_polygons():
+    """Test many polygons in one call and rings of different size"""
+    widths = np.array([1.0, 2.0, 3.0])
+    vertices = np.zeros((3, 4, 2))
+    vertices[:, 1, 0] = vertices[:, 2, 0] = widths
+    vertices[:, 2, 1] = vertices[:, 3, 1] = 2.0
+    props = polygon_properties(vertices)
+    assert np.allclose(props.area, 2 * widths)
+    assert np.allclose(props.Iyg, 2 * widths**3 / 12)
+
+    moments = ring_moments([RECTANGLE, [(0, 0), (1, 0), (0, 1)]])
+    assert np.allclose(moments[:, 0], [4, 0.5])
+    with pytest.raises(ValueError):
+        ring_moments([[(0, 0), (1, 0)]])
+
+
+def test_polyline():
+    """Test a thin-walled T from its centre line"""
+    props = polyline_properties([(0, 0), (0, 10)], 1.0)
+    assert isclose(props.area, 10)
+    assert isclose(props.Ixg, 1 * 10**3 / 12)
+    assert isclose(props.Iyg, 10 / 12)
+    props = polyline_properties([(-5, 0), (5, 0), (5, 4)], [1.0, 2.0])
+    assert isclose(props.area, 18)
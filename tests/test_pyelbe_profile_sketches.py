@@ -0,0 +1,73 @@
+"""tests of the batch rendering of profile sketches"""
+
+import re
+
+import numpy as np
+import pytest
+from matplotlib.collections import PatchCollection
+from matplotlib.colors import to_rgba
+
+from pylantir.pyelbe.profile_sketches import (
+    page_figure,
+    profile_sketch,
+    render_pdf,
+    render_png,
+)
+from pylantir.pyelbe.profiles import Fillet, Profile, Rect
+
+
+@pytest.fixture(name="profile")
+def fixture_profile():
+    """T profile with a fillet"""
+    return Profile(
+        [
+            Rect(width=40, height=3, pos_x=0, pos_y=0, fc="red"),
+            Rect(width=2, height=27, pos_x=19, pos_y=3, fc="green"),
+            Fillet(radius=3, pos_x=21, pos_y=3, fc="orange"),
+        ]
+    )
+
+
+def test_profile_sketch(profile):
+    """Test the sketch of a profile"""
+    sketch = profile_sketch(profile)
+    assert [kind for kind, _, _ in sketch] == ["rect", "rect", "fillet"]
+    assert sketch[1] == ("rect", (19, 3, 2, 27, 0), "green")
+
+
+def test_page_figure(profile):
+    """Test that a page is one patch collection coloured by the sub-elements"""
+    sketch = profile_sketch(profile)
+    figure = page_figure([sketch] * 5, titles=list("abcde"), ncols=3, nrows=2)
+    (axes,) = figure.axes
+    (collection,) = [
+        item for item in axes.collections if isinstance(item, PatchCollection)
+    ]
+    assert len(collection.get_paths()) == 15
+    colors = [to_rgba(color) for color in ("red", "green", "orange")]
+    assert np.allclose(collection.get_facecolors(), colors * 5)
+    # every sketch within its grid cell
+    for index, path in enumerate(collection.get_paths()[::3]):
+        row, col = divmod(index, 3)
+        x, y = path.vertices.T
+        assert np.all((col <= x) & (x <= col + 1))
+        assert np.all((1 - row <= y) & (y <= 2 - row))
+
+    with pytest.raises(ValueError):
+        page_figure([sketch] * 7, ncols=3, nrows=2)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_png(profile, tmp_path, workers):
+    """Test the PNG pages, in this process and in worker processes"""
+    paths = render_png(
+        [profile] * 7, tmp_path / "sheet", ncols=2, nrows=2, dpi=30, workers=workers
+    )
+    assert [path.name for path in paths] == [f"sheet_00{page}.png" for page in (1, 2)]
+    assert all(path.read_bytes().startswith(b"\x89PNG") for path in paths)
+
+
+def test_render_pdf(profile, tmp_path):
+    """Test the multi-page PDF"""
+    path = render_pdf([profile] * 9, tmp_path / "sheet.pdf", ncols=2, nrows=2)
+    assert len(re.findall(rb"/Type /Page\b(?!s)", path.read_bytes())) == 3
@@ -0,0 +1,63 @@
+"""tests of the thin-walled section engine"""
+
+from math import isclose
+
+import numpy as np
+import pytest
+
+from pylantir.pyelbe.hsb.hsb_profiles_batch import l_profile_thin_walled
+from pylantir.pyelbe.thin_walled import polyline_thin_walled, thin_walled_properties
+
+B, H, T = 40.0, 100.0, 2.0
+CHANNEL = [(B, H / 2), (0, H / 2), (0, -H / 2), (B, -H / 2)]
+
+
+def test_channel():
+    """Test a channel against the closed form values"""
+    props = polyline_thin_walled(CHANNEL, T)
+    assert isclose(props.area, (2 * B + H) * T)
+    assert isclose(props.J, (2 * B + H) * T**3 / 3)
+    assert isclose(props.x_sc, -3 * B**2 / (H + 6 * B))
+    assert isclose(props.y_sc, 0, abs_tol=1e-9)
+    assert isclose(props.Cw, T * B**3 * H**2 / 12 * (3 * B + 2 * H) / (6 * B + H))
+
+
+def test_i_section():
+    """Test a branched midline, the I section"""
+    nodes = [(-B / 2, H / 2), (0, H / 2), (B / 2, H / 2)]
+    nodes += [(x, -y) for x, y in nodes]
+    segments = [(0, 1), (1, 2), (1, 4), (3, 4), (4, 5)]
+    props = thin_walled_properties(nodes, segments, T)
+    assert isclose(props.x_sc, 0, abs_tol=1e-9)
+    assert isclose(props.y_sc, 0, abs_tol=1e-9)
+    assert isclose(props.Cw, T * B**3 * H**2 / 24)
+
+    with pytest.raises(ValueError):
+        thin_walled_properties(nodes, segments + [(0, 3)], T)
+    with pytest.raises(ValueError):
+        thin_walled_properties(nodes, [(0, 1), (1, 2), (3, 4), (4, 5), (3, 5)], T)
+
+
+def test_rotated_batch():
+    """Test that the shear centre moves with the section over a batch of rotations"""
+    angles = np.radians([0, 30, 135])
+    cos, sin = np.cos(angles), np.sin(angles)
+    rotations = np.stack([np.stack([cos, -sin], -1), np.stack([sin, cos], -1)], -2)
+    points = np.einsum("kij,nj->kni", rotations, np.array(CHANNEL)) + [5, 7]
+    props = polyline_thin_walled(points, T)
+    reference = polyline_thin_walled(CHANNEL, T)
+    shear_centre = rotations @ [reference.x_sc, reference.y_sc] + [5, 7]
+    assert props.Cw.shape == (3,)
+    assert np.allclose(np.column_stack([props.x_sc, props.y_sc]), shear_centre)
+    assert np.allclose(props.Cw, reference.Cw)
+
+
+def test_l_profile_thin_walled():
+    """Test that the shear centre of L profiles is in the corner of the midline"""
+    props = l_profile_thin_walled([60, 80], 40, 2.0, [3.0, 1.0])
+    assert np.allclose(props.x_sc, [1.5, 0.5])
+    assert np.allclose(props.y_sc, 1.0)
+    assert np.allclose(props.Cw, 0, atol=1e-6)
+    assert np.allclose(props.J, [58.5 * 8 / 3 + 39 * 27 / 3, 79.5 * 8 / 3 + 39 / 3])
+    single = l_profile_thin_walled(60, 40, [1.0, 2.0])
+    assert single.J.shape == (2,)